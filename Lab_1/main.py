@@ -1,54 +1,112 @@
+#!/usr/bin/env python3
+"""
+Решение биквадратных уравнений вида a*x^4 + b*x^2 + c = 0
+
+Вся математика находится в EquationSolver (Lab_4/main.py), этот файл
+только читает коэффициенты и выводит результат. За один запуск можно
+решить несколько уравнений:
+
+    python main.py                  # коэффициенты вводятся с клавиатуры
+    python main.py 1 -5 4           # одно уравнение
+    python main.py 1 -5 4 1 0 -9    # несколько уравнений
+    python main.py - < coeffs.txt   # тройки коэффициентов из stdin
+"""
+
+import os
 import sys
-import math
+
+# Корень репозитория нужен для импорта Lab_4 при запуске файла напрямую
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from Lab_4.main import EquationSolver  # noqa: E402
+
+# Начиная с этого количества уравнений они решаются пакетом через NumPy
+BATCH_THRESHOLD = 64
+
 
 def get_coef(index, prompt):
-    try:
-        coef_str = sys.argv[index]
-    except:
-        print(prompt)
-        coef_str = input()
-    coef = float(coef_str)
-    return coef
+    return EquationSolver.get_coef(index, prompt)
+
+
+def parse_triples(values):
+    """Группирует числа по три коэффициента"""
+    numbers = [float(value) for value in values]
+    if len(numbers) % 3 != 0:
+        raise ValueError("Количество коэффициентов должно быть кратно трем")
+    return [tuple(numbers[i:i + 3]) for i in range(0, len(numbers), 3)]
+
+
+def solve_one(a, b, c):
+    """Решает одно уравнение и возвращает текст решения"""
+    roots = EquationSolver.solve_biquadratic(a, b, c)
+    D = EquationSolver.calculate_discriminant(a, b, c)
+    return EquationSolver.format_solution(roots, D)
+
+
+def solve_many(triples):
+    """
+    Решает несколько уравнений
+
+    Большие наборы решаются одним вызовом solve_biquadratic_batch,
+    маленькие - поштучно, чтобы не загружать NumPy ради пары уравнений.
+
+    Returns:
+        Список текстов решений в порядке уравнений
+    """
+    error = "Коэффициент а=0, это не квадратное уравнение"
+    solutions = [error] * len(triples)
+    valid = [i for i, (a, _, _) in enumerate(triples) if a != 0]
+
+    if len(valid) >= BATCH_THRESHOLD:
+        try:
+            a, b, c = zip(*(triples[i] for i in valid))
+            roots, counts = EquationSolver.solve_biquadratic_batch(a, b, c)
+        except ImportError:
+            pass
+        else:
+            for i, row, count in zip(valid, roots.tolist(), counts.tolist()):
+                D = EquationSolver.calculate_discriminant(*triples[i])
+                solutions[i] = EquationSolver.format_solution(row[:count], D)
+            return solutions
+
+    for i in valid:
+        solutions[i] = solve_one(*triples[i])
+    return solutions
+
 
 def main():
-    a = get_coef(1, "Введите A: ")
-    b = get_coef(2, "Введите B: ")
-    c = get_coef(3, "Введите C: ")
-
-    if a == 0:
-        print("Коэффициент а=0, это не квадратное уравнение")
-        sys.exit()
-
-    D = b*b - 4*a*c
-
-    if D < 0.0:
-        print("Нет корней (дискриминант отрицательный)")
-    elif D == 0.0:
-        t0 = -b / (2*a)
-        if t0 > 0.0:
-            print("Корень уравнения:", math.sqrt(t0))
-            print("Корень уравнения:", -math.sqrt(t0))
-        elif t0 == 0.0:
-            print("Корень уравнения: 0")
+    args = sys.argv[1:]
+
+    try:
+        if args == ["-"]:
+            triples = parse_triples(sys.stdin.read().replace(",", " ").split())
+        elif len(args) > 3:
+            triples = parse_triples(args)
         else:
-            print("Нет действительных корней")
-    else:
-        t1 = (-b + math.sqrt(D)) / (2*a)
-        if t1 > 0.0:
-            print("Корень уравнения:", math.sqrt(t1))
-            print("Корень уравнения:", -math.sqrt(t1))
-        elif t1 == 0.0:
-            print("Корень уравнения: 0")
-
-        t2 = (-b - math.sqrt(D)) / (2*a)
-        if t2 > 0.0:
-            print("Корень уравнения:", math.sqrt(t2))
-            print("Корень уравнения:", -math.sqrt(t2))
-        elif t2 == 0.0:
-            print("Корень уравнения: 0")
-
-        if t1 < 0.0 and t2 < 0.0:
-            print("Нет действительных корней")
+            a = get_coef(1, "Введите A: ")
+            b = get_coef(2, "Введите B: ")
+            c = get_coef(3, "Введите C: ")
+            triples = [(a, b, c)]
+    except ValueError as e:
+        print(str(e))
+        sys.exit(1)
+
+    if len(triples) == 1:
+        try:
+            print(solve_one(*triples[0]))
+        except ValueError as e:
+            print(str(e))
+            sys.exit(1)
+        return
+
+    lines = []
+    for i, ((a, b, c), solution) in enumerate(zip(triples, solve_many(triples)), 1):
+        lines.append(f"Уравнение {i}: A={a:g}, B={b:g}, C={c:g}")
+        lines.append(solution)
+    print("\n".join(lines))
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Бенчмарки пакета lab_python_oop
+
+Запуск:
+    python benchmark.py memory --count 10000000
+    python benchmark.py repr --count 1000 --repeat 100
+    python benchmark.py load --count 1000000
+    python benchmark.py aggregate --count 10000000 --workers 4
+    python benchmark.py startup --max-ms 50
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from lab_python_oop.rectangle import Rectangle
+from lab_python_oop.circle import Circle
+from lab_python_oop.square import Square
+from lab_python_oop.compact import CompactRectangle, CompactCircle, CompactSquare
+from lab_python_oop.aggregate import aggregate
+from lab_python_oop.batch import FigureBatch
+from lab_python_oop.storage import load_batch, save_figures
+
+# Количество различных цветов в сгенерированной сцене
+COLOR_COUNT = 20
+
+
+def make_figures(count: int, rectangle, circle, square) -> list:
+    """
+    Создает count фигур заданными конструкторами
+
+    Название цвета собирается заново для каждой фигуры, как при чтении
+    данных из файла, поэтому одинаковые цвета не являются одним объектом.
+    """
+    figures = []
+    append = figures.append
+    for i in range(count):
+        color = "цвет_" + str(i % COLOR_COUNT)
+        kind = i % 3
+        if kind == 0:
+            append(rectangle(float(i % 100), 2.0, color))
+        elif kind == 1:
+            append(circle(float(i % 100), color))
+        else:
+            append(square(float(i % 100), color))
+    return figures
+
+
+def bytes_per_figure(count: int, rectangle, circle, square) -> float:
+    """Измеряет средний объем памяти на одну фигуру (включая ссылку в списке)"""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        figures = make_figures(count, rectangle, circle, square)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del figures
+    return (after - before) / count
+
+
+def run_memory(count: int) -> dict:
+    """
+    Сравнивает память обычных и компактных фигур
+
+    Returns:
+        Словарь с байтами на фигуру для каждого варианта
+    """
+    return {
+        "обычные": bytes_per_figure(count, Rectangle, Circle, Square),
+        "компактные": bytes_per_figure(count, CompactRectangle, CompactCircle, CompactSquare),
+    }
+
+
+def time_repr(figures: list, repeat: int) -> float:
+    """Измеряет среднее время одного вызова repr в наносекундах"""
+    start = time.perf_counter_ns()
+    for _ in range(repeat):
+        for figure in figures:
+            repr(figure)
+    return (time.perf_counter_ns() - start) / (repeat * len(figures))
+
+
+def run_repr(count: int, repeat: int) -> dict:
+    """
+    Сравнивает повторные вызовы repr без кэша и с кэшем
+
+    Каждая фигура выводится repeat раз, как при повторном логировании
+    одних и тех же объектов.
+
+    Returns:
+        Словарь с наносекундами на вызов для каждого варианта
+    """
+    figures = make_figures(count, Rectangle, Circle, Square)
+    results = {"без кэша": time_repr(figures, repeat)}
+
+    classes = (Rectangle, Circle)
+    for cls in classes:
+        cls.cache_enabled = True
+    try:
+        results["с кэшем"] = time_repr(figures, repeat)
+    finally:
+        for cls in classes:
+            cls.cache_enabled = False
+    return results
+
+
+def _figure_to_dict(figure) -> dict:
+    if isinstance(figure, Circle):
+        return {"kind": "circle", "radius": figure.radius, "color": figure.color}
+    return {"kind": "rectangle", "width": figure.width, "height": figure.height, "color": figure.color}
+
+
+def _figure_from_dict(data: dict):
+    if data["kind"] == "circle":
+        return Circle(data["radius"], data["color"])
+    return Rectangle(data["width"], data["height"], data["color"])
+
+
+def run_load(count: int) -> dict:
+    """
+    Сравнивает загрузку набора фигур из JSON и из двоичного файла
+
+    Returns:
+        Словарь со временем в миллисекундах и размерами файлов
+    """
+    figures = make_figures(count, Rectangle, Circle, Square)
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "scene.json")
+        binary_path = os.path.join(directory, "scene.fig")
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump([_figure_to_dict(figure) for figure in figures], f)
+        save_figures(figures, binary_path)
+        del figures
+
+        start = time.perf_counter()
+        with open(json_path, encoding="utf-8") as f:
+            loaded = [_figure_from_dict(data) for data in json.load(f)]
+        json_ms = (time.perf_counter() - start) * 1000
+        del loaded
+
+        start = time.perf_counter()
+        batch = load_batch(binary_path)
+        open_ms = (time.perf_counter() - start) * 1000
+        start = time.perf_counter()
+        batch.total_area()
+        area_ms = (time.perf_counter() - start) * 1000
+        batch.close()
+
+        return {
+            "json_mb": os.path.getsize(json_path) / 2 ** 20,
+            "binary_mb": os.path.getsize(binary_path) / 2 ** 20,
+            "json_ms": json_ms,
+            "open_ms": open_ms,
+            "area_ms": area_ms,
+        }
+
+
+def run_aggregate(count: int, workers: int) -> dict:
+    """
+    Измеряет подсчет площадей набора в одном процессе и пулом процессов
+
+    Returns:
+        Словарь со временем в миллисекундах для каждого количества процессов
+    """
+    batch = FigureBatch()
+    for i in range(count):
+        color = "цвет_" + str(i % COLOR_COUNT)
+        kind = i % 3
+        if kind == 0:
+            batch.add_rectangle(float(i % 100), 2.0, color)
+        elif kind == 1:
+            batch.add_circle(float(i % 100), color)
+        else:
+            batch.add_square(float(i % 100), color)
+
+    timings = {}
+    results = []
+    for processes in sorted({1, workers}):
+        start = time.perf_counter()
+        results.append(aggregate(batch, workers=processes))
+        timings[processes] = (time.perf_counter() - start) * 1000
+    if any(result != results[0] for result in results):
+        raise RuntimeError("Результат зависит от количества процессов")
+    return timings
+
+
+# Модули, время импорта которых проверяет startup
+STARTUP_MODULES = ("lab_python_oop", "main")
+
+# Тяжелые зависимости, которые не должны загружаться при импорте
+HEAVY_MODULES = ("numpy", "colorama")
+
+
+def import_times(module: str) -> dict:
+    """
+    Импортирует модуль в отдельном интерпретаторе с -X importtime
+
+    Returns:
+        Словарь имя модуля -> накопленное время импорта в микросекундах
+        для всех модулей, загруженных этим импортом
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def run_startup(repeat: int) -> dict:
+    """
+    Измеряет время импорта модулей STARTUP_MODULES
+
+    Returns:
+        Словарь модуль -> (лучшее время в миллисекундах, загруженные тяжелые модули)
+    """
+    results = {}
+    for module in STARTUP_MODULES:
+        runs = [import_times(module) for _ in range(repeat)]
+        best = min(run[module] for run in runs) / 1000
+        heavy = [name for name in HEAVY_MODULES if name in runs[0]]
+        results[module] = (best, heavy)
+    return results
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    """Разбирает аргументы командной строки"""
+    parser = argparse.ArgumentParser(description="Бенчмарки lab_python_oop")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    memory = commands.add_parser("memory", help="Память на одну фигуру")
+    memory.add_argument("--count", type=int, default=10_000_000, help="Количество фигур")
+
+    repr_ = commands.add_parser("repr", help="Повторные вызовы repr")
+    repr_.add_argument("--count", type=int, default=1000, help="Количество фигур")
+    repr_.add_argument("--repeat", type=int, default=100, help="Сколько раз выводится каждая фигура")
+
+    load = commands.add_parser("load", help="Загрузка набора фигур из JSON и двоичного файла")
+    load.add_argument("--count", type=int, default=1_000_000, help="Количество фигур")
+
+    aggregate_ = commands.add_parser("aggregate", help="Площади по видам и цветам")
+    aggregate_.add_argument("--count", type=int, default=10_000_000, help="Количество фигур")
+    aggregate_.add_argument("--workers", type=int, default=os.cpu_count(), help="Количество процессов")
+
+    startup = commands.add_parser("startup", help="Время импорта по -X importtime")
+    startup.add_argument("--repeat", type=int, default=5, help="Количество запусков интерпретатора")
+    startup.add_argument("--max-ms", type=float, help="Завершиться с ошибкой, если импорт дольше")
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None):
+    """Точка входа бенчмарков"""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.command == "memory":
+        print(f"Память на фигуру при {args.count:,} фигурах:")
+        for name, value in run_memory(args.count).items():
+            print(f"  {name}: {value:.1f} байт")
+    elif args.command == "repr":
+        print(f"repr {args.count:,} фигур по {args.repeat} раз:")
+        for name, value in run_repr(args.count, args.repeat).items():
+            print(f"  {name}: {value:,.0f} нс на вызов")
+    elif args.command == "load":
+        stats = run_load(args.count)
+        print(f"Загрузка {args.count:,} фигур:")
+        print(f"  JSON ({stats['json_mb']:.1f} МБ): {stats['json_ms']:.1f} мс")
+        print(f"  двоичный файл ({stats['binary_mb']:.1f} МБ): открытие {stats['open_ms']:.2f} мс, "
+              f"площадь всех фигур {stats['area_ms']:.1f} мс")
+    elif args.command == "aggregate":
+        print(f"Площади {args.count:,} фигур по видам и цветам:")
+        for processes, value in run_aggregate(args.count, args.workers).items():
+            print(f"  процессов {processes}: {value:.1f} мс")
+    elif args.command == "startup":
+        print(f"Время импорта (лучшее из {args.repeat}):")
+        failed = False
+        for module, (best, heavy) in run_startup(args.repeat).items():
+            loaded = f", загружены {', '.join(heavy)}" if heavy else ""
+            print(f"  {module}: {best:.1f} мс{loaded}")
+            failed = failed or bool(heavy) or (args.max_ms is not None and best > args.max_ms)
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,45 @@
 """
 Пакет для работы с геометрическими фигурами
+
+Имена пакета загружаются при первом обращении: import lab_python_oop
+не импортирует ни одного модуля фигур, а lab_python_oop.Circle
+загружает только circle.py и его зависимости.
 """
 
-__all__ = ['Figure', 'FigureColor', 'Rectangle', 'Circle', 'Square']
+import importlib
+
+# Имя -> модуль пакета, в котором оно определено
+_EXPORTS = {
+    'Figure': 'figure',
+    'FigureColor': 'color',
+    'ColorRegistry': 'color',
+    'COLOR_REGISTRY': 'color',
+    'Rectangle': 'rectangle',
+    'Circle': 'circle',
+    'Square': 'square',
+    'Triangle': 'shapes',
+    'Ellipse': 'shapes',
+    'RegularPolygon': 'shapes',
+    'register_shape': 'shapes',
+    'FigureBatch': 'batch',
+    'FigureIndex': 'index',
+    'load_batch': 'storage',
+    'save_batch': 'storage',
+    'dump_figures': 'render',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    # Следующие обращения идут мимо __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
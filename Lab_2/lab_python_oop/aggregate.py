@@ -0,0 +1,161 @@
+"""
+Параллельный подсчет площадей наборов фигур
+
+Набор разбивается на разделы фиксированного размера. Для каждого
+раздела считаются суммы площадей: общая, по видам и по цветам. Разделы
+обрабатываются пулом процессов, частичные суммы объединяются в порядке
+разделов через math.fsum.
+
+Границы разделов не зависят от количества процессов, а каждый раздел
+суммируется одинаково (попарно через NumPy или точно через math.fsum),
+поэтому результат не меняется при изменении workers.
+"""
+
+import math
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+
+from .batch import FigureBatch, _import_numpy
+from .shapes import SHAPES
+
+# Количество фигур в одном разделе
+PARTITION_SIZE = 1 << 16
+
+# Столбцы, передаваемые процессу: (имя атрибута, код типа array)
+_COLUMNS = (('kinds', 'B'), ('dim1', 'd'), ('dim2', 'd'), ('color_ids', 'I'))
+
+
+def _bucket_sums(values, buckets, count: int) -> tuple:
+    """
+    Суммирует значения по номерам групп
+
+    Каждая группа суммируется отдельно: попарным суммированием NumPy
+    после устойчивой сортировки или math.fsum без NumPy.
+
+    Returns:
+        Кортеж (суммы, количества элементов) по номерам групп
+    """
+    np = _import_numpy()
+    if np is not None:
+        values = np.asarray(values)
+        buckets = np.asarray(buckets)
+        order = np.argsort(buckets, kind='stable')
+        values = values[order]
+        bounds = np.searchsorted(buckets[order], np.arange(count + 1))
+        sums = [float(values[start:end].sum()) for start, end in zip(bounds[:-1], bounds[1:])]
+        return sums, np.diff(bounds).tolist()
+
+    groups = [[] for _ in range(count)]
+    for bucket, value in zip(buckets, values):
+        groups[bucket].append(value)
+    return [math.fsum(group) for group in groups], [len(group) for group in groups]
+
+
+def reduce_partition(columns: tuple, kind_count: int, color_count: int) -> tuple:
+    """
+    Считает суммы площадей одного раздела
+
+    Args:
+        columns: Байты столбцов kinds, dim1, dim2, color_ids раздела
+        kind_count: Количество кодов видов фигур
+        color_count: Количество цветов в реестре набора
+
+    Returns:
+        Кортеж (общая площадь, (суммы, количества) по кодам видов,
+        (суммы, количества) по номерам цветов)
+    """
+    batch = FigureBatch()
+    for (name, typecode), data in zip(_COLUMNS, columns):
+        column = array(typecode)
+        column.frombytes(data)
+        setattr(batch, name, column)
+
+    areas = batch.areas()
+    np = _import_numpy()
+    if np is not None:
+        areas = np.frombuffer(areas, dtype=np.float64)
+        kinds = np.frombuffer(batch.kinds, dtype=np.uint8)
+        color_ids = np.frombuffer(batch.color_ids, dtype=np.uint32)
+        total = float(areas.sum())
+    else:
+        kinds, color_ids = batch.kinds, batch.color_ids
+        total = math.fsum(areas)
+
+    return (
+        total,
+        _bucket_sums(areas, kinds, kind_count),
+        _bucket_sums(areas, color_ids, color_count),
+    )
+
+
+def _merge_buckets(partials: list, names: dict) -> dict:
+    """Объединяет суммы групп всех разделов, пропуская пустые группы"""
+    merged = {}
+    for bucket, name in sorted(names.items()):
+        if any(counts[bucket] for _, counts in partials):
+            merged[name] = math.fsum(sums[bucket] for sums, _ in partials)
+    return merged
+
+
+def iter_partitions(batch: FigureBatch, partition_size: int = PARTITION_SIZE):
+    """Перебирает разделы набора как кортежи байтов столбцов"""
+    columns = [getattr(batch, name) for name, _ in _COLUMNS]
+    for start in range(0, len(batch), partition_size):
+        end = start + partition_size
+        yield tuple(column[start:end].tobytes() for column in columns)
+
+
+def _reduce_parallel(partitions, kind_count: int, color_count: int, workers: int) -> list:
+    """
+    Обрабатывает разделы пулом процессов
+
+    В обработке одновременно не больше 2 * workers разделов, чтобы не
+    копировать весь набор в очередь пула. Результаты возвращаются в
+    порядке разделов.
+    """
+    results = []
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for columns in partitions:
+            if len(pending) >= 2 * workers:
+                results.append(pending.popleft().result())
+            pending.append(executor.submit(reduce_partition, columns, kind_count, color_count))
+        results.extend(future.result() for future in pending)
+    return results
+
+
+def aggregate(figures, workers: int = 1, partition_size: int = PARTITION_SIZE) -> dict:
+    """
+    Считает общую площадь и площади по видам и цветам
+
+    Args:
+        figures: FigureBatch (в том числе загруженный из файла) или
+                 последовательность объектов Figure
+        workers: Количество процессов (1 - расчет в текущем процессе)
+        partition_size: Количество фигур в разделе
+
+    Returns:
+        Словарь с ключами total, by_kind (название вида -> площадь)
+        и by_color (название цвета -> площадь)
+    """
+    batch = figures if isinstance(figures, FigureBatch) else FigureBatch.from_figures(figures)
+    kind_count = max(SHAPES) + 1
+    color_count = len(batch.registry)
+    partitions = iter_partitions(batch, partition_size)
+
+    if workers > 1:
+        results = _reduce_parallel(partitions, kind_count, color_count, workers)
+    else:
+        results = [reduce_partition(columns, kind_count, color_count) for columns in partitions]
+
+    # Объединение в порядке разделов, не зависящее от порядка завершения процессов
+    names = {kind: shape.name for kind, shape in SHAPES.items()}
+    by_kind = _merge_buckets([result[1] for result in results], names)
+    by_color = _merge_buckets([result[2] for result in results], dict(enumerate(batch.colors)))
+
+    return {
+        "total": math.fsum(result[0] for result in results),
+        "by_kind": by_kind,
+        "by_color": by_color,
+    }
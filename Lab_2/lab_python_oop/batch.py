@@ -0,0 +1,380 @@
+import importlib.util
+import math
+import operator
+from array import array
+
+from .color import ColorRegistry
+from .figure import Figure
+from .rectangle import Rectangle
+from .circle import Circle
+from .square import Square
+from .shapes import (  # noqa: F401 (коды видов доступны и из batch)
+    SHAPES, KIND_RECTANGLE, KIND_SQUARE, KIND_CIRCLE, ShapeFigure, shape_type,
+)
+
+# NumPy загружается при первом пакетном вычислении, а не при импорте пакета
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+# Начиная с этого количества фигур площади считаются через NumPy
+NUMPY_MIN_SIZE = 64
+
+
+def _import_numpy():
+    """Возвращает модуль numpy или None, если NumPy не установлен"""
+    if not NUMPY_AVAILABLE:
+        return None
+    import numpy
+    return numpy
+
+
+def _shape(kind: int):
+    shape = SHAPES.get(kind)
+    if shape is None:
+        raise ValueError(f"Неизвестный код вида фигуры: {kind}")
+    return shape
+
+
+class FigureBatch:
+    """
+    Столбцовое хранилище фигур
+
+    Вид фигуры, ее размеры и номер цвета хранятся в непрерывных
+    типизированных массивах, а не в отдельных объектах. Площади всех
+    фигур вычисляются ядрами видов из реестра shapes, по одному вызову
+    на каждый вид.
+
+    Столбцы:
+        kinds: код вида фигуры из реестра SHAPES
+        dim1: первый параметр вида (ширина, сторона, радиус, ...)
+        dim2: второй параметр вида (для квадрата равен стороне,
+              для видов с одним параметром не используется)
+        color_ids: номер цвета в реестре цветов хранилища
+    """
+
+    def __init__(self, registry: ColorRegistry = None):
+        """
+        Инициализирует пустое хранилище
+
+        Args:
+            registry: Реестр цветов (по умолчанию у хранилища собственный реестр)
+        """
+        self.kinds = array('B')
+        self.dim1 = array('d')
+        self.dim2 = array('d')
+        self.color_ids = array('I')
+        self.registry = ColorRegistry() if registry is None else registry
+
+    @classmethod
+    def from_figures(cls, figures) -> 'FigureBatch':
+        """Создает хранилище из последовательности фигур"""
+        batch = cls()
+        batch.extend(figures)
+        return batch
+
+    @property
+    def colors(self) -> list:
+        """Названия цветов по номерам"""
+        return self.registry.names
+
+    def color_id(self, color: str) -> int:
+        """Возвращает номер цвета, добавляя цвет в реестр при необходимости"""
+        return self.registry.intern(color)
+
+    def _add(self, kind: int, dim1: float, dim2: float, color: str) -> int:
+        # Номер цвета первым: если реестр переполнен, столбцы не меняются
+        color_id = self.color_id(color)
+        self.kinds.append(kind)
+        self.dim1.append(dim1)
+        self.dim2.append(dim2)
+        self.color_ids.append(color_id)
+        return len(self.kinds) - 1
+
+    def add_rectangle(self, width: float, height: float, color: str) -> int:
+        """Добавляет прямоугольник и возвращает его номер"""
+        return self._add(KIND_RECTANGLE, width, height, color)
+
+    def add_square(self, side: float, color: str) -> int:
+        """Добавляет квадрат и возвращает его номер"""
+        return self._add(KIND_SQUARE, side, side, color)
+
+    def add_circle(self, radius: float, color: str) -> int:
+        """Добавляет круг и возвращает его номер"""
+        return self._add(KIND_CIRCLE, radius, 0.0, color)
+
+    def add(self, key, *args) -> int:
+        """
+        Добавляет фигуру вида из реестра и возвращает ее номер
+
+        Args:
+            key: Короткое имя или код вида ('triangle', KIND_CIRCLE, ...)
+            args: Значения параметров по схеме вида и цвет последним аргументом
+        """
+        shape = shape_type(key)
+        *params, color = args
+        if shape.kind == KIND_SQUARE:
+            return self.add_square(*params, color)
+        return self._add(shape.kind, *shape.dims(params), color)
+
+    def append(self, figure) -> int:
+        """Добавляет объект фигуры и возвращает его номер"""
+        if isinstance(figure, ShapeFigure):
+            return self._add(figure.shape.kind, *figure.dims(), figure.color)
+        if isinstance(figure, Square):
+            return self.add_square(figure.width, figure.color)
+        if isinstance(figure, Rectangle):
+            return self.add_rectangle(figure.width, figure.height, figure.color)
+        if isinstance(figure, Circle):
+            return self.add_circle(figure.radius, figure.color)
+        raise TypeError(f"Неподдерживаемый вид фигуры: {type(figure).__name__}")
+
+    def extend(self, figures):
+        """Добавляет несколько фигур"""
+        for figure in figures:
+            self.append(figure)
+
+    def areas(self) -> array:
+        """Вычисляет площади всех фигур, вызывая ядро каждого вида один раз"""
+        n = len(self.kinds)
+        result = array('d', bytes(8 * n))
+
+        np = _import_numpy() if n >= NUMPY_MIN_SIZE else None
+        if np is not None:
+            kinds = np.frombuffer(self.kinds, dtype=np.uint8)
+            dim1 = np.frombuffer(self.dim1, dtype=np.float64)
+            dim2 = np.frombuffer(self.dim2, dtype=np.float64)
+            out = np.frombuffer(result, dtype=np.float64)
+            present = np.flatnonzero(np.bincount(kinds, minlength=256)).tolist()
+            for kind in present:
+                area = _shape(kind).area
+                if len(present) == 1:
+                    out[:] = area(dim1, dim2, np)
+                else:
+                    mask = kinds == kind
+                    out[mask] = area(dim1[mask], dim2[mask], np)
+            return result
+
+        kernels = {}
+        for i, (kind, dim1, dim2) in enumerate(zip(self.kinds, self.dim1, self.dim2)):
+            area = kernels.get(kind)
+            if area is None:
+                area = kernels[kind] = _shape(kind).area
+            result[i] = area(dim1, dim2, math)
+        return result
+
+    def total_area(self) -> float:
+        """Суммарная площадь всех фигур"""
+        return math.fsum(self.areas())
+
+    def area_by_color(self) -> dict:
+        """
+        Суммарная площадь фигур каждого цвета
+
+        Площади складываются в массив по номерам цветов, названия
+        подставляются только в итоговый словарь.
+
+        Returns:
+            Словарь название цвета -> суммарная площадь
+        """
+        areas = self.areas()
+        np = _import_numpy() if len(areas) >= NUMPY_MIN_SIZE else None
+        if np is None:
+            return self.registry.group_sum(self.color_ids, areas)
+
+        color_ids = np.frombuffer(self.color_ids, dtype=np.uint32)
+        sums = np.bincount(color_ids, weights=np.frombuffer(areas, dtype=np.float64),
+                           minlength=len(self.registry))
+        present = np.bincount(color_ids, minlength=len(self.registry))
+        return {name: total for name, total, count in zip(self.colors, sums.tolist(), present.tolist())
+                if count}
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def __getitem__(self, index: int):
+        """Возвращает легковесное представление фигуры с номером index"""
+        if index < 0:
+            index += len(self.kinds)
+        if not 0 <= index < len(self.kinds):
+            raise IndexError("Номер фигуры вне диапазона")
+        return view_class(self.kinds[index])(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.kinds)):
+            yield view_class(self.kinds[index])(self, index)
+
+    def __repr__(self) -> str:
+        return f"FigureBatch({len(self)} фигур, {len(self.colors)} цветов)"
+
+
+class _BatchView:
+    """
+    Общая часть представлений фигур из FigureBatch
+
+    Представления наследуют Figure, а не Rectangle, Circle и т.д.: у этих
+    классов есть __dict__ (кэш, слабые ссылки, атрибуты экземпляра), и он
+    перешел бы каждому представлению. Методы берутся у класса фигуры, а
+    регистрация виртуальным подклассом сохраняет проверки isinstance,
+    как у компактных фигур. Представление хранит только два слота.
+    """
+
+    __slots__ = ()
+
+    # Данные живут в хранилище и меняются в обход представления, кэшировать нельзя
+    cache_enabled = False
+
+    def __init__(self, batch: FigureBatch, index: int):
+        self._batch = batch
+        self._index = index
+
+    def __reduce__(self):
+        # Представление сохраняется вместе с хранилищем и остается его представлением
+        return operator.getitem, (self._batch, self._index)
+
+    @property
+    def _color_registry(self) -> ColorRegistry:
+        return self._batch.registry
+
+    @property
+    def _color_id(self) -> int:
+        return self._batch.color_ids[self._index]
+
+    @_color_id.setter
+    def _color_id(self, value: int):
+        self._batch.color_ids[self._index] = value
+
+    def _color_value(self, name: str) -> int:
+        # В столбце хранилища может быть только номер цвета
+        return self._batch.color_id(name)
+
+
+class RectangleView(_BatchView, Figure):
+    """Прямоугольник, хранящийся в FigureBatch"""
+
+    __slots__ = ('_batch', '_index')
+
+    name = Rectangle.name
+    square = Rectangle.square
+    __repr__ = Rectangle.__repr__
+
+    @property
+    def width(self) -> float:
+        return self._batch.dim1[self._index]
+
+    @width.setter
+    def width(self, value: float):
+        self._batch.dim1[self._index] = value
+
+    @property
+    def height(self) -> float:
+        return self._batch.dim2[self._index]
+
+    @height.setter
+    def height(self, value: float):
+        self._batch.dim2[self._index] = value
+
+
+class SquareView(_BatchView, Figure):
+    """Квадрат, хранящийся в FigureBatch"""
+
+    __slots__ = ('_batch', '_index')
+
+    name = Square.name
+    square = Square.square
+    __repr__ = Square.__repr__
+
+    @property
+    def width(self) -> float:
+        return self._batch.dim1[self._index]
+
+    @width.setter
+    def width(self, value: float):
+        self._batch.dim1[self._index] = value
+        self._batch.dim2[self._index] = value
+
+    height = width
+
+
+class CircleView(_BatchView, Figure):
+    """Круг, хранящийся в FigureBatch"""
+
+    __slots__ = ('_batch', '_index')
+
+    name = Circle.name
+    square = Circle.square
+    __repr__ = Circle.__repr__
+
+    @property
+    def radius(self) -> float:
+        return self._batch.dim1[self._index]
+
+    @radius.setter
+    def radius(self, value: float):
+        self._batch.dim1[self._index] = value
+
+
+Rectangle.register(RectangleView)
+Square.register(SquareView)
+Circle.register(CircleView)
+
+
+def _dim_property(column: str, doc: str, shape=None, index: int = 0) -> property:
+    """
+    Свойство параметра представления по столбцу хранилища
+
+    Для видов с проверкой параметров (shape.validate) значение проверяется
+    при записи и приводится к своему типу при чтении (6.0 -> 6).
+    """
+    def getter(self):
+        if shape is None or shape.validate is None:
+            return getattr(self._batch, column)[self._index]
+        return shape.values(_stored_params(self, shape))[index]
+
+    def setter(self, value):
+        if shape is not None and shape.validate is not None:
+            params = list(_stored_params(self, shape))
+            params[index] = value
+            value = shape.values(params)[index]
+        getattr(self._batch, column)[self._index] = value
+
+    return property(getter, setter, doc=doc)
+
+
+def _stored_params(view, shape) -> tuple:
+    # Значения параметров представления в столбцах хранилища
+    batch, index = view._batch, view._index
+    return (batch.dim1[index], batch.dim2[index])[:len(shape.params)]
+
+
+def _make_view_class(shape) -> type:
+    """Создает класс представления для вида фигуры из реестра"""
+    namespace = {
+        '__slots__': ('_batch', '_index'),
+        '__doc__': f"{shape.name}, хранящийся в FigureBatch",
+        'shape': shape,
+        'name': shape.name,
+        'dims': ShapeFigure.dims,
+        'square': ShapeFigure.square,
+        '__repr__': ShapeFigure.__repr__,
+    }
+    for index, ((attr, label), column) in enumerate(zip(shape.params, ('dim1', 'dim2'))):
+        namespace[attr] = _dim_property(column, label, shape, index)
+    cls = type(shape.figure_class.__name__ + 'View', (_BatchView, Figure), namespace)
+    shape.figure_class.register(cls)
+    return cls
+
+
+# Класс представления для каждого кода вида фигуры; для видов из реестра
+# без готового представления класс создается при первом обращении
+_VIEW_CLASSES = {
+    KIND_RECTANGLE: RectangleView,
+    KIND_SQUARE: SquareView,
+    KIND_CIRCLE: CircleView,
+}
+
+
+def view_class(kind: int) -> type:
+    """Возвращает класс представления для кода вида фигуры"""
+    cls = _VIEW_CLASSES.get(kind)
+    if cls is None:
+        cls = _VIEW_CLASSES[kind] = _make_view_class(_shape(kind))
+    return cls
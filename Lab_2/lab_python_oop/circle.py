@@ -1,6 +1,5 @@
 import math
-from .figure import Figure
-from .color import FigureColor
+from .figure import Figure, cached_result
 
 
 class Circle(Figure):
@@ -16,17 +15,29 @@ class Circle(Figure):
             radius: Радиус круга
             color: Цвет круга
         """
-        self.radius = radius
-        self.color_figure = FigureColor(color)
+        self._radius = radius
+        self._color_id = self._color_value(color)
 
+    @property
+    def radius(self) -> float:
+        """Радиус круга"""
+        return self._radius
+
+    @radius.setter
+    def radius(self, value: float):
+        self._radius = value
+        self._changed()
+
+    @cached_result
     def square(self) -> float:
         """Вычисляет площадь круга"""
         return math.pi * (self.radius ** 2)
 
+    @cached_result
     def __repr__(self) -> str:
         return (
             f"{self.get_name()}:\n"
             f"  Радиус: {self.radius}\n"
-            f"  Цвет: {self.color_figure.color}\n"
+            f"  Цвет: {self.color}\n"
             f"  Площадь: {self.square():.2f}"
         )
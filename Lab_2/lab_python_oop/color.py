@@ -1,6 +1,14 @@
+import sys
+
+# Наибольшее количество цветов в общем реестре COLOR_REGISTRY
+MAX_SHARED_COLORS = 1 << 16
+
+
 class FigureColor:
     """Класс для описания цвета геометрической фигуры"""
 
+    __slots__ = ('_color',)
+
     def __init__(self, color: str):
         """
         Инициализирует цвет фигуры
@@ -21,4 +29,137 @@ class FigureColor:
         self._color = value
 
     def __repr__(self) -> str:
-        return f"FigureColor('{self._color}')"
+        return f"FigureColor('{self.color}')"
+
+
+class SharedFigureColor(FigureColor):
+    """Общий неизменяемый цвет, один объект на каждое название цвета"""
+
+    __slots__ = ()
+
+    @property
+    def color(self) -> str:
+        """Возвращает цвет фигуры"""
+        return self._color
+
+    @color.setter
+    def color(self, value: str):
+        raise AttributeError("Общий цвет нельзя изменить, создайте фигуре новый цвет")
+
+
+class ColorRegistry:
+    """
+    Реестр цветов
+
+    Каждому названию цвета выдается небольшой целый номер и один общий
+    объект SharedFigureColor. Фигуры хранят только номер, поэтому
+    группировка по цвету сводится к сложению в массиве по номерам.
+
+    Номера не освобождаются: на них ссылаются фигуры, и реестр не знает,
+    какие номера еще используются. Поэтому размер реестра можно ограничить
+    max_colors: фигуры с цветами сверх ограничения хранят собственный
+    FigureColor (см. Figure), а intern выбрасывает ValueError. Для большого
+    количества разных цветов лучше FigureBatch: у каждого хранилища свой
+    реестр, и он удаляется вместе с хранилищем.
+    """
+
+    def __init__(self, names=(), max_colors: int = None):
+        """
+        Инициализирует реестр
+
+        Args:
+            names: Названия цветов, получающие номера 0, 1, 2, ... по порядку
+            max_colors: Наибольшее количество цветов (None - без ограничения)
+        """
+        self.max_colors = max_colors
+        self.names = []
+        self._ids = {}
+        self._shared = []
+        for name in names:
+            self.intern(name)
+
+    def intern(self, name: str) -> int:
+        """
+        Возвращает номер цвета, добавляя цвет в реестр при необходимости
+
+        Raises:
+            ValueError: Если новый цвет не помещается в max_colors
+        """
+        color_id = self.try_intern(name)
+        if color_id is None:
+            raise ValueError(f"В реестре уже {self.max_colors} цветов, "
+                             f"цвет '{name}' не может быть добавлен")
+        return color_id
+
+    def try_intern(self, name: str):
+        """Как intern, но возвращает None, если новый цвет не помещается в max_colors"""
+        color_id = self._ids.get(name)
+        if color_id is None:
+            if self.max_colors is not None and len(self.names) >= self.max_colors:
+                return None
+            name = sys.intern(name)
+            color_id = self._ids[name] = len(self.names)
+            self.names.append(name)
+            self._shared.append(SharedFigureColor(name))
+        return color_id
+
+    def name(self, color_id: int) -> str:
+        """Возвращает название цвета по номеру"""
+        return self.names[color_id]
+
+    def get(self, color_id: int) -> SharedFigureColor:
+        """Возвращает общий объект цвета по номеру"""
+        return self._shared[color_id]
+
+    def group_sum(self, color_ids, values) -> dict:
+        """Суммирует значения по цветам и возвращает словарь название -> сумма"""
+        sums = [0.0] * len(self.names)
+        seen = bytearray(len(self.names))
+        for color_id, value in zip(color_ids, values):
+            sums[color_id] += value
+            seen[color_id] = 1
+        return {self.names[i]: sums[i] for i in range(len(sums)) if seen[i]}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids
+
+    def __repr__(self) -> str:
+        return f"ColorRegistry({len(self)} цветов)"
+
+
+# Общий реестр цветов всех фигур (кроме фигур FigureBatch)
+COLOR_REGISTRY = ColorRegistry(max_colors=MAX_SHARED_COLORS)
+
+
+def shared_color(name: str) -> SharedFigureColor:
+    """Возвращает общий объект цвета для названия name (новый объект, если реестр заполнен)"""
+    color_id = COLOR_REGISTRY.try_intern(name)
+    return SharedFigureColor(name) if color_id is None else COLOR_REGISTRY.get(color_id)
+
+
+class BoundFigureColor(FigureColor):
+    """
+    Цвет, привязанный к фигуре
+
+    Не хранит название, а читает номер цвета фигуры. Присваивание
+    выполняется с копированием при записи: фигура получает номер нового
+    цвета, общий объект старого цвета и другие фигуры не меняются.
+    """
+
+    __slots__ = ('_owner',)
+
+    def __init__(self, owner):
+        self._owner = owner
+
+    @property
+    def color(self) -> str:
+        """Возвращает цвет фигуры"""
+        return self._owner.color
+
+    @color.setter
+    def color(self, value: str):
+        """Назначает фигуре другой цвет"""
+        self._owner.color = value
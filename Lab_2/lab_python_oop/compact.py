@@ -0,0 +1,95 @@
+from .figure import Figure
+from .color import SharedFigureColor, shared_color  # noqa: F401 (реэкспорт)
+from .rectangle import Rectangle
+from .circle import Circle
+from .square import Square
+
+
+class CompactRectangle(Figure):
+    """
+    Компактный прямоугольник
+
+    Хранит размеры и номер цвета в слотах без __dict__. Методы и название
+    берутся у Rectangle, а регистрация виртуальным подклассом сохраняет
+    проверки isinstance(figure, Rectangle).
+    """
+
+    __slots__ = ('width', 'height', '_color_id')
+
+    # Без __dict__ хранить кэш негде
+    cache_enabled = False
+
+    name = Rectangle.name
+    square = Rectangle.square
+    __repr__ = Rectangle.__repr__
+
+    def __init__(self, width: float, height: float, color: str):
+        """
+        Инициализирует прямоугольник
+
+        Args:
+            width: Ширина прямоугольника
+            height: Высота прямоугольника
+            color: Цвет прямоугольника
+        """
+        self.width = width
+        self.height = height
+        self._color_id = self._color_value(color)
+
+
+class CompactSquare(CompactRectangle):
+    """Компактный квадрат"""
+
+    __slots__ = ()
+
+    name = Square.name
+    __repr__ = Square.__repr__
+
+    def __init__(self, side: float, color: str):
+        """
+        Инициализирует квадрат
+
+        Args:
+            side: Длина стороны квадрата
+            color: Цвет квадрата
+        """
+        super().__init__(side, side, color)
+
+
+class CompactCircle(Figure):
+    """Компактный круг"""
+
+    __slots__ = ('radius', '_color_id')
+
+    cache_enabled = False
+
+    name = Circle.name
+    square = Circle.square
+    __repr__ = Circle.__repr__
+
+    def __init__(self, radius: float, color: str):
+        """
+        Инициализирует круг
+
+        Args:
+            radius: Радиус круга
+            color: Цвет круга
+        """
+        self.radius = radius
+        self._color_id = self._color_value(color)
+
+
+Rectangle.register(CompactRectangle)
+Square.register(CompactSquare)
+Circle.register(CompactCircle)
+
+
+def to_compact(figure) -> Figure:
+    """Создает компактную копию обычной фигуры"""
+    if isinstance(figure, Square):
+        return CompactSquare(figure.width, figure.color)
+    if isinstance(figure, Rectangle):
+        return CompactRectangle(figure.width, figure.height, figure.color)
+    if isinstance(figure, Circle):
+        return CompactCircle(figure.radius, figure.color)
+    raise TypeError(f"Неподдерживаемый вид фигуры: {type(figure).__name__}")
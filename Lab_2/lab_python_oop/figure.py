@@ -1,8 +1,98 @@
+import weakref
 from abc import ABC, abstractmethod
+from functools import wraps
+
+from .color import COLOR_REGISTRY, BoundFigureColor, FigureColor
+
+# Фигура -> наблюдатели (например, FigureIndex), которым сообщается об
+# изменении размеров или цвета. Ссылки слабые с обеих сторон: наблюдение
+# не продлевает жизнь ни фигуре, ни наблюдателю
+_observers = weakref.WeakKeyDictionary()
+
+
+def watch(figure, observer) -> bool:
+    """
+    Подписывает наблюдателя на изменения фигуры
+
+    После каждого изменения размеров или цвета вызывается
+    observer.figure_changed(figure).
+
+    Returns:
+        False, если фигура не поддерживает наблюдение (компактные фигуры
+        без слабых ссылок); тогда об изменениях нужно сообщать вручную
+    """
+    try:
+        observers = _observers.get(figure)
+        if observers is None:
+            observers = _observers[figure] = weakref.WeakSet()
+    except TypeError:
+        return False
+    observers.add(observer)
+    return True
+
+
+def unwatch(figure, observer):
+    """Отписывает наблюдателя от изменений фигуры"""
+    try:
+        observers = _observers.get(figure)
+    except TypeError:
+        return
+    if observers is not None:
+        observers.discard(observer)
+        if not observers:
+            del _observers[figure]
+
+
+def cached_result(method):
+    """
+    Декоратор кэширования результата метода без аргументов
+
+    Кэш работает, только если у фигуры включен cache_enabled, и хранится
+    в атрибуте _cache экземпляра. Сеттеры размеров и цвета сбрасывают
+    его через _changed.
+    """
+    name = method.__name__
+
+    @wraps(method)
+    def wrapper(self):
+        if not self.cache_enabled:
+            return method(self)
+        try:
+            cache = self._cache
+        except AttributeError:
+            cache = self._cache = {}
+        try:
+            return cache[name]
+        except KeyError:
+            value = cache[name] = method(self)
+            return value
+
+    return wrapper
 
 
 class Figure(ABC):
-    """Абстрактный класс геометрической фигуры"""
+    """
+    Абстрактный класс геометрической фигуры
+
+    Цвет хранится номером _color_id в реестре _color_registry, а не
+    собственной строкой: при миллионах фигур и десятках цветов это
+    экономит память и ускоряет группировку по цвету.
+
+    Если реестр заполнен (max_colors), фигура вместо номера хранит
+    собственный объект FigureColor, а color_id у нее равен None.
+
+    Номер действителен только в реестре текущего процесса, поэтому pickle
+    сохраняет название цвета, а при загрузке цвет снова добавляется в реестр.
+    """
+
+    # Пустые слоты позволяют наследникам обходиться без __dict__
+    __slots__ = ()
+
+    _color_registry = COLOR_REGISTRY
+
+    # Кэширование square() и repr включается для класса или отдельной фигуры:
+    # Rectangle.cache_enabled = True или figure.cache_enabled = True
+    cache_enabled = False
 
     @abstractmethod
     def square(self) -> float:
@@ -13,3 +103,68 @@ class Figure(ABC):
     def get_name(cls) -> str:
         """Возвращает название фигуры"""
         return cls.name if hasattr(cls, 'name') else cls.__name__
+
+    @property
+    def color_id(self) -> int:
+        """Номер цвета фигуры в реестре цветов (None, если цвет не поместился в реестр)"""
+        color_id = self._color_id
+        return None if isinstance(color_id, FigureColor) else color_id
+
+    @property
+    def color(self) -> str:
+        """Возвращает цвет фигуры"""
+        color_id = self._color_id
+        if isinstance(color_id, FigureColor):
+            return color_id.color
+        return self._color_registry.name(color_id)
+
+    @color.setter
+    def color(self, value: str):
+        """Назначает фигуре другой цвет, общие объекты цвета не меняются"""
+        self._color_id = self._color_value(value)
+        self._changed()
+
+    def _color_value(self, name: str):
+        """Значение _color_id для цвета: номер в реестре или собственный FigureColor, если реестр заполнен"""
+        color_id = self._color_registry.try_intern(name)
+        return FigureColor(name) if color_id is None else color_id
+
+    def _changed(self):
+        """Сбрасывает закэшированные результаты и уведомляет наблюдателей после изменения фигуры"""
+        try:
+            del self._cache
+        except AttributeError:
+            pass
+        if _observers:
+            try:
+                observers = _observers.get(self)
+            except TypeError:
+                return
+            if observers:
+                for observer in list(observers):
+                    observer.figure_changed(self)
+
+    def __getstate__(self) -> dict:
+        """Состояние для pickle: атрибуты фигуры с названием цвета вместо номера"""
+        state = dict(getattr(self, '__dict__', ()))
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get('__slots__', ()):
+                if name not in ('__dict__', '__weakref__') and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        state.pop('_color_id', None)
+        state.pop('_cache', None)
+        state['color'] = self.color
+        return state
+
+    def __setstate__(self, state: dict):
+        """Восстанавливает фигуру из pickle, добавляя цвет в реестр этого процесса"""
+        state = dict(state)
+        color = state.pop('color')
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        self._color_id = self._color_value(color)
+
+    @property
+    def color_figure(self) -> FigureColor:
+        """Цвет фигуры; присваивание color_figure.color меняет цвет только этой фигуры"""
+        return BoundFigureColor(self)
@@ -0,0 +1,160 @@
+from bisect import bisect_left, bisect_right
+from heapq import heapify, heappop, heappush
+from itertools import count
+
+from .figure import unwatch, watch
+
+# Куча цвета перестраивается, когда устаревших записей в ней больше половины
+_STALE_RATIO = 2
+
+
+class FigureIndex:
+    """
+    Индекс фигур по площади и цвету
+
+    Площадь каждой фигуры вычисляется один раз при добавлении. Фигуры
+    хранятся в списке, отсортированном по площади, поэтому выборка по
+    диапазону площадей выполняется двоичным поиском за O(log n + k).
+    Для каждого цвета ведется куча по убыванию площади, из которой
+    выбираются k наибольших фигур цвета.
+
+    Вставка и удаление сдвигают элементы отсортированных списков, то есть
+    занимают O(n), хотя сдвиг выполняется одним memmove и для сотен
+    тысяч фигур быстрее, чем древовидные структуры на Python.
+
+    Фигуры различаются по идентичности объекта. Индекс подписывается на
+    изменения фигур и сам обновляет запись, когда у Rectangle, Square,
+    Circle или фигуры из реестра видов меняются размеры или цвет. Для
+    компактных фигур и представлений FigureBatch, которые не сообщают об
+    изменениях, нужно вызвать update(figure).
+    """
+
+    def __init__(self, figures=()):
+        """
+        Инициализирует индекс
+
+        Args:
+            figures: Начальный набор фигур
+        """
+        # Ключи (площадь, номер записи) по возрастанию и фигуры в том же порядке
+        self._keys = []
+        self._figures = []
+        # id(фигуры) -> (площадь, номер записи, цвет, фигура)
+        self._entries = {}
+        # Цвет -> куча (-площадь, номер записи, фигура) с ленивым удалением
+        self._heaps = {}
+        self._stale = {}
+        self._counter = count()
+        for figure in figures:
+            self.add(figure)
+
+    def add(self, figure):
+        """Добавляет фигуру в индекс"""
+        if id(figure) in self._entries:
+            raise ValueError("Фигура уже есть в индексе")
+        area = figure.square()
+        color = figure.color
+        seq = next(self._counter)
+        self._entries[id(figure)] = (area, seq, color, figure)
+
+        position = bisect_right(self._keys, (area, seq))
+        self._keys.insert(position, (area, seq))
+        self._figures.insert(position, figure)
+        heappush(self._heaps.setdefault(color, []), (-area, seq, figure))
+        watch(figure, self)
+
+    def remove(self, figure):
+        """Удаляет фигуру из индекса"""
+        try:
+            area, seq, color, _ = self._entries.pop(id(figure))
+        except KeyError:
+            raise KeyError("Фигуры нет в индексе") from None
+        unwatch(figure, self)
+
+        position = bisect_left(self._keys, (area, seq))
+        del self._keys[position]
+        del self._figures[position]
+        # Запись в куче цвета остается и пропускается при выборке
+        self._stale[color] = self._stale.get(color, 0) + 1
+        if self._stale[color] * _STALE_RATIO > len(self._heaps[color]):
+            self._compact(color)
+
+    def update(self, figure):
+        """Обновляет фигуру после изменения ее размеров или цвета"""
+        self.remove(figure)
+        self.add(figure)
+
+    def figure_changed(self, figure):
+        """Вызывается фигурой после изменения размеров или цвета"""
+        if id(figure) in self._entries:
+            self.update(figure)
+
+    def _compact(self, color: str):
+        """Удаляет устаревшие записи из кучи цвета"""
+        heap = [item for item in self._heaps[color] if self._is_current(item[1], item[2])]
+        heapify(heap)
+        if heap:
+            self._heaps[color] = heap
+        else:
+            del self._heaps[color]
+        self._stale.pop(color, None)
+
+    def _is_current(self, seq: int, figure) -> bool:
+        entry = self._entries.get(id(figure))
+        return entry is not None and entry[1] == seq
+
+    def area_range(self, low: float, high: float) -> list:
+        """
+        Возвращает фигуры с площадью от low до high включительно
+
+        Returns:
+            Список фигур по возрастанию площади
+        """
+        start = bisect_left(self._keys, (low,))
+        end = bisect_right(self._keys, (high, float('inf')))
+        return self._figures[start:end]
+
+    def top_k(self, k: int, color: str = None) -> list:
+        """
+        Возвращает k фигур с наибольшей площадью
+
+        Args:
+            k: Количество фигур
+            color: Цвет фигур (None - среди всех фигур)
+
+        Returns:
+            Список фигур по убыванию площади
+        """
+        if k <= 0:
+            return []
+        if color is None:
+            return self._figures[:-k - 1:-1]
+
+        heap = self._heaps.get(color)
+        if not heap:
+            return []
+
+        # Обход кучи в порядке убывания площади: кандидаты - потомки уже выбранных узлов
+        result = []
+        frontier = [(heap[0], 0)]
+        while frontier and len(result) < k:
+            (_, seq, figure), i = heappop(frontier)
+            if self._is_current(seq, figure):
+                result.append(figure)
+            for child in (2 * i + 1, 2 * i + 2):
+                if child < len(heap):
+                    heappush(frontier, (heap[child], child))
+        return result
+
+    def __len__(self) -> int:
+        return len(self._figures)
+
+    def __contains__(self, figure) -> bool:
+        return id(figure) in self._entries
+
+    def __iter__(self):
+        """Перебирает фигуры по возрастанию площади"""
+        return iter(list(self._figures))
+
+    def __repr__(self) -> str:
+        return f"FigureIndex({len(self)} фигур, {len(self._heaps)} цветов)"
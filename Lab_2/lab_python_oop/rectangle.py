@@ -1,5 +1,4 @@
-from .figure import Figure
-from .color import FigureColor
+from .figure import Figure, cached_result
 
 
 class Rectangle(Figure):
@@ -16,14 +15,36 @@ class Rectangle(Figure):
             height: Высота прямоугольника
             color: Цвет прямоугольника
         """
-        self.width = width
-        self.height = height
-        self.color_figure = FigureColor(color)
+        self._width = width
+        self._height = height
+        self._color_id = self._color_value(color)
 
+    @property
+    def width(self) -> float:
+        """Ширина прямоугольника"""
+        return self._width
+
+    @width.setter
+    def width(self, value: float):
+        self._width = value
+        self._changed()
+
+    @property
+    def height(self) -> float:
+        """Высота прямоугольника"""
+        return self._height
+
+    @height.setter
+    def height(self, value: float):
+        self._height = value
+        self._changed()
+
+    @cached_result
     def square(self) -> float:
         """Вычисляет площадь прямоугольника"""
         return self.width * self.height
 
+    @cached_result
     def __repr__(self) -> str:
         return (
             "{name}:\n"
@@ -35,6 +56,6 @@ class Rectangle(Figure):
             name=self.get_name(),
             width=self.width,
             height=self.height,
-            color=self.color_figure.color,
+            color=self.color,
             area=self.square()
         )
@@ -0,0 +1,176 @@
+"""
+Потоковый вывод описаний фигур
+
+Описания строятся генератором по одному на фигуру и собираются в
+крупные блоки перед записью в поток, поэтому вывод миллионов фигур
+упирается в скорость ввода-вывода, а не в вызовы print. Коды цвета
+вычисляются один раз на каждый цвет.
+"""
+
+import sys
+
+from .batch import FigureBatch
+from .shapes import SHAPES
+
+# Размер блока, после которого накопленный текст записывается в поток
+DEFAULT_BUFFER_SIZE = 1 << 16
+
+# ANSI-коды цветов текста для названий цветов фигур
+ANSI_CODES = {
+    "черный": "\033[30m",
+    "красный": "\033[31m",
+    "зеленый": "\033[32m",
+    "желтый": "\033[33m",
+    "синий": "\033[34m",
+    "фиолетовый": "\033[35m",
+    "голубой": "\033[36m",
+    "белый": "\033[37m",
+}
+RESET = "\033[0m"
+
+
+def _escape(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def batch_template(shape) -> str:
+    """
+    Шаблон описания фигуры вида shape для вывода FigureBatch по столбцам
+
+    Совпадает с repr фигуры: строится по схеме параметров вида, поля
+    {0} и {1} - столбцы dim1 и dim2, {2} - цвет, {3} - площадь.
+    """
+    lines = [_escape(shape.name) + ":"]
+    lines.extend(f"  {_escape(label)}: {{{index}}}" for index, (_, label) in enumerate(shape.params))
+    lines.append("  Цвет: {2}")
+    lines.append("  Площадь: {3:.2f}")
+    return "\n".join(lines)
+
+
+class Palette:
+    """Коды начала и конца цветного текста для каждого цвета фигуры"""
+
+    def __init__(self, codes: dict = None):
+        """
+        Args:
+            codes: Название цвета -> ANSI-код (по умолчанию ANSI_CODES)
+        """
+        self.codes = ANSI_CODES if codes is None else codes
+        self._wrappers = {}
+
+    def wrapper(self, color: str) -> tuple:
+        """Возвращает пару (начало, конец) для цвета, вычисляя ее один раз"""
+        wrapper = self._wrappers.get(color)
+        if wrapper is None:
+            code = self.codes.get(color)
+            wrapper = self._wrappers[color] = (code, RESET + "\n") if code else ("", "\n")
+        return wrapper
+
+
+def render_figures(figures, palette: Palette = None, chunk_size: int = 4096):
+    """
+    Генератор описаний фигур
+
+    Args:
+        figures: Итерируемый набор фигур (список, FigureBatch, генератор)
+        palette: Палитра для цветного вывода (None - без цвета)
+        chunk_size: Количество фигур FigureBatch в одном блоке текста
+
+    Yields:
+        Описания фигур, каждое завершено переводом строки. Фигуры
+        FigureBatch выдаются блоками по chunk_size описаний.
+    """
+    if isinstance(figures, FigureBatch):
+        yield from _render_batch(figures, palette, chunk_size)
+        return
+
+    if palette is None:
+        for figure in figures:
+            yield repr(figure) + "\n"
+        return
+
+    wrapper = palette.wrapper
+    for figure in figures:
+        start, end = wrapper(figure.color)
+        yield start + repr(figure) + end
+
+
+def _typed_format(format, shape):
+    """Форматирование строки с параметрами, приведенными shape.validate (6.0 -> 6)"""
+    if shape.validate is None:
+        return format
+    count = len(shape.params)
+
+    def typed(d1, d2, area):
+        return format(*shape.dims((d1, d2)[:count]), area)
+    return typed
+
+
+def _render_batch(batch: FigureBatch, palette: Palette, chunk_size: int):
+    """Описания фигур FigureBatch, построенные прямо по столбцам"""
+    # Для каждой пары (вид, цвет) заранее готов шаблон с названием цвета и обрамлением
+    formatters = {}
+    for kind, shape in SHAPES.items():
+        template = batch_template(shape)
+        row = formatters[kind] = []
+        for color in batch.colors:
+            start, end = palette.wrapper(color) if palette else ("", "\n")
+            text = template.replace("{2}", _escape(color)).replace("{3:", "{2:")
+            row.append(_typed_format((_escape(start) + text + _escape(end)).format, shape))
+
+    kinds, dim1, dim2, color_ids = batch.kinds, batch.dim1, batch.dim2, batch.color_ids
+    areas = batch.areas()
+    for first in range(0, len(batch), chunk_size):
+        last = first + chunk_size
+        rows = zip(kinds[first:last], dim1[first:last], dim2[first:last],
+                   color_ids[first:last], areas[first:last])
+        yield "".join([formatters[kind][color_id](d1, d2, area)
+                       for kind, d1, d2, color_id, area in rows])
+
+
+def write_stream(chunks, out=None, buffer_size: int = DEFAULT_BUFFER_SIZE) -> int:
+    """
+    Записывает строки в поток крупными блоками
+
+    Args:
+        chunks: Итерируемый набор строк
+        out: Текстовый поток (по умолчанию sys.stdout)
+        buffer_size: Сколько символов накапливается перед записью
+
+    Returns:
+        Количество записанных символов
+    """
+    out = sys.stdout if out is None else out
+    parts = []
+    size = 0
+    total = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        size += len(chunk)
+        if size >= buffer_size:
+            out.write("".join(parts))
+            total += size
+            parts = []
+            size = 0
+    if parts:
+        out.write("".join(parts))
+        total += size
+    out.flush()
+    return total
+
+
+def dump_figures(figures, out=None, color: bool = False,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE) -> int:
+    """
+    Выводит описания всех фигур в поток
+
+    Args:
+        figures: Итерируемый набор фигур
+        out: Текстовый поток (по умолчанию sys.stdout)
+        color: Раскрашивать описания ANSI-кодами цвета фигуры
+        buffer_size: Сколько символов накапливается перед записью
+
+    Returns:
+        Количество записанных символов
+    """
+    return write_stream(render_figures(figures, Palette() if color else None), out, buffer_size)
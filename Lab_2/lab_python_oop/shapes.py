@@ -0,0 +1,270 @@
+"""
+Реестр видов фигур
+
+Каждый вид фигуры описывается кодом (хранится в столбце kinds
+FigureBatch и в двоичных файлах), схемой параметров и ядром площади.
+Параметров не больше двух, они хранятся в столбцах dim1 и dim2.
+
+Ядро площади area(d1, d2, xp) работает и с числами, и с массивами:
+xp - модуль math при вычислении для одной фигуры или numpy при
+вычислении для всех фигур вида в FigureBatch сразу.
+
+Новый вид добавляется декоратором:
+
+    @register_shape(6, "rhombus", "Ромб", (("d1", "Диагональ 1"), ("d2", "Диагональ 2")))
+    def rhombus_area(d1, d2, xp):
+        return 0.5 * d1 * d2
+
+Для новых видов класс фигуры создается автоматически и доступен
+через shape_type("rhombus").figure_class. Коды видов должны быть
+постоянными, так как сохраняются в файлах.
+
+Необязательная функция validate(params) проверяет значения параметров
+(кортеж по схеме) и возвращает их приведенными к нужным типам или
+выбрасывает ValueError. Она вызывается при создании фигуры, изменении
+параметра и добавлении фигуры в FigureBatch.
+"""
+
+import math
+
+from .figure import Figure, cached_result
+from .rectangle import Rectangle
+from .square import Square
+from .circle import Circle
+
+# Коды встроенных видов фигур
+KIND_RECTANGLE = 0
+KIND_SQUARE = 1
+KIND_CIRCLE = 2
+KIND_TRIANGLE = 3
+KIND_ELLIPSE = 4
+KIND_REGULAR_POLYGON = 5
+
+# Наибольшее количество параметров вида (по числу столбцов размеров)
+MAX_PARAMS = 2
+
+# Реестр: код вида -> ShapeType
+SHAPES = {}
+_SHAPES_BY_KEY = {}
+
+
+class ShapeType:
+    """Описание вида фигуры"""
+
+    def __init__(self, kind: int, key: str, name: str, params: tuple, area,
+                 figure_class=None, validate=None):
+        """
+        Args:
+            kind: Код вида (0-255)
+            key: Короткое имя вида для API
+            name: Название вида для вывода
+            params: Схема параметров: пары (имя атрибута, подпись для вывода)
+            area: Ядро площади area(d1, d2, xp)
+            figure_class: Класс фигуры (по умолчанию создается автоматически)
+            validate: Проверка значений параметров (None - без проверки)
+        """
+        self.kind = kind
+        self.key = key
+        self.name = name
+        self.params = tuple(params)
+        self.area = area
+        self.validate = validate
+        self.figure_class = figure_class or _make_figure_class(self)
+
+    def values(self, params) -> tuple:
+        """
+        Проверяет значения параметров по схеме вида
+
+        Raises:
+            TypeError: Если количество значений не совпадает со схемой
+            ValueError: Если значения не прошли проверку validate
+        """
+        if len(params) != len(self.params):
+            raise TypeError(f"Вид '{self.key}' ожидает параметры: "
+                            + ", ".join(attr for attr, _ in self.params))
+        params = tuple(params)
+        return self.validate(params) if self.validate else params
+
+    def dims(self, params) -> tuple:
+        """Проверяет значения параметров и дополняет их до пары (dim1, dim2)"""
+        params = self.values(params)
+        return params + (0.0,) * (MAX_PARAMS - len(params))
+
+    def __repr__(self) -> str:
+        return f"ShapeType({self.kind}, '{self.key}')"
+
+
+def register_shape(kind: int, key: str, name: str, params: tuple, figure_class=None, validate=None):
+    """
+    Декоратор регистрации вида фигуры по ядру площади
+
+    Args:
+        kind: Код вида (0-255)
+        key: Короткое имя вида
+        name: Название вида для вывода
+        params: Схема параметров: пары (имя атрибута, подпись для вывода)
+        figure_class: Готовый класс фигуры (для встроенных видов)
+        validate: Проверка значений параметров: принимает кортеж значений
+                  по схеме и возвращает его (возможно, с приведенными типами)
+    """
+    if not 0 <= kind <= 255:
+        raise ValueError("Код вида фигуры должен быть от 0 до 255")
+    if not 1 <= len(params) <= MAX_PARAMS:
+        raise ValueError(f"У вида фигуры должно быть от 1 до {MAX_PARAMS} параметров")
+    if kind in SHAPES or key in _SHAPES_BY_KEY:
+        raise ValueError(f"Вид фигуры {kind} ('{key}') уже зарегистрирован")
+
+    def decorator(area):
+        shape = ShapeType(kind, key, name, params, area, figure_class, validate)
+        SHAPES[kind] = _SHAPES_BY_KEY[key] = shape
+        return area
+    return decorator
+
+
+def shape_type(key) -> ShapeType:
+    """Возвращает вид фигуры по короткому имени или коду"""
+    shape = SHAPES.get(key) if isinstance(key, int) else _SHAPES_BY_KEY.get(key)
+    if shape is None:
+        raise KeyError(f"Неизвестный вид фигуры: {key!r}")
+    return shape
+
+
+class ShapeFigure(Figure):
+    """
+    Фигура вида из реестра
+
+    Базовый класс для автоматически созданных классов фигур. Площадь
+    считается ядром вида, вывод строится по схеме параметров.
+    """
+
+    shape = None
+
+    def __init__(self, *args, **kwargs):
+        """
+        Инициализирует фигуру
+
+        Args:
+            args: Значения параметров по схеме вида и цвет последним аргументом
+            kwargs: Те же значения по именам параметров и color, например
+                    Triangle(base=3, height=4, color="красный")
+        """
+        names = [attr for attr, _ in self.shape.params] + ['color']
+        if len(args) > len(names):
+            raise TypeError(f"{type(self).__name__}() принимает не больше {len(names)} аргументов")
+        values = dict(zip(names, args))
+        for name, value in kwargs.items():
+            if name not in names:
+                raise TypeError(f"{type(self).__name__}() получил неизвестный аргумент '{name}'")
+            if name in values:
+                raise TypeError(f"{type(self).__name__}() получил несколько значений аргумента '{name}'")
+            values[name] = value
+        missing = [name for name in names if name not in values]
+        if missing:
+            raise TypeError(f"{type(self).__name__}() не хватает аргументов: {', '.join(missing)}")
+
+        self._params = list(self.shape.dims([values[name] for name in names[:-1]]))
+        self._color_id = self._color_value(values['color'])
+
+    def dims(self) -> tuple:
+        """Значения параметров фигуры, дополненные до пары (dim1, dim2)"""
+        return self.shape.dims([getattr(self, attr) for attr, _ in self.shape.params])
+
+    @cached_result
+    def square(self) -> float:
+        """Вычисляет площадь фигуры ядром вида"""
+        return self.shape.area(*self.dims(), math)
+
+    def __reduce__(self):
+        # Класс создан реестром и не доступен pickle по имени, поэтому
+        # сохраняется короткое имя вида
+        return _load_shape_figure, (self.shape.key, self.__getstate__())
+
+    @cached_result
+    def __repr__(self) -> str:
+        lines = [f"{self.get_name()}:"]
+        lines.extend(f"  {label}: {getattr(self, attr)}" for attr, label in self.shape.params)
+        lines.append(f"  Цвет: {self.color}")
+        lines.append(f"  Площадь: {self.square():.2f}")
+        return "\n".join(lines)
+
+
+def _load_shape_figure(key: str, state: dict) -> ShapeFigure:
+    """Восстанавливает фигуру вида из реестра, сохраненную pickle"""
+    cls = shape_type(key).figure_class
+    figure = cls.__new__(cls)
+    figure.__setstate__(state)
+    return figure
+
+
+def _param_property(index: int, doc: str) -> property:
+    def getter(self):
+        return self._params[index]
+
+    def setter(self, value):
+        params = self._params[:len(self.shape.params)]
+        params[index] = value
+        self._params[:len(params)] = self.shape.values(params)
+        self._changed()
+
+    return property(getter, setter, doc=doc)
+
+
+def _make_figure_class(shape: ShapeType) -> type:
+    """Создает класс фигуры для вида из реестра"""
+    namespace = {
+        'shape': shape,
+        'name': shape.name,
+        '__doc__': f"{shape.name} (вид фигуры '{shape.key}')",
+    }
+    for index, (attr, label) in enumerate(shape.params):
+        namespace[attr] = _param_property(index, label)
+    class_name = "".join(part.capitalize() for part in shape.key.split("_"))
+    return type(class_name, (ShapeFigure,), namespace)
+
+
+@register_shape(KIND_RECTANGLE, "rectangle", Rectangle.name,
+                (("width", "Ширина"), ("height", "Высота")), Rectangle)
+def rectangle_area(d1, d2, xp):
+    return d1 * d2
+
+
+@register_shape(KIND_SQUARE, "square", Square.name, (("width", "Сторона"),), Square)
+def square_area(d1, d2, xp):
+    return d1 * d1
+
+
+@register_shape(KIND_CIRCLE, "circle", Circle.name, (("radius", "Радиус"),), Circle)
+def circle_area(d1, d2, xp):
+    return xp.pi * (d1 ** 2)
+
+
+@register_shape(KIND_TRIANGLE, "triangle", "Треугольник",
+                (("base", "Основание"), ("height", "Высота")))
+def triangle_area(d1, d2, xp):
+    return 0.5 * d1 * d2
+
+
+@register_shape(KIND_ELLIPSE, "ellipse", "Эллипс",
+                (("semi_major", "Большая полуось"), ("semi_minor", "Малая полуось")))
+def ellipse_area(d1, d2, xp):
+    return xp.pi * d1 * d2
+
+
+def _validate_regular_polygon(params) -> tuple:
+    """Число сторон - целое не меньше 3; 6.0 из столбца хранилища приводится к 6"""
+    side, sides = params
+    if isinstance(sides, bool) or not float(sides).is_integer() or sides < 3:
+        raise ValueError(f"Число сторон многоугольника должно быть целым не меньше 3, а не {sides!r}")
+    return side, int(sides)
+
+
+@register_shape(KIND_REGULAR_POLYGON, "regular_polygon", "Правильный многоугольник",
+                (("side", "Сторона"), ("sides", "Число сторон")),
+                validate=_validate_regular_polygon)
+def regular_polygon_area(d1, d2, xp):
+    return d2 * d1 * d1 / (4 * xp.tan(xp.pi / d2))
+
+
+Triangle = SHAPES[KIND_TRIANGLE].figure_class
+Ellipse = SHAPES[KIND_ELLIPSE].figure_class
+RegularPolygon = SHAPES[KIND_REGULAR_POLYGON].figure_class
@@ -1,3 +1,4 @@
+from .figure import cached_result
 from .rectangle import Rectangle
 
 
@@ -16,10 +17,11 @@ class Square(Rectangle):
         """
         super().__init__(side, side, color)
 
+    @cached_result
     def __repr__(self) -> str:
         return (
             f"{self.get_name()}:\n"
             f"  Сторона: {self.width}\n"
-            f"  Цвет: {self.color_figure.color}\n"
+            f"  Цвет: {self.color}\n"
             f"  Площадь: {self.square():.2f}"
         )
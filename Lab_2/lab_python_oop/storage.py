@@ -0,0 +1,168 @@
+"""
+Двоичный формат хранения наборов фигур
+
+Файл состоит из заголовка и столбцов FigureBatch, записанных подряд
+без преобразований (little-endian):
+
+    заголовок   32 байта: сигнатура b'FIGB', версия (uint16), резерв (uint16),
+                количество фигур n (uint64), смещение и размер таблицы цветов (uint64)
+    dim1        n * float64
+    dim2        n * float64
+    color_ids   n * uint32
+    kinds       n * uint8
+    цвета       для каждого цвета: длина (uint32) и название в UTF-8
+
+Загрузчик отображает файл в память (mmap) и строит FigureBatch прямо
+поверх отображения, поэтому открытие не зависит от размера файла,
+а страницы читаются с диска только при обращении к ним.
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+
+from .batch import FigureBatch
+from .color import ColorRegistry
+
+MAGIC = b'FIGB'
+VERSION = 1
+
+HEADER = struct.Struct('<4sHHQQQ')
+_NAME_LENGTH = struct.Struct('<I')
+
+# Столбцы в порядке записи: (имя атрибута, код типа array, размер элемента)
+_COLUMNS = (
+    ('dim1', 'd', 8),
+    ('dim2', 'd', 8),
+    ('color_ids', 'I', 4),
+    ('kinds', 'B', 1),
+)
+
+
+def _column_bytes(column, typecode: str) -> bytes:
+    """Возвращает байты столбца в порядке little-endian"""
+    if sys.byteorder == 'little':
+        return column
+    swapped = array(typecode, column)
+    swapped.byteswap()
+    return swapped
+
+
+def save_batch(batch: FigureBatch, path: str) -> int:
+    """
+    Записывает хранилище фигур в двоичный файл
+
+    Args:
+        batch: Хранилище фигур
+        path: Путь к файлу
+
+    Returns:
+        Количество записанных байт
+    """
+    count = len(batch)
+    colors = b''.join(
+        _NAME_LENGTH.pack(len(encoded)) + encoded
+        for encoded in (name.encode('utf-8') for name in batch.colors)
+    )
+    colors_offset = HEADER.size + count * sum(size for _, _, size in _COLUMNS)
+
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, count, colors_offset, len(colors)))
+        for name, typecode, _ in _COLUMNS:
+            f.write(_column_bytes(getattr(batch, name), typecode))
+        f.write(colors)
+    return colors_offset + len(colors)
+
+
+def save_figures(figures, path: str) -> int:
+    """Записывает последовательность фигур в двоичный файл"""
+    return save_batch(FigureBatch.from_figures(figures), path)
+
+
+class MappedFigureBatch(FigureBatch):
+    """
+    Хранилище фигур только для чтения, отображенное из файла
+
+    Столбцы - срезы memoryview над mmap, объекты фигур создаются
+    только при обращении по номеру или переборе. Перед закрытием
+    нужно освободить массивы NumPy, созданные поверх столбцов.
+    """
+
+    def __init__(self, path: str):
+        """
+        Открывает файл, записанный save_batch
+
+        Args:
+            path: Путь к файлу
+        """
+        with open(path, 'rb') as f:
+            size = f.seek(0, 2)
+            if size < HEADER.size:
+                raise ValueError(f"Файл {path} слишком короткий для набора фигур")
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, _, count, colors_offset, colors_size = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self._mmap.close()
+            raise ValueError(f"Файл {path} не является набором фигур")
+        if version != VERSION:
+            self._mmap.close()
+            raise ValueError(f"Неподдерживаемая версия формата: {version}")
+        if colors_offset + colors_size > size:
+            self._mmap.close()
+            raise ValueError(f"Файл {path} обрезан")
+
+        super().__init__(ColorRegistry(self._read_colors(colors_offset, colors_size)))
+
+        buffer = memoryview(self._mmap)
+        offset = HEADER.size
+        self._views = [buffer]
+        for name, typecode, size in _COLUMNS:
+            column = buffer[offset:offset + count * size].cast(typecode)
+            if sys.byteorder != 'little':
+                column = array(typecode, column)
+                column.byteswap()
+            else:
+                self._views.append(column)
+            setattr(self, name, column)
+            offset += count * size
+
+    def _read_colors(self, offset: int, size: int) -> list:
+        names = []
+        end = offset + size
+        while offset < end:
+            (length,) = _NAME_LENGTH.unpack_from(self._mmap, offset)
+            offset += _NAME_LENGTH.size
+            names.append(self._mmap[offset:offset + length].decode('utf-8'))
+            offset += length
+        return names
+
+    def _add(self, kind: int, dim1: float, dim2: float, color: str) -> int:
+        raise TypeError("Отображенный из файла набор фигур доступен только для чтения")
+
+    def close(self):
+        """Закрывает отображение файла"""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        self._mmap.close()
+
+    def __enter__(self) -> 'MappedFigureBatch':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def load_batch(path: str) -> MappedFigureBatch:
+    """
+    Открывает двоичный файл фигур без чтения его целиком
+
+    Args:
+        path: Путь к файлу, записанному save_batch или save_figures
+
+    Returns:
+        Хранилище фигур только для чтения
+    """
+    return MappedFigureBatch(path)
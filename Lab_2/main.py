@@ -1,23 +1,76 @@
 #!/usr/bin/env python3
 """
 Основной файл для тестирования классов геометрических фигур
+
+Запуск:
+    python main.py                  # демонстрация с цветным выводом
+    python main.py --no-color       # без colorama и ANSI-кодов
+    python main.py --dump 1000000   # потоковый вывод большого набора фигур
 """
 
-from lab_python_oop.rectangle import Rectangle
-from lab_python_oop.circle import Circle
-from lab_python_oop.square import Square
+import argparse
+import importlib.util
+import sys
+
+# Модули фигур загружаются пакетом при первом обращении к имени
+import lab_python_oop as oop
+
+# colorama импортируется только при цветном выводе, здесь лишь проверяется наличие
+COLORAMA_AVAILABLE = importlib.util.find_spec("colorama") is not None
+
+
+# Цвета фигур, генерируемых для --dump
+DUMP_COLORS = ("синий", "зеленый", "красный")
+
+
+def generate_figures(count: int):
+    """Создает набор фигур (FigureBatch) для потокового вывода"""
+    batch = oop.FigureBatch()
+    for i in range(count):
+        color = DUMP_COLORS[i % len(DUMP_COLORS)]
+        kind = i % 3
+        if kind == 0:
+            batch.add_rectangle(i % 100 + 1, 2, color)
+        elif kind == 1:
+            batch.add_circle(i % 100 + 1, color)
+        else:
+            batch.add_square(i % 100 + 1, color)
+    return batch
 
-# Для демонстрации использования внешнего пакета
-try:
-    from colorama import init, Fore, Back, Style
-    COLORAMA_AVAILABLE = True
-except ImportError:
-    COLORAMA_AVAILABLE = False
-    print("Пакет colorama не установлен. Для цветного вывода установите его: pip install colorama")
+
+def describe_figures(figures):
+    """Генератор описаний фигур для проверки полиморфизма"""
+    for i, figure in enumerate(figures, 1):
+        yield (
+            f"Фигура {i}: {figure.get_name()}\n"
+            f"  Площадь: {figure.square():.2f}\n"
+            f"  Представление:\n{figure!r}\n\n"
+        )
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    """Разбирает аргументы командной строки"""
+    parser = argparse.ArgumentParser(description="Тестирование классов геометрических фигур")
+    parser.add_argument("--no-color", action="store_true",
+                        help="Не подключать colorama и не выводить ANSI-коды")
+    parser.add_argument("--dump", type=int, metavar="N",
+                        help="Вывести описания N сгенерированных фигур и завершиться")
+    return parser.parse_args(argv)
 
 
-def main():
+def main(argv: list = None):
     """Основная функция тестирования"""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    use_color = COLORAMA_AVAILABLE and not args.no_color
+
+    if args.dump is not None:
+        if use_color:
+            import colorama
+            colorama.init()
+        oop.dump_figures(generate_figures(args.dump), color=use_color)
+        return
+
+    from lab_python_oop.render import Palette, render_figures, write_stream
 
     # Установим N = 17 (номер варианта)
     N = 17
@@ -30,19 +83,19 @@ def main():
 
     # 1. Создаем прямоугольник синего цвета шириной N и высотой N
     print("1. Создание прямоугольника:")
-    rect = Rectangle(width=N, height=N, color="синий")
+    rect = oop.Rectangle(width=N, height=N, color="синий")
     print(rect)
     print()
 
     # 2. Создаем круг зеленого цвета радиусом N
     print("2. Создание круга:")
-    circle = Circle(radius=N, color="зеленый")
+    circle = oop.Circle(radius=N, color="зеленый")
     print(circle)
     print()
 
     # 3. Создаем квадрат красного цвета со стороной N
     print("3. Создание квадрата:")
-    square = Square(side=N, color="красный")
+    square = oop.Square(side=N, color="красный")
     print(square)
     print()
 
@@ -50,16 +103,13 @@ def main():
     print("4. Проверка полиморфизма:")
     figures = [rect, circle, square]
 
-    for i, figure in enumerate(figures, 1):
-        print(f"Фигура {i}: {figure.get_name()}")
-        print(f"  Площадь: {figure.square():.2f}")
-        print(f"  Представление:\n{repr(figure)}")
-        print()
+    write_stream(describe_figures(figures))
 
     # 5. Вызов метода из внешнего пакета (colorama)
     print("5. Использование внешнего пакета colorama:")
-    if COLORAMA_AVAILABLE:
+    if use_color:
         # Инициализация colorama
+        from colorama import init, Fore, Back, Style
         init(autoreset=True)
 
         # Использование colorama для цветного вывода
@@ -67,16 +117,11 @@ def main():
         print(Back.YELLOW + Fore.BLACK + "А этот текст на желтом фоне")
         print(Style.BRIGHT + Fore.BLUE + "И этот текст синий и жирный")
 
-        # Создадим цветные версии наших фигур
+        # Цветные версии наших фигур: код цвета берется из цвета фигуры
         print("\nЦветное представление фигур:")
-        color_figures = [
-            (Fore.BLUE, "Прямоугольник", f"синий, размер: {N}x{N}, площадь: {rect.square():.2f}"),
-            (Fore.GREEN, "Круг", f"зеленый, радиус: {N}, площадь: {circle.square():.2f}"),
-            (Fore.RED, "Квадрат", f"красный, сторона: {N}, площадь: {square.square():.2f}"),
-        ]
-
-        for color, name, description in color_figures:
-            print(color + f"{name}: {description}")
+        write_stream(render_figures(figures, Palette()))
+    elif args.no_color:
+        print("Цветной вывод отключен (--no-color)")
     else:
         print("Для цветного вывода установите пакет colorama: pip install colorama")
         print("Пример использования:")
@@ -3,13 +3,30 @@
 Модульные тесты для геометрических фигур
 """
 
+import io
 import unittest
 import math
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+from unittest import mock
 from lab_python_oop.figure import Figure
-from lab_python_oop.color import FigureColor
+from lab_python_oop.color import COLOR_REGISTRY, ColorRegistry, FigureColor
 from lab_python_oop.rectangle import Rectangle
 from lab_python_oop.circle import Circle
 from lab_python_oop.square import Square
+from lab_python_oop.batch import FigureBatch
+from lab_python_oop.index import FigureIndex
+from lab_python_oop import shapes
+from lab_python_oop.shapes import Ellipse, RegularPolygon, Triangle, register_shape
+from lab_python_oop.aggregate import aggregate
+from lab_python_oop.render import RESET, Palette, dump_figures, render_figures, write_stream
+from lab_python_oop.storage import load_batch, save_batch, save_figures
+from lab_python_oop.compact import (
+    CompactRectangle, CompactCircle, CompactSquare, shared_color, to_compact
+)
 
 
 class TestFigureColor(unittest.TestCase):
@@ -239,6 +256,641 @@ class TestEdgeCases(unittest.TestCase):
         self.assertEqual(circle.square(), math.pi * 25)  # Квадрат радиуса всегда положителен
 
 
+class TestFigureBatch(unittest.TestCase):
+    """Тесты столбцового хранилища FigureBatch"""
+
+    def setUp(self):
+        """Настройка тестовых данных"""
+        self.figures = [
+            Rectangle(3.0, 4.0, "красный"),
+            Circle(5.0, "синий"),
+            Square(6.0, "красный"),
+        ]
+        self.batch = FigureBatch.from_figures(self.figures)
+
+    def test_columns(self):
+        """Тест заполнения столбцов и таблицы цветов"""
+        self.assertEqual(len(self.batch), 3)
+        self.assertEqual(self.batch.colors, ["красный", "синий"])
+        self.assertEqual(list(self.batch.color_ids), [0, 1, 0])
+
+    def test_areas(self):
+        """Тест вычисления всех площадей за один проход"""
+        for area, figure in zip(self.batch.areas(), self.figures):
+            self.assertAlmostEqual(area, figure.square(), places=10)
+        self.assertAlmostEqual(self.batch.total_area(), 12 + math.pi * 25 + 36, places=10)
+
+    def test_views_behave_like_figures(self):
+        """Тест, что представления ведут себя как обычные фигуры"""
+        for view, figure in zip(self.batch, self.figures):
+            self.assertIsInstance(view, type(figure))
+            self.assertIsInstance(view, Figure)
+            self.assertEqual(view.get_name(), figure.get_name())
+            self.assertEqual(view.square(), figure.square())
+            self.assertEqual(repr(view), repr(figure))
+
+    def test_views_have_no_dict(self):
+        """Тест, что представления хранят только слоты, без __dict__"""
+        self.batch.add("triangle", 3.0, 4.0, "синий")
+        for view in self.batch:
+            self.assertFalse(hasattr(view, "__dict__"), type(view).__name__)
+        self.assertNotIsInstance(self.batch[0], Square)
+        self.assertIsInstance(self.batch[2], Rectangle)
+        self.assertIsInstance(self.batch[3], Triangle)
+
+    def test_view_setters_write_to_batch(self):
+        """Тест изменения размеров через представление"""
+        self.batch[2].width = 2.0
+        self.batch[-2].radius = 1.0
+
+        self.assertEqual(self.batch[2].height, 2.0)
+        self.assertEqual(list(self.batch.areas())[1:], [math.pi, 4.0])
+
+    def test_unsupported_figure(self):
+        """Тест, что неизвестный вид фигуры не добавляется"""
+        with self.assertRaises(TypeError):
+            self.batch.append(FigureColor("красный"))
+
+
+class TestCompactFigures(unittest.TestCase):
+    """Тесты компактных фигур"""
+
+    def setUp(self):
+        """Настройка тестовых данных"""
+        self.figures = [
+            Rectangle(3, 4, "красный"),
+            Circle(5, "синий"),
+            Square(6, "красный"),
+        ]
+        self.compact = [to_compact(figure) for figure in self.figures]
+
+    def test_compact_behaves_like_regular(self):
+        """Тест, что компактные фигуры сохраняют isinstance, get_name и repr"""
+        for compact, figure in zip(self.compact, self.figures):
+            self.assertIsInstance(compact, type(figure))
+            self.assertIsInstance(compact, Figure)
+            self.assertEqual(compact.get_name(), figure.get_name())
+            self.assertEqual(compact.square(), figure.square())
+            self.assertEqual(repr(compact), repr(figure))
+
+        self.assertNotIsInstance(CompactRectangle(1, 2, "синий"), Square)
+
+    def test_compact_has_no_instance_dict(self):
+        """Тест, что компактные фигуры не создают __dict__"""
+        for compact in self.compact:
+            self.assertFalse(hasattr(compact, "__dict__"))
+        self.assertFalse(hasattr(FigureColor("синий"), "__dict__"))
+
+    def test_shared_color(self):
+        """Тест общего неизменяемого цвета"""
+        self.assertEqual(self.compact[0].color_id, self.compact[2].color_id)
+        self.assertIs(shared_color("красный"), COLOR_REGISTRY.get(self.compact[0].color_id))
+
+        with self.assertRaises(AttributeError):
+            shared_color("красный").color = "зеленый"
+        self.assertEqual(shared_color("красный").color, "красный")
+
+    def test_color_copy_on_write(self):
+        """Тест, что смена цвета затрагивает только одну фигуру"""
+        first = CompactCircle(1, "синий")
+        second = CompactSquare(1, "синий")
+        first.color_figure.color = "зеленый"
+
+        self.assertEqual(first.color, "зеленый")
+        self.assertEqual(second.color_figure.color, "синий")
+        self.assertEqual(shared_color("синий").color, "синий")
+
+
+class TestColorRegistry(unittest.TestCase):
+    """Тесты реестра цветов"""
+
+    def test_intern(self):
+        """Тест выдачи номеров и общих объектов цвета"""
+        registry = ColorRegistry(["красный"])
+        self.assertEqual(registry.intern("синий"), 1)
+        self.assertEqual(registry.intern("красный"), 0)
+        self.assertEqual(registry.name(1), "синий")
+        self.assertIs(registry.get(1), registry.get(registry.intern("синий")))
+        self.assertEqual(len(registry), 2)
+
+    def test_figures_store_color_id(self):
+        """Тест, что фигуры одного цвета ссылаются на один номер"""
+        first = Rectangle(1, 2, "оранжевый")
+        second = Circle(3, "оранжевый")
+        self.assertEqual(first.color_id, second.color_id)
+        self.assertNotIn("color_figure", vars(first))
+
+        first.color = "фиолетовый"
+        self.assertEqual(second.color, "оранжевый")
+        self.assertIn("фиолетовый", repr(first))
+
+    def test_group_sum(self):
+        """Тест группировки значений по номерам цветов"""
+        registry = ColorRegistry(["красный", "синий", "зеленый"])
+        self.assertEqual(registry.group_sum([0, 2, 0], [1.0, 2.0, 3.0]),
+                         {"красный": 4.0, "зеленый": 2.0})
+
+    def test_registry_limit(self):
+        """Тест ограничения количества цветов в реестре"""
+        registry = ColorRegistry(["красный", "синий"], max_colors=2)
+        self.assertEqual(registry.intern("синий"), 1)
+        with self.assertRaises(ValueError):
+            registry.intern("зеленый")
+        self.assertEqual(len(registry), 2)
+        self.assertIsNotNone(COLOR_REGISTRY.max_colors)
+
+        # Фигуры с цветом сверх ограничения хранят собственный цвет
+        class SmallRectangle(Rectangle):
+            _color_registry = registry
+
+        figure = SmallRectangle(1, 2, "зеленый")
+        self.assertEqual(figure.color, "зеленый")
+        self.assertIsNone(figure.color_id)
+        self.assertIn("Цвет: зеленый", repr(figure))
+        figure.color = "синий"
+        self.assertEqual((figure.color, figure.color_id), ("синий", 1))
+        figure.color = "белый"
+        self.assertEqual(FigureBatch.from_figures([figure]).colors, ["белый"])
+
+        batch = FigureBatch(registry)
+        batch.add_square(2, "синий")
+        with self.assertRaises(ValueError):
+            batch.add_circle(1, "зеленый")
+        self.assertEqual(len(batch), 1)
+        self.assertEqual(len(batch.kinds), len(batch.color_ids))
+
+    def test_batch_area_by_color(self):
+        """Тест площадей по цветам в FigureBatch"""
+        batch = FigureBatch.from_figures([
+            Rectangle(3, 4, "красный"), Circle(1, "синий"), Square(2, "красный"),
+        ])
+        by_color = batch.area_by_color()
+        self.assertEqual(set(by_color), {"красный", "синий"})
+        self.assertAlmostEqual(by_color["красный"], 16.0)
+        self.assertAlmostEqual(by_color["синий"], math.pi)
+
+    def test_batch_view_color(self):
+        """Тест смены цвета через представление FigureBatch"""
+        batch = FigureBatch.from_figures([Rectangle(3, 4, "красный"), Square(2, "красный")])
+        batch[0].color_figure.color = "синий"
+        self.assertEqual(list(batch.color_ids), [1, 0])
+        self.assertEqual(batch[1].color, "красный")
+
+
+    def test_pickle_keeps_color_name(self):
+        """Тест, что pickle сохраняет название цвета, а не номер в реестре процесса"""
+        batch = FigureBatch()
+        batch.add("triangle", 3.0, 4.0, "розовый")
+        figures = [
+            Rectangle(1, 2, "красный"), Square(2, "синий"), Circle(1, "зеленый"),
+            CompactRectangle(1, 2, "красный"), CompactSquare(3, "синий"), CompactCircle(4, "зеленый"),
+            RegularPolygon(2, 6, "синий"), batch[0],
+        ]
+        data = pickle.dumps(figures)
+        expected = [repr(figure) for figure in figures]
+
+        # Другой процесс: в реестре другие цвета и в другом порядке
+        registry = ColorRegistry(["черный", "зеленый", "синий"])
+        with mock.patch.object(Figure, "_color_registry", registry):
+            loaded = pickle.loads(data)
+            self.assertEqual([repr(figure) for figure in loaded], expected)
+            self.assertEqual([type(figure) for figure in loaded], [type(figure) for figure in figures])
+        self.assertEqual(loaded[0].color_id, registry.intern("красный"))
+        self.assertEqual(loaded[2].color_id, 1)
+        self.assertEqual(loaded[-1].color, "розовый")
+        self.assertEqual(loaded[-1]._batch.registry.names, ["розовый"])
+
+
+class TestFigureIndex(unittest.TestCase):
+    """Тесты индекса фигур по площади и цвету"""
+
+    def setUp(self):
+        """Настройка тестовых данных"""
+        self.figures = [
+            Rectangle(1, 2, "красный"),    # 2
+            Square(3, "синий"),            # 9
+            Circle(1, "красный"),          # pi
+            Rectangle(2, 5, "красный"),    # 10
+            Square(2, "синий"),            # 4
+        ]
+        self.index = FigureIndex(self.figures)
+
+    def test_area_range(self):
+        """Тест выборки фигур по диапазону площадей"""
+        rect_small, square_big, circle, rect_big, square_small = self.figures
+        self.assertEqual(self.index.area_range(3, 9), [circle, square_small, square_big])
+        self.assertEqual(self.index.area_range(2, 2), [rect_small])
+        self.assertEqual(self.index.area_range(11, 20), [])
+
+    def test_top_k(self):
+        """Тест выборки наибольших фигур всего набора и одного цвета"""
+        rect_small, square_big, circle, rect_big, square_small = self.figures
+        self.assertEqual(self.index.top_k(2), [rect_big, square_big])
+        self.assertEqual(self.index.top_k(5, "красный"), [rect_big, circle, rect_small])
+        self.assertEqual(self.index.top_k(1, "зеленый"), [])
+
+    def test_remove_and_update(self):
+        """Тест удаления фигуры и обновления после изменения размеров и цвета"""
+        rect_small, square_big, circle, rect_big, square_small = self.figures
+        self.index.remove(rect_big)
+        self.assertNotIn(rect_big, self.index)
+        self.assertEqual(self.index.top_k(1, "красный"), [circle])
+
+        rect_small.width = 50
+        rect_small.color = "синий"
+        self.index.update(rect_small)
+        self.assertEqual(self.index.top_k(1), [rect_small])
+        self.assertEqual(self.index.top_k(3, "синий"), [rect_small, square_big, square_small])
+        self.assertEqual(self.index.top_k(3, "красный"), [circle])
+        self.assertEqual(len(self.index), 4)
+
+        with self.assertRaises(KeyError):
+            self.index.remove(rect_big)
+
+    def test_resize_updates_index(self):
+        """Тест автоматического обновления индекса при изменении размеров и цвета"""
+        rect_small, square_big, circle, rect_big, square_small = self.figures
+        rect_small.width = 50
+        circle.radius = 0.1
+        square_small.color = "красный"
+        self.assertEqual(self.index.top_k(1), [rect_small])
+        self.assertEqual(self.index.area_range(0, 1), [circle])
+        self.assertEqual(self.index.top_k(5, "красный"), [rect_small, rect_big, square_small, circle])
+        self.assertEqual(self.index.top_k(5, "синий"), [square_big])
+
+        # Удаленная фигура больше не отслеживается
+        self.index.remove(rect_small)
+        rect_small.height = 100
+        self.assertNotIn(rect_small, self.index)
+        self.assertEqual(len(self.index), 4)
+
+    def test_resize_after_index_deleted(self):
+        """Тест, что индекс не удерживается фигурами"""
+        import gc
+        import weakref
+
+        ref = weakref.ref(self.index)
+        del self.index
+        gc.collect()
+        self.assertIsNone(ref())
+        self.figures[0].width = 7
+        self.assertEqual(self.figures[0].square(), 14)
+
+    def test_matches_linear_scan(self):
+        """Тест совпадения результатов индекса с полным перебором"""
+        figures = [Rectangle(i % 7 + 1, i % 5 + 1, "цвет_" + str(i % 3)) for i in range(200)]
+        index = FigureIndex(figures)
+        for figure in figures[::3]:
+            index.remove(figure)
+        remaining = [figure for figure in figures if figure in index]
+
+        expected = sorted((f for f in remaining if 5 <= f.square() <= 12), key=lambda f: f.square())
+        self.assertEqual([f.square() for f in index.area_range(5, 12)], [f.square() for f in expected])
+
+        reds = sorted((f.square() for f in remaining if f.color == "цвет_1"), reverse=True)
+        self.assertEqual([f.square() for f in index.top_k(10, "цвет_1")], reds[:10])
+
+
+class TestFigureCache(unittest.TestCase):
+    """Тесты кэширования площади и строкового представления"""
+
+    def test_disabled_by_default(self):
+        """Тест, что без включения кэш не создается"""
+        rect = Rectangle(2, 3, "синий")
+        repr(rect)
+        rect.square()
+        self.assertNotIn("_cache", vars(rect))
+
+    def test_cached_values(self):
+        """Тест, что повторные вызовы возвращают закэшированный результат"""
+        rect = Rectangle(2, 3, "синий")
+        rect.cache_enabled = True
+        self.assertIs(repr(rect), repr(rect))
+        self.assertEqual(rect.square(), 6)
+        self.assertIn("square", rect._cache)
+
+    def test_setters_invalidate(self):
+        """Тест сброса кэша при изменении размеров и цвета"""
+        figures = [Rectangle(2, 3, "синий"), Circle(1, "синий"), Square(2, "синий")]
+        for figure in figures:
+            figure.cache_enabled = True
+            repr(figure)
+
+        figures[0].height = 10
+        figures[1].radius = 2
+        figures[2].color_figure.color = "красный"
+
+        self.assertEqual(figures[0].square(), 20)
+        self.assertIn("Высота: 10", repr(figures[0]))
+        self.assertEqual(figures[1].square(), math.pi * 4)
+        self.assertIn("Радиус: 2", repr(figures[1]))
+        self.assertIn("Цвет: красный", repr(figures[2]))
+
+    def test_class_level_switch(self):
+        """Тест включения кэша для класса, компактные фигуры и представления не затрагиваются"""
+        Rectangle.cache_enabled = True
+        try:
+            square = Square(3.0, "синий")
+            self.assertEqual(repr(square), repr(Square(3.0, "синий")))
+            self.assertIn("_cache", vars(square))
+
+            compact = CompactSquare(3.0, "синий")
+            view = FigureBatch.from_figures([square])[0]
+            self.assertEqual(repr(compact), repr(square))
+            self.assertEqual(repr(view), repr(square))
+        finally:
+            Rectangle.cache_enabled = False
+
+
+class TestFigureStorage(unittest.TestCase):
+    """Тесты двоичного формата наборов фигур"""
+
+    def setUp(self):
+        """Настройка тестовых данных"""
+        self.figures = [
+            Rectangle(3.0, 4.0, "красный"),
+            Circle(5.0, "синий"),
+            Square(6.0, "красный"),
+        ]
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "scene.fig")
+
+    def test_round_trip(self):
+        """Тест записи и загрузки набора фигур"""
+        save_figures(self.figures, self.path)
+        with load_batch(self.path) as batch:
+            self.assertEqual(len(batch), 3)
+            self.assertEqual(batch.colors, ["красный", "синий"])
+            self.assertEqual([repr(view) for view in batch], [repr(f) for f in self.figures])
+            self.assertAlmostEqual(batch.total_area(), 12 + math.pi * 25 + 36, places=10)
+
+    def test_resave_mapped_batch(self):
+        """Тест повторной записи загруженного набора"""
+        save_figures(self.figures, self.path)
+        copy_path = self.path + ".copy"
+        with load_batch(self.path) as batch:
+            save_batch(batch, copy_path)
+        with open(self.path, "rb") as original, open(copy_path, "rb") as copy:
+            self.assertEqual(original.read(), copy.read())
+
+    def test_read_only(self):
+        """Тест, что загруженный набор нельзя изменить"""
+        save_figures(self.figures, self.path)
+        with load_batch(self.path) as batch:
+            with self.assertRaises(TypeError):
+                batch.add_circle(1.0, "синий")
+            with self.assertRaises(TypeError):
+                batch[0].width = 1.0
+
+    def test_invalid_file(self):
+        """Тест отказа загружать файл другого формата"""
+        with open(self.path, "wb") as f:
+            f.write(b"not a figure file at all, definitely")
+        with self.assertRaises(ValueError):
+            load_batch(self.path)
+
+
+class TestAggregate(unittest.TestCase):
+    """Тесты подсчета площадей по разделам"""
+
+    def setUp(self):
+        """Настройка тестовых данных"""
+        self.figures = [
+            Rectangle(i % 7 + 0.1, i % 5 + 0.3, "цвет_" + str(i % 4)) if i % 3 == 0 else
+            Circle(i % 11 * 0.01, "цвет_" + str(i % 3)) if i % 3 == 1 else
+            Square(i % 13 + 0.7, "цвет_" + str(i % 2))
+            for i in range(1000)
+        ]
+
+    def test_sums(self):
+        """Тест совпадения сумм с прямым подсчетом"""
+        result = aggregate(self.figures, partition_size=64)
+        self.assertAlmostEqual(result["total"], math.fsum(f.square() for f in self.figures), places=9)
+        self.assertAlmostEqual(result["by_kind"]["Круг"],
+                               math.fsum(f.square() for f in self.figures if isinstance(f, Circle)))
+        self.assertAlmostEqual(result["by_color"]["цвет_3"],
+                               math.fsum(f.square() for f in self.figures if f.color == "цвет_3"))
+        self.assertAlmostEqual(sum(result["by_kind"].values()), result["total"])
+
+    def test_independent_of_workers(self):
+        """Тест, что результат не зависит от количества процессов и вида набора"""
+        expected = aggregate(self.figures, workers=1, partition_size=100)
+        self.assertEqual(aggregate(self.figures, workers=2, partition_size=100), expected)
+        self.assertEqual(aggregate(FigureBatch.from_figures(self.figures), partition_size=100), expected)
+
+    def test_empty(self):
+        """Тест пустого набора"""
+        self.assertEqual(aggregate([]), {"total": 0.0, "by_kind": {}, "by_color": {}})
+
+
+class TestRender(unittest.TestCase):
+    """Тесты потокового вывода описаний фигур"""
+
+    def setUp(self):
+        """Настройка тестовых данных"""
+        self.figures = [
+            Rectangle(3.0, 4.0, "красный"),
+            Circle(5.0, "оранжевый"),
+            Square(6.0, "синий"),
+        ]
+
+    def test_plain(self):
+        """Тест вывода без цвета совпадает с repr"""
+        out = io.StringIO()
+        dump_figures(self.figures, out)
+        self.assertEqual(out.getvalue(), "".join(repr(f) + "\n" for f in self.figures))
+
+    def test_palette(self):
+        """Тест обрамления описаний кодами цвета, неизвестный цвет без кодов"""
+        rendered = list(render_figures(self.figures, Palette()))
+        self.assertTrue(rendered[0].startswith("\033[31m"))
+        self.assertTrue(rendered[0].endswith(RESET + "\n"))
+        self.assertEqual(rendered[1], repr(self.figures[1]) + "\n")
+
+    def test_batch_matches_objects(self):
+        """Тест, что вывод FigureBatch по столбцам совпадает с выводом объектов"""
+        batch = FigureBatch.from_figures(self.figures * 5)
+        for palette in (None, Palette()):
+            self.assertEqual(
+                "".join(render_figures(batch, palette, chunk_size=4)),
+                "".join(render_figures(list(batch), palette)),
+            )
+
+    def test_write_stream_buffers(self):
+        """Тест записи крупными блоками"""
+
+        class CountingStream(io.StringIO):
+            writes = 0
+
+            def write(self, text):
+                CountingStream.writes += 1
+                return super().write(text)
+
+        out = CountingStream()
+        written = write_stream(("x" * 10 for _ in range(100)), out, buffer_size=300)
+        self.assertEqual(written, 1000)
+        self.assertEqual(out.getvalue(), "x" * 1000)
+        self.assertEqual(CountingStream.writes, 4)
+
+
+class TestLazyImports(unittest.TestCase):
+    """Тесты ленивой загрузки модулей пакета"""
+
+    def loaded_modules(self, code: str) -> set:
+        """Выполняет код в отдельном интерпретаторе и возвращает загруженные модули"""
+        completed = subprocess.run(
+            [sys.executable, "-c", code + "\nimport sys\nprint(' '.join(sys.modules))"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True,
+        )
+        return set(completed.stdout.split())
+
+    def test_package_import_loads_no_submodules(self):
+        """Тест, что импорт пакета не загружает модули фигур"""
+        modules = self.loaded_modules("import lab_python_oop")
+        self.assertEqual({m for m in modules if m.startswith("lab_python_oop.")}, set())
+
+    def test_attribute_loads_only_its_module(self):
+        """Тест, что обращение к имени загружает только нужный модуль"""
+        modules = self.loaded_modules("import lab_python_oop\nlab_python_oop.Circle(1, 'синий')")
+        self.assertIn("lab_python_oop.circle", modules)
+        self.assertNotIn("lab_python_oop.rectangle", modules)
+        self.assertNotIn("lab_python_oop.batch", modules)
+
+    def test_main_import_skips_heavy_modules(self):
+        """Тест, что импорт main не загружает NumPy и colorama"""
+        modules = self.loaded_modules("import main")
+        self.assertNotIn("numpy", modules)
+        self.assertNotIn("colorama", modules)
+
+    def test_unknown_attribute(self):
+        """Тест ошибки при обращении к отсутствующему имени пакета"""
+        import lab_python_oop
+        with self.assertRaises(AttributeError):
+            lab_python_oop.NoSuchFigure
+
+
+class TestShapeRegistry(unittest.TestCase):
+    """Тесты реестра видов фигур"""
+
+    def setUp(self):
+        """Настройка тестовых данных"""
+        self.figures = [
+            Triangle(3.0, 4.0, "красный"),
+            Ellipse(2.0, 1.0, "синий"),
+            RegularPolygon(2.0, 6.0, "синий"),
+            Rectangle(1.0, 2.0, "зеленый"),
+            Circle(1.5, "красный"),
+            Square(2.5, "синий"),
+        ]
+
+    def test_new_figures(self):
+        """Тест площадей и вывода новых видов фигур"""
+        triangle, ellipse, polygon = self.figures[:3]
+        self.assertEqual(triangle.square(), 6.0)
+        self.assertAlmostEqual(ellipse.square(), 2 * math.pi)
+        self.assertAlmostEqual(polygon.square(), 6 * math.sqrt(3))
+        self.assertEqual(triangle.get_name(), "Треугольник")
+        self.assertIn("Основание: 3.0", repr(triangle))
+        self.assertIsInstance(polygon, Figure)
+
+        triangle.height = 10.0
+        self.assertEqual(triangle.square(), 15.0)
+
+    def test_batch_of_mixed_kinds(self):
+        """Тест хранения фигур всех видов в одном FigureBatch"""
+        # 12 копий - площади считаются через NumPy, одна копия - циклом
+        for copies in (1, 12):
+            figures = self.figures * copies
+            batch = FigureBatch.from_figures(figures)
+            for area, view, figure in zip(batch.areas(), batch, figures):
+                self.assertAlmostEqual(area, figure.square(), places=12)
+                self.assertIsInstance(view, type(figure))
+                self.assertEqual(repr(view), repr(figure))
+            self.assertEqual("".join(render_figures(batch)), "".join(render_figures(figures)))
+
+    def test_add_by_key(self):
+        """Тест добавления фигуры по имени вида"""
+        batch = FigureBatch()
+        batch.add("ellipse", 3.0, 2.0, "синий")
+        batch.add("square", 2.0, "синий")
+        self.assertAlmostEqual(batch.total_area(), 6 * math.pi + 4)
+        with self.assertRaises(TypeError):
+            batch.add("triangle", 1.0, "синий")
+        with self.assertRaises(KeyError):
+            batch.add("hexagram", 1.0, "синий")
+
+    def test_regular_polygon_sides(self):
+        """Тест проверки числа сторон правильного многоугольника"""
+        polygon = self.figures[2]
+        self.assertEqual(polygon.sides, 6)
+        self.assertIsInstance(polygon.sides, int)
+        self.assertIn("Число сторон: 6\n", repr(polygon))
+
+        batch = FigureBatch()
+        for sides in (0, 1, 2, 2.5, True):
+            with self.assertRaises(ValueError):
+                RegularPolygon(2.0, sides, "синий")
+            with self.assertRaises(ValueError):
+                batch.add("regular_polygon", 2.0, sides, "синий")
+        with self.assertRaises(ValueError):
+            polygon.sides = 2
+        self.assertEqual(polygon.sides, 6)
+        self.assertEqual(len(batch), 0)
+
+        batch.append(polygon)
+        self.assertIsInstance(batch[0].sides, int)
+        with self.assertRaises(ValueError):
+            batch[0].sides = 0
+        self.assertIn("Число сторон: 6\n", "".join(render_figures(batch)))
+
+    def test_keyword_arguments(self):
+        """Тест создания фигуры из реестра с именованными параметрами"""
+        triangle = Triangle(base=3.0, height=4.0, color="красный")
+        self.assertEqual(repr(triangle), repr(self.figures[0]))
+        self.assertEqual(repr(Triangle(3.0, color="красный", height=4.0)), repr(triangle))
+        with self.assertRaises(TypeError):
+            Triangle(base=3.0, color="красный")
+        with self.assertRaises(TypeError):
+            Triangle(3.0, 4.0, "красный", base=3.0)
+        with self.assertRaises(TypeError):
+            Triangle(3.0, 4.0, color="красный", side=1.0)
+
+    def test_aggregate_and_storage(self):
+        """Тест подсчета по видам и сохранения новых видов в файл"""
+        result = aggregate(self.figures)
+        self.assertEqual(result["by_kind"]["Треугольник"], 6.0)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "shapes.fig")
+            save_figures(self.figures, path)
+            with load_batch(path) as batch:
+                self.assertEqual([repr(view) for view in batch], [repr(f) for f in self.figures])
+
+    def test_register_shape(self):
+        """Тест регистрации собственного вида фигуры"""
+        @register_shape(200, "rhombus", "Ромб", (("d1", "Диагональ 1"), ("d2", "Диагональ 2")))
+        def rhombus_area(d1, d2, xp):
+            return 0.5 * d1 * d2
+
+        def unregister():
+            del shapes.SHAPES[200]
+            del shapes._SHAPES_BY_KEY["rhombus"]
+        self.addCleanup(unregister)
+
+        rhombus = shapes.shape_type("rhombus").figure_class(4.0, 5.0, "синий")
+        self.assertEqual(rhombus.square(), 10.0)
+        batch = FigureBatch.from_figures([rhombus] * 70)
+        self.assertEqual(batch.total_area(), 700.0)
+        self.assertEqual(batch[0].d2, 5.0)
+
+        with self.assertRaises(ValueError):
+            register_shape(200, "other", "Другой", (("a", "A"),))(rhombus_area)
+        with self.assertRaises(ValueError):
+            register_shape(201, "cube", "Куб", (("a", "A"), ("b", "B"), ("c", "C")))(rhombus_area)
+
+
 if __name__ == '__main__':
     # Запуск тестов с подробным выводом
     print("=" * 60)
@@ -257,7 +909,17 @@ if __name__ == '__main__':
         TestSquare,
         TestAbstractClass,
         TestFigurePolymorphism,
-        TestEdgeCases
+        TestEdgeCases,
+        TestFigureBatch,
+        TestCompactFigures,
+        TestColorRegistry,
+        TestFigureIndex,
+        TestFigureCache,
+        TestFigureStorage,
+        TestAggregate,
+        TestRender,
+        TestLazyImports,
+        TestShapeRegistry
     ]
 
     # Создаем тестовый набор
@@ -0,0 +1,193 @@
+"""
+Бенчмарки lab_python_fp
+
+pipeline - память цепочки f2 -> f3 -> f4 в обычном и ленивом режиме.
+Каждый режим запускается в отдельном процессе, чтобы пики памяти не
+влияли друг на друга. Выводится прирост пикового RSS процесса во время
+прохождения цепочки (без памяти на входные данные).
+
+unique - скорость Unique (элементов в секунду) по сравнению с прежней
+реализацией LegacyUnique.
+
+Запуск из корня репозитория:
+    python -m Lab_3.lab_python_fp.benchmark pipeline --count 10000000
+    python -m Lab_3.lab_python_fp.benchmark unique --count 1000000
+"""
+import argparse
+import itertools
+import random
+import resource
+import subprocess
+import sys
+import time
+
+from Lab_3.lab_python_fp.process_data import f2, f3, f4
+from Lab_3.lab_python_fp.unique import Unique
+
+# Количество записей по умолчанию
+DEFAULT_COUNT = 10_000_000
+
+# Количество различных профессий во входе бенчмарка unique
+UNIQUE_KEYS = 10_000
+
+# Профессии на входе цепочки: выходные данные f1 повторяются по кругу
+JOBS = [f"Программист {name}" for name in ("Python", "Java", "C++", "Go", "Rust")]
+JOBS += ["Аналитик данных", "Менеджер проекта"]
+
+
+def _max_rss_mb() -> float:
+    # На Linux ru_maxrss в килобайтах
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_pipeline(count: int, lazy: bool) -> dict:
+    """
+    Пропускает count записей через f2, f3 и f4 без вывода элементов
+
+    Args:
+        count: Количество записей
+        lazy: Ленивый режим стадий
+
+    Returns:
+        Словарь с количеством результатов, временем и приростом пикового RSS (МБ)
+    """
+    # Исходные функции без декоратора print_result: печать 10 млн строк
+    # заняла бы больше времени, чем сама цепочка
+    stage2, stage3, stage4 = f2.__wrapped__, f3.__wrapped__, f4.__wrapped__
+    data = itertools.islice(itertools.cycle(JOBS), count)
+
+    baseline = _max_rss_mb()
+    start = time.perf_counter()
+    result = stage4(stage3(stage2(data, lazy=lazy), lazy=lazy), lazy=lazy)
+    produced = sum(1 for _ in result)
+    elapsed = time.perf_counter() - start
+
+    return {
+        "count": produced,
+        "time": elapsed,
+        "peak_mb": _max_rss_mb() - baseline,
+    }
+
+
+def run_mode(count: int, mode: str) -> dict:
+    """Запускает режим в отдельном процессе и возвращает его результаты"""
+    output = subprocess.run(
+        [sys.executable, "-m", __spec__.name, "pipeline", "--count", str(count), "--mode", mode, "--child"],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    produced, elapsed, peak = output.split()
+    return {"count": int(produced), "time": float(elapsed), "peak_mb": float(peak)}
+
+
+class LegacyUnique:
+    """Прежняя реализация Unique: __next__ с циклом и try/except на каждый элемент"""
+    def __init__(self, items, **kwargs):
+        self.items = iter(items)
+        self.ignore_case = kwargs.get('ignore_case', False)
+        self.seen = set()
+        self.next_item = None
+
+    def __next__(self):
+        while True:
+            try:
+                item = next(self.items) if self.next_item is None else self.next_item
+                self.next_item = None
+
+                if self.ignore_case and isinstance(item, str):
+                    key = item.lower()
+                else:
+                    key = item
+
+                if key not in self.seen:
+                    self.seen.add(key)
+                    return item
+            except StopIteration:
+                raise StopIteration
+
+    def __iter__(self):
+        return self
+
+
+def _extend_chunks(data, chunk_size=10_000, **kwargs):
+    # Удаление дубликатов блоками через Unique.extend
+    unique = Unique(**kwargs)
+    result = []
+    for start in range(0, len(data), chunk_size):
+        result.extend(unique.extend(data[start:start + chunk_size]))
+    return result
+
+
+def run_unique(count: int, repeat: int = 3) -> dict:
+    """
+    Скорость удаления дубликатов из count профессий
+
+    Returns:
+        Словарь: название варианта -> элементов в секунду (лучшее из repeat)
+    """
+    names = [f"Программист {i}" for i in range(UNIQUE_KEYS)]
+    data = [random.choice(names).upper() if random.random() < 0.5 else random.choice(names)
+            for _ in range(count)]
+    variants = {
+        "LegacyUnique": lambda: list(LegacyUnique(data)),
+        "Unique": lambda: list(Unique(data)),
+        "Unique.extend": lambda: _extend_chunks(data),
+        "LegacyUnique(ignore_case)": lambda: list(LegacyUnique(data, ignore_case=True)),
+        "Unique(ignore_case)": lambda: list(Unique(data, ignore_case=True)),
+        "Unique.extend(ignore_case)": lambda: _extend_chunks(data, ignore_case=True),
+    }
+    expected = {False: list(LegacyUnique(data)), True: list(LegacyUnique(data, ignore_case=True))}
+
+    results = {}
+    for name, run in variants.items():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = run()
+            best = min(best, time.perf_counter() - start)
+        if result != expected["ignore_case" in name]:
+            raise AssertionError(f"{name}: результат отличается от LegacyUnique")
+        results[name] = count / best
+    return results
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    """Разбирает аргументы командной строки"""
+    parser = argparse.ArgumentParser(description="Бенчмарки lab_python_fp")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    pipeline = commands.add_parser("pipeline", help="Память обычной и ленивой цепочки обработки")
+    pipeline.add_argument("--count", type=int, default=DEFAULT_COUNT, help="Количество записей")
+    pipeline.add_argument("--mode", choices=("eager", "lazy", "both"), default="both")
+    pipeline.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+
+    unique = commands.add_parser("unique", help="Скорость Unique по сравнению с прежней реализацией")
+    unique.add_argument("--count", type=int, default=1_000_000, help="Количество элементов")
+    unique.add_argument("--repeat", type=int, default=3, help="Количество повторов")
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None):
+    """Точка входа бенчмарков"""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    if args.command == "unique":
+        print(f"Удаление дубликатов из {args.count:,} элементов ({UNIQUE_KEYS:,} различных):")
+        for name, rate in run_unique(args.count, args.repeat).items():
+            print(f"  {name:>28}: {rate / 1e6:.2f} млн элементов/с")
+        return
+
+    if args.child:
+        result = run_pipeline(args.count, args.mode == "lazy")
+        print(result["count"], result["time"], result["peak_mb"])
+        return
+
+    modes = ("eager", "lazy") if args.mode == "both" else (args.mode,)
+    print(f"Записей: {args.count:,}")
+    for mode in modes:
+        result = run_mode(args.count, mode)
+        print(f"  {mode:>5}: результатов {result['count']:,}, "
+              f"{result['time']:.2f} с, пик памяти +{result['peak_mb']:.1f} МБ")
+
+
+if __name__ == "__main__":
+    main()
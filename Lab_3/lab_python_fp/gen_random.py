@@ -7,12 +7,16 @@ def gen_random(num_count, begin, end):
 
     Args:
         num_count: Количество случайных чисел для генерации
+                   (None - бесконечный поток, например для zip с другим потоком)
         begin: Нижняя граница диапазона (включительно)
         end: Верхняя граница диапазона (включительно)
 
     Yields:
         Случайное целое число в диапазоне [begin, end]
     """
+    if num_count is None:
+        while True:
+            yield random.randint(begin, end)
     for _ in range(num_count):
         yield random.randint(begin, end)
 
@@ -46,7 +50,12 @@ def test_gen_random():
     result = list(gen_random(0, 1, 10))
     print(f"     {result}")
 
-    print("\n6. Проверка работы как генератора (по одному числу):")
+    print("\n6. Бесконечный поток (num_count=None), первые 4 числа:")
+    print("   zip('abcd', gen_random(None, 1, 9)) ->")
+    result = list(zip('abcd', gen_random(None, 1, 9)))
+    print(f"     {result}")
+
+    print("\n7. Проверка работы как генератора (по одному числу):")
     print("   for num in gen_random(3, 10, 15):")
     for num in gen_random(3, 10, 15):
         print(f"     {num}")
@@ -0,0 +1,241 @@
+# lab_python_fp/json_stream.py
+import json
+import os
+
+# Размер одного чтения из файла (символов)
+CHUNK_SIZE = 1 << 16
+
+# Расширения файлов, в которых каждая строка - отдельный JSON-объект
+NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+
+_WHITESPACE = ' \t\n\r'
+
+# Символы, которыми может продолжаться число после прочитанной части
+_NUMBER_TAIL = '0123456789.eE+-'
+
+
+def iter_json_array(f, chunk_size=CHUNK_SIZE):
+    """
+    Генератор элементов JSON-массива из текстового потока.
+
+    Файл читается блоками по chunk_size символов, в памяти находится
+    только текущий блок и разбираемый элемент, а не весь массив.
+
+    Args:
+        f: Текстовый поток, содержащий JSON-массив
+        chunk_size: Размер одного чтения
+
+    Yields:
+        Элементы массива по одному
+
+    Raises:
+        ValueError: Если поток не содержит корректный JSON-массив или после
+                    массива есть что-то кроме пробелов (как у json.load)
+    """
+    decoder = json.JSONDecoder()
+    buffer = ''
+    pos = 0
+    eof = False
+
+    def fill(size):
+        # Дочитывает поток, отбрасывая уже разобранное начало буфера
+        nonlocal buffer, pos, eof
+        chunk = f.read(size)
+        if not chunk:
+            eof = True
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
+    def skip_whitespace():
+        # Пропускает пробелы, при необходимости дочитывая поток
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or eof:
+                return
+            fill(chunk_size)
+
+    def check_end():
+        # После закрывающей скобки до конца потока допустимы только пробелы
+        nonlocal pos
+        pos += 1
+        skip_whitespace()
+        if pos < len(buffer):
+            raise ValueError(f"Лишние данные после JSON-массива: {buffer[pos]!r}")
+
+    skip_whitespace()
+    if pos >= len(buffer) or buffer[pos] != '[':
+        raise ValueError("Ожидается JSON-массив")
+    pos += 1
+
+    skip_whitespace()
+    if pos < len(buffer) and buffer[pos] == ']':
+        check_end()
+        return
+
+    while True:
+        # Элемент принимается, только если он целиком в буфере: число,
+        # обрезанное границей блока ("-9." из "-9.5e3"), тоже разбирается успешно
+        size = chunk_size
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise ValueError(f"Некорректный JSON рядом с символом {pos}") from None
+            else:
+                if eof or (end < len(buffer) and buffer[end] not in _NUMBER_TAIL):
+                    break
+            fill(size)
+            size *= 2
+        pos = end
+        yield item
+
+        skip_whitespace()
+        if pos >= len(buffer):
+            raise ValueError("JSON-массив не закрыт")
+        if buffer[pos] == ']':
+            check_end()
+            return
+        if buffer[pos] != ',':
+            raise ValueError(f"Ожидается ',' или ']' вместо {buffer[pos]!r}")
+        pos += 1
+        skip_whitespace()
+
+
+def iter_ndjson(f):
+    """
+    Генератор записей из потока NDJSON (по одному JSON-объекту в строке).
+
+    Args:
+        f: Текстовый поток
+
+    Yields:
+        Записи по одной, пустые строки пропускаются
+    """
+    for number, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Некорректный JSON в строке {number}: {e.msg}") from None
+
+
+def detect_format(f, path=''):
+    """
+    Определяет формат файла: 'array' для JSON-массива или 'ndjson'.
+
+    Формат определяется по расширению, а без него - по первому
+    непробельному символу. Позиция потока не меняется.
+    """
+    if path.lower().endswith(NDJSON_EXTENSIONS):
+        return 'ndjson'
+    position = f.tell()
+    first = ''
+    while True:
+        chunk = f.read(1)
+        if not chunk or chunk not in _WHITESPACE:
+            first = chunk
+            break
+    f.seek(position)
+    return 'array' if first == '[' else 'ndjson'
+
+
+def iter_records(path, fmt=None, chunk_size=CHUNK_SIZE):
+    """
+    Генератор записей из файла с JSON-массивом или NDJSON.
+
+    Файл открывается при первом запросе записи и закрывается, когда
+    записи закончились или генератор закрыт.
+
+    Args:
+        path: Путь к файлу
+        fmt: 'array', 'ndjson' или None для автоопределения
+        chunk_size: Размер одного чтения для JSON-массива
+
+    Yields:
+        Записи по одной
+    """
+    with open(path, encoding='utf-8-sig') as f:
+        fmt = fmt or detect_format(f, os.fspath(path))
+        if fmt == 'array':
+            yield from iter_json_array(f, chunk_size)
+        elif fmt == 'ndjson':
+            yield from iter_ndjson(f)
+        else:
+            raise ValueError(f"Неизвестный формат: {fmt}")
+
+
+class CountingIterator:
+    """
+    Итератор-обертка, считающий выданные элементы.
+
+    Позволяет узнать количество записей потока после его обработки,
+    не загружая записи в список ради len().
+    """
+    def __init__(self, items):
+        self.items = iter(items)
+        self.count = 0
+
+    def __next__(self):
+        item = next(self.items)
+        self.count += 1
+        return item
+
+    def __iter__(self):
+        return self
+
+
+def test_json_stream():
+    """Тестирование потокового чтения JSON"""
+    import io
+
+    print("Тестирование потокового чтения JSON...")
+
+    records = [{"job-name": "Программист Python", "salary": i} for i in range(5)]
+    text = json.dumps(records, ensure_ascii=False, indent=2)
+
+    print("\n1. JSON-массив, чтение блоками по 7 символов:")
+    result = list(iter_json_array(io.StringIO(text), chunk_size=7))
+    print(f"   совпадает с json.loads: {result == json.loads(text)}")
+
+    print("\n2. Числа на границе блоков:")
+    result = list(iter_json_array(io.StringIO("[12345, 678, -9.5e3]"), chunk_size=3))
+    print(f"   {result}")
+
+    print("\n3. Пустой массив:")
+    print(f"   {list(iter_json_array(io.StringIO('  [ ]  ')))}")
+
+    print("\n4. NDJSON:")
+    ndjson = "\n".join(json.dumps(record, ensure_ascii=False) for record in records[:2])
+    print(f"   {list(iter_ndjson(io.StringIO(ndjson + chr(10) + chr(10))))}")
+
+    print("\n5. Автоопределение формата:")
+    print(f"   массив -> {detect_format(io.StringIO(text))}, NDJSON -> {detect_format(io.StringIO(ndjson))}")
+
+    print("\n6. Незакрытый массив:")
+    try:
+        list(iter_json_array(io.StringIO('[{"a": 1}, {"b": 2}'), chunk_size=4))
+    except ValueError as e:
+        print(f"   ValueError: {e}")
+
+    print("\n7. Лишние данные после массива:")
+    for tail in ('[1]]', '[1] garbage', '[]x'):
+        try:
+            list(iter_json_array(io.StringIO(tail), chunk_size=2))
+        except ValueError as e:
+            print(f"   {tail!r}: ValueError: {e}")
+
+    print("\n8. Подсчет записей потока:")
+    counter = CountingIterator(iter_json_array(io.StringIO(text)))
+    for _ in counter:
+        pass
+    print(f"   записей: {counter.count}")
+
+
+# Для тестирования при запуске файла напрямую
+if __name__ == "__main__":
+    test_json_stream()
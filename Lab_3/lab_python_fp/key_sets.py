@@ -0,0 +1,302 @@
+# lab_python_fp/key_sets.py
+import math
+import os
+import pickle
+import shutil
+import tempfile
+import weakref
+from collections import OrderedDict
+
+# Количество ключей в памяти по умолчанию, после которого SpillingSet пишет на диск
+MAX_KEYS = 1_000_000
+
+# Количество файлов-разделов SpillingSet по умолчанию
+PARTITIONS = 64
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(value):
+    """Перемешивание битов 64-битного числа (splitmix64)"""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+class SpillingSet:
+    """
+    Множество с ограниченной памятью и хранением ключей на диске.
+
+    Пока ключей не больше max_keys, они хранятся в обычном set. После
+    превышения все ключи раскладываются по хешу в partitions файлов во
+    временном каталоге. Для проверки ключа загружается его раздел; в
+    памяти держатся недавно использованные разделы, пока в них в сумме
+    не больше max_keys ключей. Новые ключи дописываются в конец файла.
+
+    Проверка по одному ключу загружает раздел почти на каждый ключ,
+    поэтому для потоков используется add_batch: ключи блока группируются
+    по разделам, и каждый раздел загружается не больше одного раза на блок.
+
+    Точность не теряется: ответ тот же, что у set. Память ограничена,
+    пока каждый раздел меньше max_keys, то есть для примерно
+    partitions * max_keys ключей.
+
+    Ключи должны поддерживать hash() и pickle. Равные ключи (1, 1.0,
+    True) считаются одним ключом, как в set.
+    """
+    def __init__(self, max_keys=MAX_KEYS, partitions=PARTITIONS, directory=None):
+        """
+        Args:
+            max_keys: Наибольшее количество ключей в памяти
+            partitions: Количество файлов-разделов на диске
+            directory: Каталог для временных файлов (по умолчанию системный)
+        """
+        if max_keys < 1 or partitions < 1:
+            raise ValueError("max_keys и partitions должны быть положительными")
+        self.max_keys = max_keys
+        self.partitions = partitions
+        self.directory = directory
+        self.path = None
+        self._memory = set()
+        self._loaded = OrderedDict()
+        self._loaded_keys = 0
+        self._count = 0
+
+    @property
+    def spilled(self):
+        """Ключи перенесены на диск"""
+        return self.path is not None
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, key):
+        if self.path is None:
+            return key in self._memory
+        return key in self._partition(hash(key) % self.partitions)
+
+    def add(self, key):
+        """Добавляет ключ в множество"""
+        self.add_batch([key])
+
+    def add_batch(self, keys):
+        """
+        Добавляет ключи блока и сообщает, какие из них новые.
+
+        Args:
+            keys: Список ключей
+
+        Returns:
+            Список bool той же длины: True для первого вхождения ключа,
+            которого не было в множестве
+        """
+        if self.path is None:
+            memory = self._memory
+            result = []
+            for key in keys:
+                new = key not in memory
+                if new:
+                    memory.add(key)
+                result.append(new)
+            self._count = len(memory)
+            if len(memory) > self.max_keys:
+                self._spill()
+            return result
+
+        # Номера ключей блока по разделам
+        groups = {}
+        for position, key in enumerate(keys):
+            groups.setdefault(hash(key) % self.partitions, []).append(position)
+
+        result = [False] * len(keys)
+        for index, positions in groups.items():
+            loaded = self._partition(index)
+            added = []
+            for position in positions:
+                key = keys[position]
+                if key not in loaded:
+                    loaded.add(key)
+                    added.append(key)
+                    result[position] = True
+            if added:
+                self._loaded_keys += len(added)
+                self._count += len(added)
+                self._append(index, added)
+                self._evict(keep=index)
+        return result
+
+    def _file(self, index):
+        return os.path.join(self.path, f"{index}.bin")
+
+    def _append(self, index, keys):
+        # Файл раздела - последовательность pickle-списков ключей
+        with open(self._file(index), 'ab') as f:
+            pickle.dump(keys, f, pickle.HIGHEST_PROTOCOL)
+
+    def _spill(self):
+        # Раскладывает ключи из памяти по файлам разделов
+        self.path = tempfile.mkdtemp(prefix="unique-", dir=self.directory)
+        # Каталог удаляется и без close(), когда множество собрано сборщиком мусора
+        self._cleanup = weakref.finalize(self, shutil.rmtree, self.path, ignore_errors=True)
+        groups = [[] for _ in range(self.partitions)]
+        for key in self._memory:
+            groups[hash(key) % self.partitions].append(key)
+        self._memory = set()
+        for index, keys in enumerate(groups):
+            self._append(index, keys)
+
+    def _partition(self, index):
+        # Множество ключей раздела: из памяти или загруженное из файла
+        keys = self._loaded.get(index)
+        if keys is not None:
+            self._loaded.move_to_end(index)
+            return keys
+
+        keys = set()
+        with open(self._file(index), 'rb') as f:
+            while True:
+                try:
+                    keys.update(pickle.load(f))
+                except EOFError:
+                    break
+        self._loaded[index] = keys
+        self._loaded_keys += len(keys)
+        self._evict(keep=index)
+        return keys
+
+    def _evict(self, keep):
+        # Выгружает давно использованные разделы, пока ключей в памяти больше max_keys
+        while self._loaded_keys > self.max_keys and len(self._loaded) > 1:
+            index = next(iter(self._loaded))
+            if index == keep:
+                self._loaded.move_to_end(index)
+                continue
+            self._loaded_keys -= len(self._loaded.pop(index))
+
+    def close(self):
+        """Удаляет временные файлы и очищает множество"""
+        if self.path is not None:
+            self._cleanup()
+            self.path = None
+        self._memory = set()
+        self._loaded.clear()
+        self._loaded_keys = 0
+        self._count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class BloomFilter:
+    """
+    Фильтр Блума: приближенное множество фиксированного размера.
+
+    Ответ "нет" всегда точный, ответ "да" ошибочен с вероятностью около
+    error_rate, пока добавлено не больше capacity ключей (дальше
+    вероятность ошибки растет). Память - около 1.2 байта на ключ
+    при error_rate=0.01, сами ключи не хранятся.
+
+    Позиции битов вычисляются из hash(key), поэтому равные ключи (1, 1.0,
+    True) считаются одним ключом, как в set.
+    """
+    def __init__(self, capacity, error_rate=0.01):
+        """
+        Args:
+            capacity: Ожидаемое количество ключей
+            error_rate: Допустимая вероятность ложного "да" (0 < error_rate < 1)
+        """
+        if capacity < 1:
+            raise ValueError("capacity должно быть положительным")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate должно быть между 0 и 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # Оптимальные размер в битах и количество хеш-функций
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+
+    def _positions(self, key):
+        # Двойное хеширование: позиции h1 + i * h2, где h1 и h2 - половины
+        # перемешанного hash(key)
+        value = _mix64(hash(key) & _MASK64)
+        first, second = value & 0xFFFFFFFF, (value >> 32) | 1
+        size = self.size
+        return [position % size for position in range(first, first + self.hash_count * second, second)]
+
+    def __contains__(self, key):
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def add(self, key):
+        """Добавляет ключ в фильтр"""
+        self.add_batch([key])
+
+    def add_batch(self, keys):
+        """
+        Добавляет ключи блока и сообщает, какие из них новые.
+
+        Проверка и добавление делаются за одно вычисление позиций битов.
+
+        Args:
+            keys: Список ключей
+
+        Returns:
+            Список bool той же длины: True, если хотя бы один бит ключа
+            не был установлен (ключ точно новый)
+        """
+        bits = self.bits
+        result = []
+        for key in keys:
+            added = False
+            for position in self._positions(key):
+                byte, mask = position >> 3, 1 << (position & 7)
+                if not bits[byte] & mask:
+                    bits[byte] |= mask
+                    added = True
+            result.append(added)
+        self._count += sum(result)
+        return result
+
+    def __len__(self):
+        """Количество добавленных различных ключей (приближенно, не больше точного)"""
+        return self._count
+
+
+def test_key_sets():
+    """Тестирование SpillingSet и BloomFilter"""
+    import random
+
+    print("Тестирование множеств с ограниченной памятью...")
+
+    print("\n1. SpillingSet: 10 000 ключей блоками по 1000, в памяти не больше 500:")
+    keys = [random.randint(0, 5000) for _ in range(10000)]
+    with SpillingSet(max_keys=500, partitions=32) as seen:
+        result = []
+        for start in range(0, len(keys), 1000):
+            block = keys[start:start + 1000]
+            result.extend(key for key, new in zip(block, seen.add_batch(block)) if new)
+        print(f"   перенесено на диск: {seen.spilled}")
+        print(f"   совпадает с set: {result == list(dict.fromkeys(keys))}, ключей: {len(seen)}")
+        print(f"   ключей в памяти: {seen._loaded_keys} (не больше {seen.max_keys}"
+              f" + размер одного раздела)")
+
+    print("\n2. BloomFilter: 100 000 ключей, error_rate=0.01:")
+    bloom = BloomFilter(100000, error_rate=0.01)
+    for key in range(100000):
+        bloom.add(f"key-{key}")
+    missing = all(f"key-{key}" in bloom for key in range(100000))
+    false_positives = sum(f"other-{key}" in bloom for key in range(100000))
+    print(f"   все добавленные найдены: {missing}")
+    print(f"   ложных срабатываний: {false_positives / 100000:.3%}")
+    print(f"   размер: {len(bloom.bits):,} байт, хеш-функций: {bloom.hash_count}")
+
+
+# Для тестирования при запуске файла напрямую
+if __name__ == "__main__":
+    test_key_sets()
@@ -0,0 +1,331 @@
+# lab_python_fp/parallel_unique.py
+import heapq
+import multiprocessing
+import numbers
+import os
+import queue
+import zlib
+from itertools import islice
+
+from Lab_3.lab_python_fp.unique import Unique, chunk_keys
+
+# Количество элементов в одном блоке, передаваемом между процессами
+CHUNK_SIZE = 10_000
+
+# Как часто (в секундах) ожидание очереди проверяет, что процессы живы
+POLL_INTERVAL = 0.5
+
+_MASK64 = (1 << 64) - 1
+
+# Типы ключей, которые stable_hash поддерживает всегда: их не нужно проверять
+_PLAIN_KEY_TYPES = frozenset({str, bytes, int, float, bool, type(None)})
+
+
+def stable_hash(key):
+    """
+    Хеш ключа, одинаковый во всех процессах при любом способе их запуска.
+
+    hash() строк, bytes, None и кортежей с ними зависит от процесса
+    (PYTHONHASHSEED), поэтому строки и bytes хешируются через crc32, а
+    кортежи и frozenset - по хешам элементов. Для чисел используется
+    hash(): он не зависит от процесса и совпадает у равных чисел (1, 1.0,
+    True), как того требует сравнение ключей.
+
+    Raises:
+        TypeError: Для ключей других типов
+    """
+    if isinstance(key, str):
+        return zlib.crc32(key.encode('utf-8', 'surrogatepass'))
+    if isinstance(key, bytes):
+        return zlib.crc32(key)
+    if isinstance(key, numbers.Number):
+        return hash(key) & _MASK64
+    if key is None:
+        return 0
+    if isinstance(key, tuple):
+        value = 0x345678
+        for item in key:
+            value = ((value * 1000003) ^ stable_hash(item)) & _MASK64
+        return value ^ len(key)
+    if isinstance(key, frozenset):
+        # Порядок элементов множества зависит от процесса, поэтому сумма
+        return (sum(stable_hash(item) for item in key) + len(key)) & _MASK64
+    raise TypeError(f"parallel_unique не поддерживает ключи типа {type(key).__name__}: "
+                    "нужны str, bytes, числа, None или кортежи и frozenset из них")
+
+
+def partition_of(key, partitions):
+    """Номер раздела ключа, одинаковый во всех процессах"""
+    return stable_hash(key) % partitions
+
+
+def _map_worker(tasks, reducers, ignore_case):
+    """
+    Процесс разбиения: раскладывает блоки входа по разделам.
+
+    Внутри блока дубликаты удаляются сразу (остается первое вхождение),
+    поэтому в разделы передаются только уникальные в блоке ключи. Раздел
+    получает столбцы (номера, элементы), ключи он вычисляет сам.
+
+    Ошибка обработки передается в разделы и дальше вызывающему коду;
+    оставшиеся блоки после нее только вычитываются из очереди.
+    """
+    count = len(reducers)
+    error = None
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        if error is not None:
+            continue
+        try:
+            start, items = task
+            keys = chunk_keys(items, ignore_case)
+            # Словарь из обратного порядка оставляет для ключа наименьший номер
+            first = dict(zip(reversed(keys), range(start + len(items) - 1, start - 1, -1)))
+
+            groups = [([], []) for _ in range(count)]
+            for key, seq in first.items():
+                seqs, group_items = groups[partition_of(key, count)]
+                seqs.append(seq)
+                group_items.append(items[seq - start])
+        except Exception as e:
+            error = e
+            continue
+        for queue, group in zip(reducers, groups):
+            if group[0]:
+                queue.put(group)
+
+    for queue in reducers:
+        if error is not None:
+            queue.put(error)
+        queue.put(None)
+
+
+def _reduce_worker(inbox, outbox, mappers, ignore_case, chunk_size):
+    """
+    Процесс удаления дубликатов одного раздела.
+
+    Для каждого ключа хранится вхождение с наименьшим порядковым номером:
+    блоки приходят от разных процессов в произвольном порядке. После
+    окончания входа вхождения отправляются блоками по возрастанию номера.
+    """
+    first = {}
+    error = None
+    finished = 0
+    while finished < mappers:
+        group = inbox.get()
+        if group is None:
+            finished += 1
+            continue
+        if isinstance(group, Exception):
+            error = group
+            continue
+        seqs, items = group
+        for key, seq, item in zip(chunk_keys(items, ignore_case), seqs, items):
+            known = first.get(key)
+            if known is None or seq < known[0]:
+                first[key] = (seq, item)
+
+    if error is not None:
+        outbox.put(error)
+        return
+    result = sorted(first.values(), key=lambda entry: entry[0])
+    for start in range(0, len(result), chunk_size):
+        outbox.put(result[start:start + chunk_size])
+    outbox.put(None)
+
+
+def _check_workers(processes):
+    """
+    Проверяет, что ни один процесс не завершился аварийно
+
+    Raises:
+        RuntimeError: Если процесс завершился с ненулевым кодом (например,
+                      убит из-за нехватки памяти или не смог запуститься)
+    """
+    for process in processes:
+        if process.exitcode:
+            raise RuntimeError(f"Процесс {process.name} завершился с кодом {process.exitcode}, "
+                               "часть данных потеряна")
+
+
+def _put(tasks, item, processes):
+    # Помещает элемент в очередь, пока процессы живы
+    while True:
+        try:
+            tasks.put(item, timeout=POLL_INTERVAL)
+            return
+        except queue.Full:
+            _check_workers(processes)
+
+
+def _drain(outbox, processes):
+    # Генератор элементов из блоков очереди до метки конца None; переданная
+    # из процесса ошибка выбрасывается, как и завершение процесса с ошибкой
+    while True:
+        try:
+            chunk = outbox.get(timeout=POLL_INTERVAL)
+        except queue.Empty:
+            _check_workers(processes)
+            continue
+        if chunk is None:
+            return
+        if isinstance(chunk, Exception):
+            raise chunk
+        yield from chunk
+
+
+def parallel_unique(items, workers=None, ignore_case=False, ordered=True, chunk_size=CHUNK_SIZE,
+                    start_method=None):
+    """
+    Удаление дубликатов в нескольких процессах.
+
+    Вход читается блоками с порядковыми номерами элементов. Процессы
+    разбиения вычисляют ключи и раскладывают элементы по разделам по хешу
+    ключа, процессы разделов удаляют дубликаты каждый в своем разделе.
+    Результаты разделов объединяются по порядковым номерам.
+
+    Результат тот же, что у Unique (с ignore_case ключ - item.lower()),
+    но элементы выдаются только после чтения всего входа.
+
+    Args:
+        items: Итерируемый объект
+        workers: Количество разделов и процессов разбиения (по умолчанию
+                 количество ядер; 1 - Unique в текущем процессе)
+        ignore_case: Сравнивать строки без учета регистра
+        ordered: Сохранять порядок первых вхождений (иначе элементы
+                 выдаются по разделам)
+        chunk_size: Количество элементов в блоке между процессами
+        start_method: Способ запуска процессов ('fork', 'spawn',
+                      'forkserver'; по умолчанию способ multiprocessing)
+
+    Yields:
+        Первые вхождения элементов
+
+    Raises:
+        TypeError: Если ключ не поддерживается stable_hash
+        RuntimeError: Если процесс завершился аварийно
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        yield from Unique(items, ignore_case=ignore_case)
+        return
+
+    context = multiprocessing.get_context(start_method)
+    tasks = context.Queue(maxsize=2 * workers)
+    inboxes = [context.Queue(maxsize=2 * workers) for _ in range(workers)]
+    outboxes = [context.Queue() for _ in range(workers)]
+    processes = [context.Process(target=_map_worker, args=(tasks, inboxes, ignore_case), daemon=True)
+                 for _ in range(workers)]
+    processes += [context.Process(target=_reduce_worker,
+                                          args=(inbox, outbox, workers, ignore_case, chunk_size), daemon=True)
+                  for inbox, outbox in zip(inboxes, outboxes)]
+    for process in processes:
+        process.start()
+
+    try:
+        iterator = iter(items)
+        start = 0
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            # Ключи проверяются до отправки: блок, который не удалось
+            # сериализовать, очередь пропустила бы без ошибки
+            for key in chunk_keys(chunk, ignore_case):
+                if type(key) not in _PLAIN_KEY_TYPES:
+                    stable_hash(key)
+            _put(tasks, (start, chunk), processes)
+            start += len(chunk)
+        for _ in range(workers):
+            _put(tasks, None, processes)
+
+        streams = [_drain(outbox, processes) for outbox in outboxes]
+        if ordered:
+            for _, item in heapq.merge(*streams, key=lambda entry: entry[0]):
+                yield item
+        else:
+            for stream in streams:
+                for _, item in stream:
+                    yield item
+
+        for process in processes:
+            process.join()
+    finally:
+        # Перебор прерван или вход выбросил исключение
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+
+
+class _KillWorker:
+    """Вход демонстрации: после первого блока завершает процесс разбиения по SIGKILL"""
+
+    def __iter__(self):
+        import signal
+        import time
+
+        yield from ('a', 'b')
+        for child in multiprocessing.active_children():
+            os.kill(child.pid, signal.SIGKILL)
+            break
+        time.sleep(POLL_INTERVAL)
+        yield from ('c', 'd')
+
+
+def test_parallel_unique():
+    """Тестирование параллельного удаления дубликатов"""
+    import random
+    import time
+
+    print("Тестирование parallel_unique...")
+
+    print("\n1. Строки с ignore_case=True, 2 процесса:")
+    data = ['Python', 'python', 'Java', 'Go', 'GO', 'Rust', 'C', 'java', 'rust', 'Kotlin']
+    print(f"   data = {data}")
+    result = list(parallel_unique(data, workers=2, ignore_case=True, chunk_size=3))
+    print(f"   parallel_unique(data, workers=2, ignore_case=True) -> {result}")
+    print(f"   совпадает с Unique: {result == list(Unique(data, ignore_case=True))}")
+
+    print("\n2. Без сохранения порядка:")
+    result = list(parallel_unique(data, workers=2, ignore_case=True, ordered=False, chunk_size=3))
+    print(f"   {sorted(result)}")
+
+    print("\n3. Ключи разных типов, процессы запускаются через spawn:")
+    keys = ['a', 'A', b'x', None, 1, 1.0, True, ('a', 'B'), ('a', b'x'), frozenset({'q', 'w'}), 2.5]
+    data = [random.choice(keys) for _ in range(2000)]
+    for ignore_case in (False, True):
+        result = list(parallel_unique(data, workers=3, ignore_case=ignore_case, chunk_size=50,
+                                      start_method='spawn'))
+        expected = list(Unique(data, ignore_case=ignore_case))
+        print(f"   ignore_case={ignore_case}: совпадает с Unique: {result == expected}")
+
+    print("\n4. Неподдерживаемый тип ключа (в том числе внутри кортежа):")
+    for data in ([1, 2, object()], [1, 2, 3, (lambda: 0,)]):
+        try:
+            list(parallel_unique(data, workers=2))
+        except TypeError as e:
+            print(f"   TypeError: {e}")
+
+    print("\n5. Процесс завершился аварийно:")
+    try:
+        list(parallel_unique(_KillWorker(), workers=2, chunk_size=2))
+    except RuntimeError as e:
+        print(f"   RuntimeError: {e}")
+
+    print("\n6. 1 000 000 профессий, 20 000 различных:")
+    data = [f"Программист {random.randint(0, 20000)}" for _ in range(1_000_000)]
+    start = time.perf_counter()
+    expected = list(Unique(data, ignore_case=True))
+    print(f"   Unique: {time.perf_counter() - start:.2f} с")
+    for workers in (2, os.cpu_count() or 1):
+        start = time.perf_counter()
+        result = list(parallel_unique(data, workers=workers, ignore_case=True))
+        print(f"   parallel_unique(workers={workers}): {time.perf_counter() - start:.2f} с, "
+              f"совпадает: {result == expected}")
+
+
+# Для тестирования при запуске файла напрямую
+if __name__ == "__main__":
+    test_parallel_unique()
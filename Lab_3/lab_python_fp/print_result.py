@@ -1,3 +1,6 @@
+import functools
+
+
 def print_result(func):
     """
     Декоратор для вывода результата выполнения функции.
@@ -5,8 +8,12 @@ def print_result(func):
     Выводит имя функции и результат её выполнения.
     Для list выводит элементы в столбик.
     Для dict выводит пары ключ=значение в столбик.
+    Для итераторов (генераторов, map, filter) выводит имя сразу, а элементы -
+    по мере их получения: возвращается генератор, который печатает каждый
+    элемент и передает его дальше, не собирая результат в список.
     Для других типов выводит значение как есть.
     """
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
         # Выполняем оригинальную функцию
         result = func(*args, **kwargs)
@@ -21,6 +28,8 @@ def print_result(func):
         elif isinstance(result, dict):
             for key, value in result.items():
                 print(f"{key} = {value}")
+        elif hasattr(result, '__next__'):
+            return _print_items(result)
         else:
             print(result)
 
@@ -30,6 +39,13 @@ def print_result(func):
     return wrapper
 
 
+def _print_items(items):
+    """Генератор, выводящий каждый элемент по мере прохождения"""
+    for item in items:
+        print(item)
+        yield item
+
+
 @print_result
 def test_1():
     return 1
@@ -50,6 +66,11 @@ def test_4():
     return [1, 2]
 
 
+@print_result
+def test_5():
+    return (x * x for x in range(3))
+
+
 if __name__ == '__main__':
     print('!!!!!!!!')
 
@@ -58,3 +79,7 @@ if __name__ == '__main__':
     test_2()
     test_3()
     test_4()
+
+    # Генератор: элементы выводятся по мере перебора
+    for _ in test_5():
+        pass
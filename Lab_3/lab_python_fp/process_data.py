@@ -1,3 +1,4 @@
+import argparse
 import json
 import sys
 import os
@@ -6,10 +7,22 @@ from Lab_3.lab_python_fp.gen_random import gen_random
 from Lab_3.lab_python_fp.unique import Unique
 from Lab_3.lab_python_fp.print_result import print_result
 from Lab_3.lab_python_fp.cm_timer import cm_timer_1
+from Lab_3.lab_python_fp.json_stream import CountingIterator, iter_records
 
 
-# Путь к файлу с данными
-DATA_FILE = "data_light.json"
+# Файл с данными по умолчанию; только он создается с тестовыми данными, если его нет
+DEFAULT_DATA_FILE = "data_light.json"
+
+# Тестовые данные для файла по умолчанию
+SAMPLE_DATA = [
+    {"job-name": "Программист Python", "salary": "150000"},
+    {"job-name": "Программист Java", "salary": "140000"},
+    {"job-name": "Программист C++", "salary": "160000"},
+    {"job-name": "Аналитик данных", "salary": "120000"},
+    {"job-name": "Программист Python", "salary": "155000"},
+    {"job-name": "программист JavaScript", "salary": "135000"},
+    {"job-name": "Менеджер проекта", "salary": "110000"}
+]
 
 
 @print_result
@@ -19,53 +32,74 @@ def f1(arg):
 
 
 @print_result
-def f2(arg):
+def f2(arg, lazy=False):
     """Фильтровать входной массив и возвращать только те элементы, которые начинаются со слова 'программист'"""
-    return list(filter(lambda x: x.lower().startswith('программист'), arg))
+    result = filter(lambda x: x.lower().startswith('программист'), arg)
+    return result if lazy else list(result)
 
 
 @print_result
-def f3(arg):
+def f3(arg, lazy=False):
     """Модифицировать каждый элемент массива, добавив строку 'с опытом Python'"""
-    return list(map(lambda x: f"{x} с опытом Python", arg))
+    result = map(lambda x: f"{x} с опытом Python", arg)
+    return result if lazy else list(result)
 
 
 @print_result
-def f4(arg):
+def f4(arg, lazy=False):
     """Сгенерировать для каждой специальности зарплату от 100 000 до 200 000 рублей"""
+    if lazy:
+        # Длина потока неизвестна: бесконечный поток зарплат обрывается вместе с arg
+        return (f"{job}, зарплата {salary} руб."
+                for job, salary in zip(arg, gen_random(None, 100000, 200000)))
     salaries = list(gen_random(len(arg), 100000, 200000))
     return [f"{job}, зарплата {salary} руб." for job, salary in zip(arg, salaries)]
 
 
-if __name__ == '__main__':
+def parse_args(argv: list) -> argparse.Namespace:
+    """Разбирает аргументы командной строки"""
+    parser = argparse.ArgumentParser(description="Обработка списка профессий цепочкой f1 -> f4")
+    parser.add_argument("data_file", nargs="?", default=DEFAULT_DATA_FILE,
+                        help="Файл с данными: JSON-массив или NDJSON")
+    # Ленивый режим: f2, f3 и f4 возвращают генераторы, и записи проходят
+    # цепочку по одной; список строит только сортировка в f1
+    parser.add_argument("--lazy", action="store_true", help="Ленивый режим стадий")
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None):
+    """Точка входа: обработка файла с данными"""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    data_file, lazy = args.data_file, args.lazy
+
     # Проверяем наличие файла с данными
-    if not os.path.exists(DATA_FILE):
-        print(f"Файл {DATA_FILE} не найден.")
+    if not os.path.exists(data_file):
+        if data_file != DEFAULT_DATA_FILE:
+            # Опечатка в пути не должна подменяться тестовыми данными
+            sys.exit(f"Файл {data_file} не найден.")
+        print(f"Файл {data_file} не найден.")
         print("Создаем тестовые данные...")
-        # Создаем тестовые данные
-        test_data = [
-            {"job-name": "Программист Python", "salary": "150000"},
-            {"job-name": "Программист Java", "salary": "140000"},
-            {"job-name": "Программист C++", "salary": "160000"},
-            {"job-name": "Аналитик данных", "salary": "120000"},
-            {"job-name": "Программист Python", "salary": "155000"},
-            {"job-name": "программист JavaScript", "salary": "135000"},
-            {"job-name": "Менеджер проекта", "salary": "110000"}
-        ]
-        with open(DATA_FILE, 'w', encoding='utf-8') as f:
-            json.dump(test_data, f, ensure_ascii=False, indent=2)
-        print(f"Тестовые данные сохранены в {DATA_FILE}")
-        data = test_data
-    else:
-        # Загружаем данные из файла
-        with open(DATA_FILE, encoding='utf-8') as f:
-            data = json.load(f)
-        print(f"Данные загружены из {DATA_FILE}")
-
-    print(f"Загружено {len(data)} записей")
+        with open(data_file, 'w', encoding='utf-8') as f:
+            json.dump(SAMPLE_DATA, f, ensure_ascii=False, indent=2)
+        print(f"Тестовые данные сохранены в {data_file}")
+
+    # Записи читаются из файла потоком по одной: field и Unique разбирают
+    # их по мере чтения, в памяти остаются только уникальные профессии
+    data = CountingIterator(iter_records(data_file))
+    print(f"Данные читаются из {data_file}")
 
     # Выполняем цепочку функций
     with cm_timer_1():
-        result = f4(f3(f2(f1(data))))
+        result = f4(f3(f2(f1(data), lazy=lazy), lazy=lazy), lazy=lazy)
+        if lazy:
+            # Элементы выводятся стадиями по мере прохождения цепочки
+            count = sum(1 for _ in result)
+        else:
+            count = len(result)
+
+    print(f"\nПрочитано {data.count} записей")
+    print(f"Итоговый результат содержит {count} элементов")
 
-    print(f"\nИтоговый результат содержит {len(result)} элементов")
+
+if __name__ == '__main__':
+    main()
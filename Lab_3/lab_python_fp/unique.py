@@ -1,41 +1,198 @@
 # lab_python_fp/unique.py
+from itertools import islice
+
+from Lab_3.lab_python_fp.key_sets import MAX_KEYS, PARTITIONS, BloomFilter, SpillingSet
+
+# Режимы хранения просмотренных ключей
+MODES = ('memory', 'spill', 'approx')
+
+# Сколько элементов режимы 'spill' и 'approx' читают вперед для одной проверки
+BATCH_SIZE = 10_000
+
+# Сколько различных написаний элементов хранит ignore_case для быстрого отсева
+# точных повторов (0 - не хранить)
+ITEM_CACHE_SIZE = 100_000
+
+
+def make_seen(mode='memory', **kwargs):
+    """
+    Создает множество просмотренных ключей для режима Unique.
+
+    Args:
+        mode: 'memory' - обычный set (точно, память не ограничена),
+              'spill' - SpillingSet (точно, ключи сверх max_keys на диске),
+              'approx' - BloomFilter (память фиксирована, часть уникальных
+              элементов теряется с вероятностью около error_rate)
+        **kwargs: max_keys, partitions, directory для 'spill';
+                  capacity, error_rate для 'approx'
+
+    Returns:
+        Объект с методами add и __contains__
+    """
+    if mode == 'memory':
+        return set()
+    if mode == 'spill':
+        return SpillingSet(kwargs.get('max_keys', MAX_KEYS),
+                           kwargs.get('partitions', PARTITIONS),
+                           kwargs.get('directory'))
+    if mode == 'approx':
+        return BloomFilter(kwargs.get('capacity', MAX_KEYS), kwargs.get('error_rate', 0.01))
+    raise ValueError(f"Неизвестный режим Unique: {mode!r}, ожидается один из {MODES}")
+
+
+def chunk_keys(items, ignore_case=False):
+    """
+    Ключи сравнения блока элементов.
+
+    С ignore_case строки приводятся к lower(), остальные элементы
+    сравниваются как есть. Без ignore_case возвращается сам блок.
+    """
+    if not ignore_case:
+        return items
+    return [item.lower() if isinstance(item, str) else item for item in items]
+
 
 class Unique:
     """
     Итератор для удаления дубликатов.
 
+    Реализация выбирается при создании: для режима 'memory' - генератор
+    без лишних проверок на элемент (отдельный для ignore_case), для
+    'spill' и 'approx' - генератор, проверяющий ключи блоками.
+    __iter__ возвращает этот генератор, поэтому for и list() не вызывают
+    __next__ на каждый элемент.
+
     Args:
-        items: Итерируемый объект (список, генератор и т.д.)
-        **kwargs: Может содержать параметр ignore_case (bool)
+        items: Итерируемый объект (список, генератор и т.д.); можно не
+               указывать, если блоки передаются через extend
+        **kwargs: Может содержать параметр ignore_case (bool), режим
+                  хранения ключей mode ('memory', 'spill', 'approx') и его
+                  параметры (см. make_seen). В режимах 'spill' и 'approx'
+                  элементы читаются вперед блоками по batch_size
+                  (по умолчанию BATCH_SIZE). В режиме 'memory' с ignore_case
+                  item_cache ограничивает количество запоминаемых написаний
+                  элементов (по умолчанию ITEM_CACHE_SIZE, 0 - не запоминать)
+
+    В режиме 'spill' после окончания items временные файлы удаляются
+    (close), и extend после этого выбрасывает ValueError.
     """
-    def __init__(self, items, **kwargs):
+    def __init__(self, items=(), **kwargs):
         self.items = iter(items)
         self.ignore_case = kwargs.get('ignore_case', False)
-        self.seen = set()
-        self.next_item = None
+        self.seen = make_seen(**{key: value for key, value in kwargs.items()
+                                 if key not in ('ignore_case', 'batch_size', 'item_cache')})
+        self.closed = False
+        # SpillingSet и BloomFilter проверяют ключи блоками: раздел на диске
+        # загружается один раз на блок, а позиции битов вычисляются один раз на ключ
+        if hasattr(self.seen, 'add_batch'):
+            self.batch_size = kwargs.get('batch_size', BATCH_SIZE)
+            self.iterator = self.iter_batched()
+        elif self.ignore_case:
+            # Элементы, уже встречавшиеся в точности: для них lower() не вызывается
+            self.seen_items = set()
+            self.item_cache = kwargs.get('item_cache', ITEM_CACHE_SIZE)
+            self.iterator = self.iter_ignore_case()
+        else:
+            self.iterator = self.iter_plain()
 
-    def __next__(self):
+    def iter_plain(self):
+        """Генератор уникальных элементов с ключом - самим элементом"""
+        seen = self.seen
+        add = seen.add
+        for item in self.items:
+            if item not in seen:
+                add(item)
+                yield item
+
+    def iter_ignore_case(self):
+        """
+        Генератор уникальных элементов без учета регистра строк.
+
+        Повтор элемента в точности отсеивается по seen_items без вызова
+        lower(); это в несколько раз быстрее для потоков с повторами.
+        Запоминаются первые item_cache различных написаний, остальные
+        элементы проверяются только по ключу.
+        """
+        seen = self.seen
+        add = seen.add
+        seen_items = self.seen_items
+        add_item = seen_items.add
+        limit = self.item_cache
+        lower = str.lower
+        for item in self.items:
+            if item in seen_items:
+                continue
+            if len(seen_items) < limit:
+                add_item(item)
+            key = lower(item) if isinstance(item, str) else item
+            if key not in seen:
+                add(key)
+                yield item
+
+    def iter_batched(self):
+        """Генератор уникальных элементов с проверкой ключей блоками"""
         while True:
-            try:
-                # Получаем следующий элемент
-                item = next(self.items) if self.next_item is None else self.next_item
-                self.next_item = None
-
-                # Определяем ключ для сравнения
-                if self.ignore_case and isinstance(item, str):
-                    key = item.lower()
-                else:
-                    key = item
-
-                # Проверяем, был ли уже такой элемент
-                if key not in self.seen:
-                    self.seen.add(key)
-                    return item
-            except StopIteration:
-                raise StopIteration
+            block = list(islice(self.items, self.batch_size))
+            if not block:
+                break
+            yield from self.extend(block)
+        # Временные файлы режима 'spill' больше не нужны
+        self.close()
+
+    def close(self):
+        """Удаляет временные файлы режима 'spill'; после этого extend недоступен"""
+        close = getattr(self.seen, 'close', None)
+        if close is not None:
+            close()
+            self.closed = True
+
+    def extend(self, chunk):
+        """
+        Удаляет дубликаты сразу во всем блоке.
+
+        Учитываются элементы, уже выданные итератором или предыдущими
+        вызовами extend.
+
+        Args:
+            chunk: Последовательность элементов
+
+        Returns:
+            Список элементов блока, встретившихся впервые, в порядке появления
+
+        Raises:
+            ValueError: Если просмотренные ключи уже удалены close()
+        """
+        if self.closed:
+            raise ValueError("Unique закрыт: просмотренные ключи удалены, "
+                             "extend выдал бы повторно уже выданные элементы")
+        chunk = list(chunk)
+        seen = self.seen
+        if hasattr(seen, 'add_batch'):
+            keys = chunk_keys(chunk, self.ignore_case)
+            return [item for item, new in zip(chunk, seen.add_batch(keys)) if new]
+
+        # Сначала отсеиваются уже известные элементы (обычно почти весь
+        # блок), затем повторы среди оставшихся
+        if not self.ignore_case:
+            result = list(dict.fromkeys([item for item in chunk if item not in seen]))
+            seen.update(result)
+            return result
+
+        seen_items = self.seen_items
+        chunk = list(dict.fromkeys([item for item in chunk if item not in seen_items]))
+        seen_items.update(islice(chunk, max(self.item_cache - len(seen_items), 0)))
+        first = {}
+        for key, item in zip(chunk_keys(chunk, True), chunk):
+            if key not in seen and key not in first:
+                first[key] = item
+        seen.update(first)
+        return list(first.values())
+
+    def __next__(self):
+        return next(self.iterator)
 
     def __iter__(self):
-        return self
+        return self.iterator
 
 
 def test_unique():
@@ -115,6 +272,32 @@ def test_unique():
     result = list(Unique(data))
     print(f"     {result}")
 
+    print("\n10. Тест с режимом 'spill' (в памяти не больше 3 ключей):")
+    data = ['Python', 'python', 'Java', 'Go', 'GO', 'Rust', 'C', 'java', 'rust', 'Kotlin']
+    print(f"   data = {data}")
+    print("   Unique(data, ignore_case=True, mode='spill', max_keys=3, partitions=4, batch_size=2) ->")
+    result = list(Unique(data, ignore_case=True, mode='spill', max_keys=3, partitions=4, batch_size=2))
+    print(f"     {result}")
+
+    print("\n11. Тест с блоками (extend):")
+    unique = Unique(ignore_case=True)
+    for chunk in (['Python', 'python', 'Java'], ['JAVA', 'Go', 'Python', 'go', 'Rust']):
+        print(f"   extend({chunk}) -> {unique.extend(chunk)}")
+
+    print("\n12. Тест с режимом 'approx' (фильтр Блума):")
+    print(f"   data = {data}")
+    print("   Unique(data, ignore_case=True, mode='approx', capacity=100) ->")
+    result = list(Unique(data, ignore_case=True, mode='approx', capacity=100))
+    print(f"     {result}")
+
+    print("\n13. Тест extend после окончания входа в режиме 'spill':")
+    unique = Unique(['Python', 'Java'], mode='spill')
+    print(f"   list(unique) -> {list(unique)}")
+    try:
+        unique.extend(['Python'])
+    except ValueError as e:
+        print(f"   extend(['Python']) -> ValueError: {e}")
+
 
 # Для тестирования при запуске файла напрямую
 if __name__ == "__main__":
@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+"""
+Набор бенчмарков для горячих путей EquationSolver
+
+Для каждого метода (solve_quadratic, solve_quadratic_into, solve_biquadratic,
+format_solution) и каждой нагрузки с фиксированным seed измеряются:
+    - время в наносекундах на уравнение (лучший из нескольких прогонов);
+    - пиковый объем памяти, выделяемой за один вызов (tracemalloc);
+    - задержка одного вызова: медиана (p50) и 99-й перцентиль (p99).
+
+Результаты можно сохранить в JSON и сравнить с сохраненной базой.
+
+Запуск:
+    python -m benchmark
+    python -m benchmark --save baseline.json
+    python -m benchmark --compare baseline.json --threshold 0.1
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from array import array
+
+from main import EquationSolver
+
+# Seed генератора нагрузок по умолчанию
+DEFAULT_SEED = 17
+
+# Количество уравнений в нагрузке по умолчанию
+DEFAULT_SIZE = 20000
+
+# Сколько вызовов отслеживать через tracemalloc (он сильно замедляет вызовы)
+ALLOC_SAMPLE = 1000
+
+
+def _four_roots(rng: random.Random) -> tuple:
+    """Уравнение с двумя различными положительными корнями t, то есть с четырьмя корнями x"""
+    a = rng.uniform(0.5, 10)
+    t1, t2 = rng.uniform(0.1, 5), rng.uniform(5.5, 10)
+    return a, -a * (t1 + t2), a * t1 * t2
+
+
+def _no_roots(rng: random.Random) -> tuple:
+    """Уравнение с отрицательным дискриминантом"""
+    a = rng.uniform(0.5, 10)
+    b = rng.uniform(-20, 20)
+    return a, b, b * b / (4 * a) + rng.uniform(1, 10)
+
+
+def _degenerate(rng: random.Random) -> tuple:
+    """Уравнение с D = 0: целые коэффициенты дают точный ноль дискриминанта"""
+    a = float(rng.randint(1, 20))
+    t = float(rng.randint(-10, 10))
+    return a, -2 * a * t, a * t * t
+
+
+def _mixed(rng: random.Random) -> tuple:
+    """Смесь всех нагрузок и случайных коэффициентов"""
+    kind = rng.randrange(4)
+    if kind == 3:
+        return rng.uniform(-10, 10) or 1.0, rng.uniform(-20, 20), rng.uniform(-20, 20)
+    return (_four_roots, _no_roots, _degenerate)[kind](rng)
+
+
+# Нагрузки: имя -> генератор одной тройки коэффициентов
+WORKLOADS = {
+    "four_roots": _four_roots,
+    "no_roots": _no_roots,
+    "degenerate": _degenerate,
+    "mixed": _mixed,
+}
+
+
+def make_workload(name: str, n: int = DEFAULT_SIZE, seed: int = DEFAULT_SEED) -> list:
+    """Генерирует n троек коэффициентов нагрузки name с фиксированным seed"""
+    rng = random.Random(f"{name}:{seed}")
+    generate = WORKLOADS[name]
+    return [generate(rng) for _ in range(n)]
+
+
+def _prepare_quadratic(workload: list) -> tuple:
+    return EquationSolver.solve_quadratic, workload
+
+
+def _prepare_quadratic_into(workload: list) -> tuple:
+    out = array("d", [0.0, 0.0])
+    return EquationSolver.solve_quadratic_into, [(a, b, c, out) for a, b, c in workload]
+
+
+def _prepare_biquadratic(workload: list) -> tuple:
+    return EquationSolver.solve_biquadratic, workload
+
+
+def _prepare_format(workload: list) -> tuple:
+    args = [(EquationSolver.solve_biquadratic(a, b, c), EquationSolver.calculate_discriminant(a, b, c))
+            for a, b, c in workload]
+    return EquationSolver.format_solution, args
+
+
+# Измеряемые методы: имя -> функция, готовящая (вызываемый объект, аргументы вызовов)
+TARGETS = {
+    "solve_quadratic": _prepare_quadratic,
+    "solve_quadratic_into": _prepare_quadratic_into,
+    "solve_biquadratic": _prepare_biquadratic,
+    "format_solution": _prepare_format,
+}
+
+
+def _percentile(sorted_values: list, fraction: float) -> float:
+    """Перцентиль отсортированного списка (ближайший ранг)"""
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def measure(func, calls: list, repeat: int = 3) -> dict:
+    """
+    Измеряет один метод на готовом списке аргументов
+
+    Args:
+        func: Вызываемый объект
+        calls: Список кортежей аргументов
+        repeat: Количество прогонов для оценки времени на вызов
+
+    Returns:
+        Словарь с метриками ns_per_eq, alloc_bytes_per_call, p50_ns и p99_ns
+    """
+    # Время на вызов: лучший из нескольких прогонов всей нагрузки
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for args in calls:
+            func(*args)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    # Задержка отдельных вызовов (включает накладные расходы таймера)
+    clock = time.perf_counter_ns
+    latencies = []
+    for args in calls:
+        start = clock()
+        func(*args)
+        latencies.append(clock() - start)
+    latencies.sort()
+
+    # Пиковая память одного вызова
+    sample = calls[:ALLOC_SAMPLE]
+    allocated = 0
+    tracemalloc.start()
+    try:
+        for args in sample:
+            tracemalloc.reset_peak()
+            current, _ = tracemalloc.get_traced_memory()
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+            allocated += peak - current
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ns_per_eq": best / len(calls),
+        "alloc_bytes_per_call": allocated / len(sample),
+        "p50_ns": _percentile(latencies, 0.50),
+        "p99_ns": _percentile(latencies, 0.99),
+    }
+
+
+def run_suite(n: int = DEFAULT_SIZE, seed: int = DEFAULT_SEED, repeat: int = 3,
+              targets: list = None, workloads: list = None) -> dict:
+    """
+    Запускает все бенчмарки
+
+    Returns:
+        Словарь {"meta": ..., "results": {метод: {нагрузка: метрики}}}
+    """
+    results = {}
+    for workload_name in workloads or WORKLOADS:
+        workload = make_workload(workload_name, n, seed)
+        for target_name in targets or TARGETS:
+            func, calls = TARGETS[target_name](workload)
+            results.setdefault(target_name, {})[workload_name] = measure(func, calls, repeat)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "size": n,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+
+def compare_results(baseline: dict, current: dict, metric: str = "ns_per_eq",
+                    threshold: float = 0.10) -> list:
+    """
+    Сравнивает результаты с базой
+
+    Args:
+        baseline: Сохраненные результаты run_suite
+        current: Новые результаты run_suite
+        metric: Сравниваемая метрика
+        threshold: Допустимое относительное ухудшение
+
+    Returns:
+        Список кортежей (метод, нагрузка, было, стало, изменение, регрессия)
+    """
+    rows = []
+    for target, workloads in current["results"].items():
+        for workload, metrics in workloads.items():
+            old = baseline["results"].get(target, {}).get(workload)
+            if old is None:
+                continue
+            before, after = old[metric], metrics[metric]
+            change = (after - before) / before if before else 0.0
+            rows.append((target, workload, before, after, change, change > threshold))
+    return rows
+
+
+def print_results(report: dict):
+    """Выводит результаты в виде таблицы"""
+    print(f"{'метод':<22}{'нагрузка':<13}{'нс/ур':>10}{'байт/вызов':>12}{'p50, нс':>10}{'p99, нс':>10}")
+    for target, workloads in report["results"].items():
+        for workload, m in workloads.items():
+            print(f"{target:<22}{workload:<13}{m['ns_per_eq']:>10.1f}"
+                  f"{m['alloc_bytes_per_call']:>12.1f}{m['p50_ns']:>10}{m['p99_ns']:>10}")
+
+
+def compare_quadratic_precision(b: float = 1e8) -> dict:
+    """
+    Сравнивает точность малого корня уравнения t^2 + b*t + 1 = 0 при b^2 >> 4ac
+
+    Returns:
+        Словарь с относительной ошибкой малого корня для каждого способа
+    """
+    # Малый корень -1/b с точностью до членов порядка 1/b^3
+    exact = -1 / b - 1 / b ** 3
+    textbook = max(EquationSolver.solve_quadratic(1.0, b, 1.0))
+
+    out = array("d", [0.0, 0.0])
+    EquationSolver.solve_quadratic_into(1.0, b, 1.0, out)
+    stable = max(out)
+
+    return {
+        "solve_quadratic": abs(textbook - exact) / abs(exact),
+        "solve_quadratic_into": abs(stable - exact) / abs(exact),
+    }
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    """Разбирает аргументы командной строки"""
+    parser = argparse.ArgumentParser(prog="python -m benchmark",
+                                     description="Бенчмарки EquationSolver")
+    parser.add_argument("-n", "--size", type=int, default=DEFAULT_SIZE,
+                        help="Количество уравнений в нагрузке")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--repeat", type=int, default=3, help="Количество прогонов")
+    parser.add_argument("--target", action="append", choices=sorted(TARGETS),
+                        help="Измерять только указанный метод")
+    parser.add_argument("--workload", action="append", choices=sorted(WORKLOADS),
+                        help="Использовать только указанную нагрузку")
+    parser.add_argument("--save", metavar="PATH", help="Сохранить результаты в JSON")
+    parser.add_argument("--compare", metavar="PATH", help="Сравнить с сохраненной базой")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="Допустимое относительное замедление при сравнении")
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None) -> int:
+    """
+    Точка входа бенчмарков
+
+    Returns:
+        Код завершения: 1, если при сравнении найдена регрессия
+    """
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    report = run_suite(args.size, args.seed, args.repeat, args.target, args.workload)
+    print_results(report)
+
+    print("\nОтносительная ошибка малого корня при b = 1e8:")
+    for name, value in compare_quadratic_precision().items():
+        print(f"  {name}: {value:.2e}")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\nРезультаты сохранены в {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        rows = compare_results(baseline, report, threshold=args.threshold)
+        print(f"\nСравнение с {args.compare} (нс/ур):")
+        regressions = 0
+        for target, workload, before, after, change, regression in rows:
+            mark = "РЕГРЕССИЯ" if regression else ""
+            print(f"  {target:<22}{workload:<13}{before:>10.1f}{after:>10.1f}{change:>+9.1%}  {mark}")
+            regressions += regression
+        if regressions:
+            print(f"Найдено регрессий: {regressions}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
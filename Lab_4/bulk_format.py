@@ -0,0 +1,110 @@
+"""
+Пакетное форматирование решений биквадратных уравнений
+
+Текстовый вывод совпадает с EquationSolver.format_solution посимвольно,
+но строится шаблоном на все корни уравнения сразу и пишется в поток
+крупными блоками. Двоичный вывод упаковывает каждое решение в запись
+фиксированной длины для последующей обработки другими программами.
+"""
+
+import struct
+
+from main import EquationSolver
+
+# Сколько уравнений форматируется перед одной записью в поток
+DEFAULT_CHUNK_SIZE = 4096
+
+# Двоичная запись: количество корней (int32) и четыре корня (float64, NaN в пустых
+# ячейках), little-endian без выравнивания - всего 36 байт
+RECORD = struct.Struct("<i4d")
+
+NEGATIVE_DISCRIMINANT = "Нет корней (дискриминант отрицательный)\n"
+NO_REAL_ROOTS = "Нет действительных корней\n"
+ROOT_LINE = "Корень уравнения: {:.6f}\n"
+
+# Шаблон для уравнения с k корнями: одна операция format на все корни
+_TEMPLATES = [NO_REAL_ROOTS] + [ROOT_LINE * count for count in range(1, 5)]
+
+
+def _tolist(values) -> list:
+    """Преобразует массив NumPy или последовательность в список Python"""
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def write_solutions_text(roots, counts, discriminants, out,
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Записывает решения пакета в текстовый поток
+
+    Каждое решение совпадает с format_solution(roots[i][:counts[i]], D[i])
+    и завершается переводом строки, как при выводе через print.
+
+    Args:
+        roots: Матрица корней формы (N, 4) из solve_biquadratic_batch
+        counts: Количество корней каждого уравнения
+        discriminants: Дискриминанты уравнений
+        out: Текстовый поток (например, многократно используемый io.StringIO)
+        chunk_size: Количество уравнений в одной записи в поток
+
+    Returns:
+        Количество записанных решений
+    """
+    templates = _TEMPLATES
+    total = len(counts)
+
+    for start in range(0, total, chunk_size):
+        end = start + chunk_size
+        parts = []
+        for row, count, D in zip(_tolist(roots[start:end]), _tolist(counts[start:end]),
+                                 _tolist(discriminants[start:end])):
+            if D < 0:
+                parts.append(NEGATIVE_DISCRIMINANT)
+                continue
+            row = row[:count]
+            if 0.0 in row:
+                # Корень 0 выводится без дробной части - редкий случай, идем медленным путем
+                parts.append(EquationSolver.format_solution(row, D) + "\n")
+            else:
+                parts.append(templates[count].format(*row))
+        out.write("".join(parts))
+
+    return total
+
+
+def write_solutions_binary(roots, counts, out) -> int:
+    """
+    Записывает решения пакета в двоичный поток записями формата RECORD
+
+    Args:
+        roots: Матрица корней формы (N, 4) из solve_biquadratic_batch
+        counts: Количество корней каждого уравнения
+        out: Двоичный поток (например, io.BytesIO или файл, открытый в режиме 'wb')
+
+    Returns:
+        Количество записанных решений
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+
+    if np is None:
+        pack = RECORD.pack
+        out.write(b"".join(pack(count, *row) for count, row in zip(_tolist(counts), _tolist(roots))))
+        return len(counts)
+
+    records = np.empty(len(counts), dtype=[("count", "<i4"), ("roots", "<f8", 4)])
+    records["count"] = counts
+    records["roots"] = roots
+    out.write(records.tobytes())
+    return len(records)
+
+
+def read_solutions_binary(data) -> list:
+    """
+    Читает решения из байтов, записанных write_solutions_binary
+
+    Returns:
+        Список кортежей корней для каждого уравнения
+    """
+    return [roots[:count] for count, *roots in RECORD.iter_unpack(data)]
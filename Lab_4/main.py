@@ -5,6 +5,23 @@
 
 import sys
 import math
+from collections import OrderedDict
+
+
+def _import_numpy():
+    """
+    Загружает NumPy по требованию
+
+    NumPy нужен только пакетным режимам, поэтому обычный запуск
+    с тремя коэффициентами его не импортирует.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "Для пакетного решения установите пакет numpy: pip install numpy"
+        ) from None
+    return numpy
 
 
 class EquationSolver:  # Было: BiquadraticEquationSolver
@@ -55,6 +72,41 @@ class EquationSolver:  # Было: BiquadraticEquationSolver
             t2 = (-b - sqrt_D) / (2 * a)
             return [t1, t2]
 
+    @staticmethod
+    def solve_quadratic_into(a: float, b: float, c: float, out, offset: int = 0) -> int:
+        """
+        Решает квадратное уравнение a*t^2 + b*t + c = 0 численно устойчиво
+
+        Вместо (-b ± sqrt(D)) / 2a используются q = -(b + sign(b)*sqrt(D)) / 2
+        и формулы Виета t = q/a, t = c/q, поэтому при b^2 >> 4ac не теряется
+        точность из-за вычитания близких чисел. Корни записываются в буфер
+        вызывающего кода, и в горячих циклах ничего не выделяется.
+
+        Args:
+            a, b, c: Коэффициенты уравнения
+            out: Буфер для корней (например, array('d')) длиной не меньше offset + 2
+            offset: Позиция первого корня в буфере
+
+        Returns:
+            Количество записанных корней (в том же порядке, что у solve_quadratic)
+        """
+        D = b * b - 4 * a * c
+
+        if D < 0:
+            return 0
+        if D == 0:
+            out[offset] = -b / (2 * a)
+            return 1
+
+        q = -0.5 * (b + math.copysign(math.sqrt(D), b))
+        if math.copysign(1.0, b) < 0:
+            out[offset] = q / a
+            out[offset + 1] = c / q
+        else:
+            out[offset] = c / q
+            out[offset + 1] = q / a
+        return 2
+
     @staticmethod
     def solve_biquadratic(a: float, b: float, c: float) -> list:
         """
@@ -82,6 +134,58 @@ class EquationSolver:  # Было: BiquadraticEquationSolver
         x_roots.sort()
         return x_roots
 
+    @staticmethod
+    def solve_biquadratic_batch(a, b, c) -> tuple:
+        """
+        Решает пакет биквадратных уравнений a*x^4 + b*x^2 + c = 0
+
+        Все уравнения решаются операциями над массивами, без вызова
+        solve_biquadratic для каждой тройки коэффициентов.
+
+        Args:
+            a: Коэффициенты A (массив NumPy, array('d') или другая последовательность)
+            b: Коэффициенты B
+            c: Коэффициенты C
+
+        Returns:
+            Кортеж (roots, counts): матрица корней формы (N, 4), где корни
+            каждой строки идут по возрастанию, а свободные ячейки равны NaN,
+            и вектор counts с количеством действительных корней
+        """
+        np = _import_numpy()
+        a, b, c = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(x, dtype=np.float64)) for x in (a, b, c))
+        )
+        if a.ndim != 1:
+            raise ValueError("Коэффициенты должны быть одномерными массивами")
+
+        zero_a = np.flatnonzero(a == 0)
+        if zero_a.size:
+            raise ValueError(
+                f"Коэффициент а=0, это не квадратное уравнение (уравнение {zero_a[0]})"
+            )
+
+        # Дискриминант и корни относительно t = x^2 для всего пакета
+        D = b * b - 4 * a * c
+        sqrt_D = np.sqrt(np.where(D >= 0, D, 0.0))
+        t = np.stack(((-b + sqrt_D) / (2 * a), (-b - sqrt_D) / (2 * a)), axis=1)
+
+        # При D = 0 корень t один, второй столбец не учитываем
+        t_valid = np.stack((D >= 0, D > 0), axis=1)
+        positive = t_valid & (t > 0)
+        zero_t = t_valid & (t == 0)
+
+        # Каждый t > 0 дает пару ±sqrt(t), t = 0 дает один корень 0
+        sqrt_t = np.sqrt(np.where(positive, t, 0.0))
+        roots = np.full((a.size, 4), np.nan)
+        roots[:, 0::2] = np.where(positive, -sqrt_t, np.where(zero_t, 0.0, np.nan))
+        roots[:, 1::2] = np.where(positive, sqrt_t, np.nan)
+
+        # NaN при сортировке уходят в конец строки
+        roots.sort(axis=1)
+        counts = np.count_nonzero(~np.isnan(roots), axis=1)
+        return roots, counts
+
     @staticmethod
     def format_solution(roots: list, D: float) -> str:
         """
@@ -107,8 +211,106 @@ class EquationSolver:  # Было: BiquadraticEquationSolver
         return "\n".join(result)
 
 
+class SolutionCache:
+    """
+    Ограниченный LRU-кэш решений биквадратных уравнений
+
+    Ключом служат коэффициенты, деленные на ±2^k так, что a попадает в
+    [0.5, 1). Деление на степень двойки точное, и все промежуточные
+    величины решателя меняются ровно в 2^k раз, поэтому уравнения,
+    отличающиеся таким множителем (например, (1, -5, 4) и (-2, 10, -8)),
+    попадают в одну запись и получают те же корни, что без кэша.
+    Коэффициенты вблизи границ переполнения и исчезновения порядка не
+    нормализуются. Решения хранятся и возвращаются кортежами, чтобы
+    вызывающий код не мог испортить общую запись.
+    """
+
+    # Нормализация применяется, только если модули всех коэффициентов до
+    # и после деления лежат в этих границах: тогда b*b и 4*a*c не
+    # переполняются и не уходят в денормализованные числа
+    SAFE_MIN = 2.0 ** -256
+    SAFE_MAX = 2.0 ** 256
+
+    def __init__(self, maxsize: int = 4096):
+        """
+        Инициализирует кэш
+
+        Args:
+            maxsize: Максимальное количество хранимых решений
+        """
+        if maxsize <= 0:
+            raise ValueError("Размер кэша должен быть положительным")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    @classmethod
+    def normalize(cls, a: float, b: float, c: float) -> tuple:
+        """Приводит коэффициенты к канонической форме: точное деление на ±2^k"""
+        if a == 0:
+            raise ValueError("Коэффициент а=0, это не квадратное уравнение")
+        # Прибавление 0.0 превращает -0.0 в 0.0, чтобы ключи совпадали
+        exact = (a + 0.0, b + 0.0, c + 0.0)
+        if not cls._is_safe(exact):
+            return exact
+        _, exponent = math.frexp(a)
+        sign = math.copysign(1.0, a)
+        key = tuple(math.ldexp(x, -exponent) * sign + 0.0 for x in exact)
+        return key if cls._is_safe(key) else exact
+
+    @classmethod
+    def _is_safe(cls, coefficients: tuple) -> bool:
+        return all(x == 0 or cls.SAFE_MIN <= abs(x) <= cls.SAFE_MAX for x in coefficients)
+
+    def solve(self, a: float, b: float, c: float) -> tuple:
+        """
+        Решает биквадратное уравнение, используя кэш
+
+        Returns:
+            Кортеж действительных корней x (в порядке возрастания)
+        """
+        key = self.normalize(a, b, c)
+        roots = self._entries.get(key)
+        if roots is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return roots
+
+        self.misses += 1
+        roots = tuple(EquationSolver.solve_biquadratic(a, b, c))
+        self._entries[key] = roots
+        if len(self._entries) > self.maxsize:
+            # Вытесняем запись, которая дольше всех не использовалась
+            self._entries.popitem(last=False)
+        return roots
+
+    def info(self) -> dict:
+        """Возвращает счетчики попаданий и промахов"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self):
+        """Очищает кэш и сбрасывает счетчики"""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 def main():
     """Основная функция программы"""
+    # Потоковый режим: main.py --input coeffs.csv --output roots.csv
+    if any(arg.startswith("--") for arg in sys.argv[1:]):
+        from stream_solver import stream_main
+        sys.exit(stream_main(sys.argv[1:]))
+
     solver = EquationSolver()
 
     try:
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Параллельное решение больших файлов коэффициентов
+
+Входной файл делится на шарды по диапазонам байтов. Каждый шард решается
+в отдельном процессе ProcessPoolExecutor тем же конвейером, что и потоковый
+режим (stream_solver). Готовый текст результата процесс кладет в разделяемую
+память, а в основной процесс возвращает только имя блока и его размер.
+Основной процесс пишет заголовок и переписывает блоки в выходной файл
+строго в порядке шардов, поэтому порядок строк совпадает с входным файлом,
+а пустой входной файл дает тот же результат, что и потоковый режим.
+
+Пример запуска:
+    python main.py --input coeffs.csv --output roots.csv --workers 8
+"""
+
+import io
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+from stream_solver import (
+    BINARY_OUTPUT_FORMATS, DEFAULT_CHUNK_SIZE, INPUT_FORMATS, OUTPUT_FORMATS, WRITE_BUFFER_SIZE,
+    detect_format, iter_chunks, read_coefficients, solve_chunks,
+)
+
+# Размер шарда входного файла по умолчанию в байтах
+DEFAULT_SHARD_SIZE = 64 << 20
+
+
+def plan_shards(file_size: int, shard_size: int) -> list:
+    """
+    Делит файл на диапазоны байтов
+
+    Returns:
+        Список пар (start, end)
+    """
+    return [(start, min(start + shard_size, file_size))
+            for start in range(0, file_size, shard_size)]
+
+
+def iter_shard_lines(path: str, start: int, end: int):
+    """
+    Генератор строк, начинающихся внутри диапазона [start, end)
+
+    Строка принадлежит тому шарду, в котором лежит ее первый байт,
+    поэтому каждая строка файла попадает ровно в один шард.
+
+    Yields:
+        Строка файла
+    """
+    with open(path, "rb") as f:
+        if start:
+            # Дочитываем строку, начавшуюся в предыдущем шарде
+            f.seek(start - 1)
+            f.readline()
+        position = f.tell()
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            yield line.decode("utf-8")
+
+
+def solve_shard(path: str, start: int, end: int, input_format: str,
+                output_format: str, chunk_size: int) -> tuple:
+    """
+    Решает один шард и помещает результат в разделяемую память
+
+    Returns:
+        Кортеж (имя блока разделяемой памяти, размер данных, количество уравнений)
+    """
+    lines = iter_shard_lines(path, start, end)
+    coefficients = read_coefficients(lines, INPUT_FORMATS[input_format], skip_header=start == 0)
+    results = solve_chunks(iter_chunks(coefficients, chunk_size))
+
+    binary = output_format in BINARY_OUTPUT_FORMATS
+    buffer = io.BytesIO() if binary else io.StringIO()
+    try:
+        total = OUTPUT_FORMATS[output_format](results, buffer, header=False)
+    except ValueError as e:
+        raise ValueError(f"Шард с байта {start}: {e}") from None
+    data = buffer.getvalue() if binary else buffer.getvalue().encode("utf-8")
+
+    shm = _create_untracked(max(len(data), 1))
+    shm.buf[:len(data)] = data
+    shm.close()
+    return shm.name, len(data), total
+
+
+def _create_untracked(size: int) -> shared_memory.SharedMemory:
+    """
+    Создает блок разделяемой памяти, который не удаляется при выходе процесса
+
+    Владельцем блока становится основной процесс: он удалит блок после записи.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(create=True, size=size, track=False)
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    if os.name == "posix":
+        # До Python 3.13 блок регистрируется в resource_tracker под POSIX-именем с "/"
+        resource_tracker.unregister("/" + shm.name, "shared_memory")
+    return shm
+
+
+def _header(output_format: str) -> bytes:
+    """Заголовок выходного файла (пустой для форматов без заголовка)"""
+    binary = output_format in BINARY_OUTPUT_FORMATS
+    buffer = io.BytesIO() if binary else io.StringIO()
+    OUTPUT_FORMATS[output_format]((), buffer, header=True)
+    return buffer.getvalue() if binary else buffer.getvalue().encode("utf-8")
+
+
+def _copy_shard_result(name: str, size: int, dst) -> None:
+    """Переписывает результат шарда в файл и освобождает разделяемую память"""
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        dst.write(shm.buf[:size])
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def solve_file_parallel(input_path: str, output_path: str,
+                        input_format: str = None, output_format: str = None,
+                        chunk_size: int = DEFAULT_CHUNK_SIZE,
+                        workers: int = None, shard_size: int = None) -> int:
+    """
+    Решает все уравнения из входного файла на нескольких процессах
+
+    Args:
+        input_path: Путь к файлу коэффициентов
+        output_path: Путь к файлу результатов
+        input_format: Формат входного файла (по умолчанию по расширению)
+        output_format: Формат выходного файла (по умолчанию по расширению)
+        chunk_size: Количество уравнений в пакете
+        workers: Количество процессов (по умолчанию по числу ядер)
+        shard_size: Размер шарда в байтах
+
+    Returns:
+        Количество решенных уравнений
+    """
+    input_format = input_format or detect_format(input_path, INPUT_FORMATS, "csv")
+    output_format = output_format or detect_format(output_path, OUTPUT_FORMATS, "csv")
+    workers = workers or os.cpu_count() or 1
+    shards = plan_shards(os.path.getsize(input_path), shard_size or DEFAULT_SHARD_SIZE)
+
+    total = 0
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers) as executor, \
+            open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as dst:
+        dst.write(_header(output_format))
+        try:
+            for start, end in shards:
+                pending.append(executor.submit(solve_shard, input_path, start, end,
+                                               input_format, output_format, chunk_size))
+                # Держим в работе не больше 2 шардов на процесс, чтобы готовые,
+                # но еще не записанные результаты не занимали всю память
+                while len(pending) >= 2 * workers:
+                    total += _write_next(pending, dst)
+            while pending:
+                total += _write_next(pending, dst)
+        except BaseException:
+            _discard_pending(pending)
+            raise
+
+    return total
+
+
+def _write_next(pending: deque, dst) -> int:
+    """Записывает результат самого раннего шарда из очереди"""
+    name, size, count = pending.popleft().result()
+    _copy_shard_result(name, size, dst)
+    return count
+
+
+def _discard_pending(pending: deque) -> None:
+    """Освобождает разделяемую память шардов, которые уже не будут записаны"""
+    for future in pending:
+        future.cancel()
+    for future in pending:
+        if future.cancelled() or future.exception() is not None:
+            continue
+        name, _, _ = future.result()
+        shm = shared_memory.SharedMemory(name=name)
+        shm.close()
+        shm.unlink()
@@ -0,0 +1,254 @@
+"""
+Пакетное решение полиномиальных уравнений
+
+Движок хранит реестр ядер: формулы в радикалах для линейного, квадратного
+и кубического уравнений, подстановку t = x^2 для многочленов только с четными
+степенями (биквадратные, a*x^6 + b*x^4 + c*x^2 + d и т.д.) и общий запасной
+путь через собственные значения сопровождающей матрицы. Для каждого пакета
+выбирается самое дешевое подходящее ядро.
+
+Все ядра работают с одним интерфейсом: коэффициенты передаются матрицей
+формы (N, n + 1), старшая степень первой, а различные действительные корни
+возвращаются матрицей (N, n) с NaN в свободных ячейках. Кратный корень, как
+и в EquationSolver, возвращается один раз.
+"""
+
+from main import _import_numpy
+
+# Реестр ядер: степень (None - любая степень) -> список ядер
+KERNELS = {}
+
+# Допуск на мнимую часть собственного значения, при котором корень считается действительным
+IMAG_TOLERANCE = 1e-9
+
+# Относительное расстояние, на котором собственные значения считаются одним
+# кратным корнем. Кратный корень раскалывается на величину порядка eps^(1/m),
+# допуск покрывает корни кратности до 3 (eps^(1/3) ~ 6e-6)
+ROOT_TOLERANCE = 1e-5
+
+# Допуск округления кубического ядра в машинных эпсилон: дискриминант
+# в пределах оценки погрешности округления считается нулем
+CUBIC_TOLERANCE = 64 * 2.0 ** -52
+
+
+class Kernel:
+    """Описание ядра решения"""
+
+    def __init__(self, name: str, cost: int, solve, applies=None):
+        """
+        Args:
+            name: Название ядра
+            cost: Относительная стоимость (выбирается ядро с наименьшей)
+            solve: Функция solve(coeffs) -> матрица корней (N, n) с NaN
+            applies: Функция applies(coeffs) -> bool, проверяющая применимость
+        """
+        self.name = name
+        self.cost = cost
+        self.solve = solve
+        self.applies = applies
+
+    def cost_for(self, degree: int) -> int:
+        """Стоимость ядра для многочлена заданной степени"""
+        return self.cost(degree) if callable(self.cost) else self.cost
+
+    def __repr__(self) -> str:
+        return f"Kernel('{self.name}')"
+
+
+def register_kernel(degree, name: str, cost, applies=None):
+    """
+    Декоратор регистрации ядра
+
+    Args:
+        degree: Степень многочлена или None для ядер любой степени
+        name: Название ядра
+        cost: Стоимость (число или функция от степени)
+        applies: Проверка применимости к пакету коэффициентов
+    """
+    def decorator(solve):
+        KERNELS.setdefault(degree, []).append(Kernel(name, cost, solve, applies))
+        return solve
+    return decorator
+
+
+def select_kernel(coeffs) -> Kernel:
+    """Выбирает самое дешевое ядро, применимое к пакету коэффициентов"""
+    degree = coeffs.shape[1] - 1
+    candidates = [
+        kernel for kernel in KERNELS.get(degree, []) + KERNELS.get(None, [])
+        if kernel.applies is None or kernel.applies(coeffs)
+    ]
+    if not candidates:
+        raise ValueError(f"Нет ядра для уравнений степени {degree}")
+    return min(candidates, key=lambda kernel: kernel.cost_for(degree))
+
+
+def _solve_roots(coeffs):
+    """Находит действительные корни пакета выбранным ядром (без сортировки)"""
+    return select_kernel(coeffs).solve(coeffs)
+
+
+def solve_polynomial_batch(coeffs) -> tuple:
+    """
+    Решает пакет уравнений c0*x^n + c1*x^(n-1) + ... + cn = 0
+
+    Args:
+        coeffs: Матрица коэффициентов формы (N, n + 1), старшая степень первой
+
+    Returns:
+        Кортеж (roots, counts): матрица различных действительных корней (N, n)
+        по возрастанию с NaN в свободных ячейках и вектор количества корней
+    """
+    np = _import_numpy()
+    coeffs = np.atleast_2d(np.asarray(coeffs, dtype=np.float64))
+    if coeffs.ndim != 2 or coeffs.shape[1] < 2:
+        raise ValueError("Коэффициенты должны быть матрицей формы (N, n + 1), n >= 1")
+
+    zero_leading = np.flatnonzero(coeffs[:, 0] == 0)
+    if zero_leading.size:
+        raise ValueError(
+            f"Старший коэффициент равен 0, степень уравнения меньше заявленной (уравнение {zero_leading[0]})"
+        )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        roots = _solve_roots(coeffs)
+    roots.sort(axis=1)
+    counts = np.count_nonzero(~np.isnan(roots), axis=1)
+    return roots, counts
+
+
+@register_kernel(1, "linear", cost=1)
+def solve_linear(coeffs):
+    """Линейное уравнение a*x + b = 0"""
+    return (-coeffs[:, 1] / coeffs[:, 0])[:, None]
+
+
+@register_kernel(2, "quadratic", cost=2)
+def solve_quadratic(coeffs):
+    """
+    Квадратное уравнение a*x^2 + b*x + c = 0
+
+    Используется устойчивая форма q = -(b + sign(b)*sqrt(D)) / 2, x = q/a, x = c/q.
+    При D = 0 возвращается один корень.
+    """
+    np = _import_numpy()
+    a, b, c = coeffs[:, 0], coeffs[:, 1], coeffs[:, 2]
+    D = b * b - 4 * a * c
+    q = -0.5 * (b + np.copysign(np.sqrt(np.where(D > 0, D, 0.0)), b))
+
+    roots = np.full((len(coeffs), 2), np.nan)
+    roots[:, 0] = np.where(D > 0, q / a, np.where(D == 0, -b / (2 * a), np.nan))
+    roots[:, 1] = np.where(D > 0, c / q, np.nan)
+    return roots
+
+
+@register_kernel(3, "cubic", cost=3)
+def solve_cubic(coeffs):
+    """
+    Кубическое уравнение a*x^3 + b*x^2 + c*x + d = 0
+
+    Приводится к виду t^3 + p*t + q = 0 подстановкой x = t - b/(3a). При одном
+    действительном корне используется формула Кардано, при трех -
+    тригонометрическая формула Виета.
+
+    Для кратного корня дискриминант delta из-за округления почти никогда не
+    равен 0 в точности. Поэтому delta, не превышающий оценку погрешности
+    округления (CUBIC_TOLERANCE * (|q|*L^3 + p^2*L^2), L - масштаб
+    коэффициентов), считается нулем; так же p сравнивается с нулем для
+    тройного корня.
+    """
+    np = _import_numpy()
+    b = coeffs[:, 1] / coeffs[:, 0]
+    c = coeffs[:, 2] / coeffs[:, 0]
+    d = coeffs[:, 3] / coeffs[:, 0]
+
+    p = c - b * b / 3
+    q = 2 * b ** 3 / 27 - b * c / 3 + d
+    delta = (q / 2) ** 2 + (p / 3) ** 3
+    shift = -b / 3
+
+    # Погрешность округления: p ~ eps*L^2, q ~ eps*L^3, а delta ~ |q|*eps*L^3 + p^2*eps*L^2
+    scale = np.maximum(np.maximum(np.abs(b), np.sqrt(np.abs(c))), np.cbrt(np.abs(d)))
+    error = CUBIC_TOLERANCE * (np.abs(q) * scale ** 3 + p * p * scale ** 2)
+    multiple = np.abs(delta) <= error
+
+    roots = np.full((len(coeffs), 3), np.nan)
+
+    # delta > 0: один действительный корень (Кардано)
+    one = (delta > 0) & ~multiple
+    sqrt_delta = np.sqrt(np.where(one, delta, 0.0))
+    cardano = np.cbrt(-q / 2 + sqrt_delta) + np.cbrt(-q / 2 - sqrt_delta)
+    roots[:, 0] = np.where(one, cardano, np.nan)
+
+    # delta < 0: три различных действительных корня (тригонометрическая формула)
+    three = (delta < 0) & ~multiple
+    safe_p = np.where(three, p, -1.0)
+    m = 2 * np.sqrt(-safe_p / 3)
+    theta = np.arccos(np.clip(3 * q / (2 * safe_p) * np.sqrt(-3 / safe_p), -1, 1)) / 3
+    for k in range(3):
+        roots[:, k] = np.where(three, m * np.cos(theta - 2 * np.pi * k / 3), roots[:, k])
+
+    # delta = 0: кратные корни
+    triple = multiple & (np.abs(p) <= CUBIC_TOLERANCE * scale ** 2)
+    double = multiple & ~triple
+    roots[:, 0] = np.where(triple, 0.0, np.where(double, 3 * q / p, roots[:, 0]))
+    roots[:, 1] = np.where(double, -3 * q / (2 * p), roots[:, 1])
+
+    return roots + shift[:, None]
+
+
+def _only_even_powers(coeffs) -> bool:
+    """Проверяет, что многочлены пакета содержат только четные степени x"""
+    degree = coeffs.shape[1] - 1
+    return degree >= 2 and degree % 2 == 0 and not coeffs[:, 1::2].any()
+
+
+@register_kernel(None, "even-substitution", cost=lambda degree: degree // 2 + 1,
+                 applies=_only_even_powers)
+def solve_even_substitution(coeffs):
+    """
+    Многочлен только с четными степенями x решается подстановкой t = x^2
+
+    Каждый корень t > 0 дает пару ±sqrt(t), корень t = 0 дает x = 0.
+    """
+    np = _import_numpy()
+    t = _solve_roots(coeffs[:, 0::2])
+    positive = t > 0
+    sqrt_t = np.sqrt(np.where(positive, t, 0.0))
+
+    roots = np.full((len(coeffs), 2 * t.shape[1]), np.nan)
+    roots[:, 0::2] = np.where(positive, -sqrt_t, np.where(t == 0, 0.0, np.nan))
+    roots[:, 1::2] = np.where(positive, sqrt_t, np.nan)
+    return roots
+
+
+@register_kernel(None, "companion-eigenvalues", cost=lambda degree: 10 * degree)
+def solve_companion(coeffs):
+    """
+    Корни как собственные значения сопровождающей матрицы
+
+    Собственные значения всего пакета находятся одним вызовом
+    numpy.linalg.eigvals над стопкой матриц. Кратный корень дает группу
+    близких собственных значений (часть из них может быть комплексной),
+    поэтому значения ближе ROOT_TOLERANCE объединяются в один корень -
+    среднее группы, которое намного точнее отдельных значений.
+    """
+    np = _import_numpy()
+    n = coeffs.shape[1] - 1
+    companion = np.zeros((len(coeffs), n, n))
+    companion[:, 0, :] = -coeffs[:, 1:] / coeffs[:, :1]
+    companion[:, np.arange(1, n), np.arange(n - 1)] = 1.0
+
+    eigenvalues = np.linalg.eigvals(companion)
+
+    # Группы близких значений: транзитивное замыкание матрицы близости (N, n, n)
+    scale = 1 + np.maximum(np.abs(eigenvalues)[:, :, None], np.abs(eigenvalues)[:, None, :])
+    connected = np.abs(eigenvalues[:, :, None] - eigenvalues[:, None, :]) <= ROOT_TOLERANCE * scale
+    for _ in range(max(n - 1, 1).bit_length()):
+        connected = np.matmul(connected, connected, dtype=np.int64) > 0
+
+    # Корень группы - среднее ее значений, записывается в ячейку первого значения группы
+    centroid = (connected @ eigenvalues[:, :, None])[:, :, 0] / connected.sum(axis=2)
+    first = connected.argmax(axis=2) == np.arange(n)
+    real = np.abs(centroid.imag) <= IMAG_TOLERANCE * (1 + np.abs(centroid.real))
+    return np.where(first & real, centroid.real, np.nan)
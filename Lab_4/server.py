@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Асинхронный сервис решения биквадратных уравнений
+
+Сервер держит EquationSolver в памяти и принимает запросы по строковому
+протоколу через TCP или Unix-сокет:
+
+    запрос:  "a b c\\n" (коэффициенты через пробел или запятую)
+    ответ:   "OK <количество корней> x1 x2 ...\\n" или "ERR <сообщение>\\n"
+
+Запросы всех соединений накапливаются в общей очереди и раз в несколько
+миллисекунд решаются одним вызовом solve_biquadratic_batch. Ответы
+возвращаются в порядке запросов внутри соединения, поэтому клиент может
+отправлять запросы, не дожидаясь ответов. На строку длиннее line_limit
+сервер отвечает ошибкой и закрывает соединение.
+
+Запуск:
+    python server.py serve --port 8765
+    python server.py bench --port 8765 --connections 16 --requests 2000
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from main import EquationSolver
+
+# Пауза накопления пакета в секундах
+DEFAULT_BATCH_DELAY = 0.002
+
+# Наибольший размер одного пакета
+DEFAULT_MAX_BATCH = 4096
+
+# Емкость общей очереди запросов: при заполнении сервер перестает читать сокеты
+DEFAULT_QUEUE_SIZE = 65536
+
+# Сколько запросов одного соединения может ожидать ответа одновременно
+DEFAULT_MAX_IN_FLIGHT = 256
+
+# Наибольшая длина строки запроса в байтах (как у asyncio.StreamReader по умолчанию)
+DEFAULT_LINE_LIMIT = 2 ** 16
+
+
+def parse_request(line: bytes) -> tuple:
+    """Разбирает строку запроса в тройку коэффициентов"""
+    parts = line.decode("utf-8").replace(",", " ").split()
+    if len(parts) != 3:
+        raise ValueError("ожидается три коэффициента: a b c")
+    a, b, c = (float(part) for part in parts)
+    if a == 0:
+        raise ValueError("Коэффициент а=0, это не квадратное уравнение")
+    return a, b, c
+
+
+def format_response(roots: list) -> bytes:
+    """Формирует строку ответа из списка корней"""
+    return ("OK " + " ".join([str(len(roots))] + [repr(root) for root in roots]) + "\n").encode("utf-8")
+
+
+class SolverServer:
+    """Сервер с микропакетной обработкой запросов"""
+
+    def __init__(self, batch_delay: float = DEFAULT_BATCH_DELAY,
+                 max_batch: int = DEFAULT_MAX_BATCH,
+                 queue_size: int = DEFAULT_QUEUE_SIZE,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                 line_limit: int = DEFAULT_LINE_LIMIT):
+        """
+        Инициализирует сервер
+
+        Args:
+            batch_delay: Пауза накопления пакета в секундах
+            max_batch: Наибольший размер пакета
+            queue_size: Емкость общей очереди запросов
+            max_in_flight: Наибольшее число запросов соединения без ответа
+            line_limit: Наибольшая длина строки запроса в байтах
+        """
+        self.batch_delay = batch_delay
+        self.max_batch = max_batch
+        self.queue_size = queue_size
+        self.max_in_flight = max_in_flight
+        self.line_limit = line_limit
+        self.requests = 0
+        self.batches = 0
+        self._queue = None
+        self._server = None
+        self._batch_task = None
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0, path: str = None):
+        """
+        Запускает сервер на TCP-порту или Unix-сокете
+
+        Returns:
+            Объект asyncio.Server
+        """
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._batch_task = asyncio.create_task(self._batch_loop())
+        if path:
+            self._server = await asyncio.start_unix_server(self._handle, path, limit=self.line_limit)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port, limit=self.line_limit)
+        return self._server
+
+    async def close(self):
+        """Останавливает сервер"""
+        self._server.close()
+        await self._server.wait_closed()
+        self._batch_task.cancel()
+        try:
+            await self._batch_task
+        except asyncio.CancelledError:
+            pass
+
+    async def _handle(self, reader, writer):
+        """Обслуживает одно соединение"""
+        loop = asyncio.get_running_loop()
+        responses = asyncio.Queue(maxsize=self.max_in_flight)
+        writer_task = asyncio.create_task(self._write_responses(responses, writer))
+        try:
+            # Если отправка ответов остановилась (клиент отключился), чтение
+            # прекращается: ответы на новые запросы уже некому отправить
+            while not writer_task.done():
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Строка длиннее line_limit: остаток строки не прочитать, соединение закрывается
+                    future = loop.create_future()
+                    future.set_result(f"ERR строка запроса длиннее {self.line_limit} байт\n".encode("utf-8"))
+                    await self._put_response(responses, future, writer_task)
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                future = loop.create_future()
+                # Очередь ответов ограничена: при отставании клиента перестаем читать
+                if not await self._put_response(responses, future, writer_task):
+                    break
+                try:
+                    a, b, c = parse_request(line)
+                except ValueError as e:
+                    future.set_result(f"ERR {e}\n".encode("utf-8"))
+                    continue
+                await self._queue.put((a, b, c, future))
+        except ConnectionError:
+            pass
+        finally:
+            await self._put_response(responses, None, writer_task)
+            await writer_task
+
+    @staticmethod
+    async def _put_response(responses: asyncio.Queue, item, writer_task) -> bool:
+        """
+        Ставит ответ в очередь соединения, пока ответы еще отправляются
+
+        Returns:
+            False, если отправка ответов завершилась и ответ не поставлен
+        """
+        if writer_task.done():
+            return False
+        if not responses.full():
+            responses.put_nowait(item)
+            return True
+        put = asyncio.ensure_future(responses.put(item))
+        await asyncio.wait((put, writer_task), return_when=asyncio.FIRST_COMPLETED)
+        if put.done():
+            return True
+        put.cancel()
+        return False
+
+    async def _write_responses(self, responses: asyncio.Queue, writer):
+        """Отправляет ответы соединения в порядке запросов"""
+        try:
+            while True:
+                future = await responses.get()
+                if future is None:
+                    break
+                try:
+                    writer.write(await future)
+                except Exception as e:
+                    writer.write(f"ERR {e}\n".encode("utf-8"))
+                if responses.empty():
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _batch_loop(self):
+        """Собирает запросы в пакеты и решает их одним вызовом"""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            await asyncio.sleep(self.batch_delay)
+            while len(batch) < self.max_batch and not queue.empty():
+                batch.append(queue.get_nowait())
+            self._solve_batch(batch)
+
+    def _solve_batch(self, batch: list):
+        """Решает пакет и выставляет результаты ожидающим запросам"""
+        a, b, c, futures = zip(*batch)
+        self.requests += len(batch)
+        self.batches += 1
+        try:
+            roots, counts = EquationSolver.solve_biquadratic_batch(a, b, c)
+        except Exception as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future, row, count in zip(futures, roots.tolist(), counts.tolist()):
+            if not future.done():
+                future.set_result(format_response(row[:count]))
+
+
+def _percentile(sorted_values: list, fraction: float) -> float:
+    """Перцентиль отсортированного списка (ближайший ранг)"""
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+async def _load_connection(connect, workload: list, pipeline: int, latencies: list):
+    """Отправляет запросы одного соединения, держа в полете до pipeline запросов"""
+    reader, writer = await connect()
+    sent_at = []
+    window = asyncio.Semaphore(pipeline)
+
+    async def send():
+        for a, b, c in workload:
+            await window.acquire()
+            sent_at.append(time.perf_counter())
+            writer.write(f"{a!r} {b!r} {c!r}\n".encode("utf-8"))
+            await writer.drain()
+
+    sender = asyncio.create_task(send())
+    for index in range(len(workload)):
+        line = await reader.readline()
+        if not line.startswith(b"OK"):
+            raise RuntimeError(f"Ошибка сервера: {line.decode('utf-8').strip()}")
+        latencies.append(time.perf_counter() - sent_at[index])
+        window.release()
+    await sender
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run_load(host: str = "127.0.0.1", port: int = None, path: str = None,
+                   connections: int = 16, requests: int = 1000, pipeline: int = 32,
+                   seed: int = 17) -> dict:
+    """
+    Нагрузочный клиент: несколько соединений отправляют уравнения серверу
+
+    Args:
+        host, port: Адрес TCP-сервера
+        path: Путь к Unix-сокету (вместо host и port)
+        connections: Количество одновременных соединений
+        requests: Количество запросов на соединение
+        pipeline: Наибольшее число запросов соединения без ответа
+        seed: Seed генератора коэффициентов
+
+    Returns:
+        Словарь со скоростью (запросов в секунду) и задержками p50/p99 в миллисекундах
+    """
+    from benchmark import make_workload
+
+    if path:
+        connect = lambda: asyncio.open_unix_connection(path)
+    else:
+        connect = lambda: asyncio.open_connection(host, port)
+
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _load_connection(connect, make_workload("mixed", requests, seed + i), pipeline, latencies)
+        for i in range(connections)
+    ))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+
+    return {
+        "requests": len(latencies),
+        "elapsed": elapsed,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+    }
+
+
+async def serve(args: argparse.Namespace):
+    """Запускает сервер до прерывания"""
+    server = SolverServer(batch_delay=args.batch_delay / 1000, max_batch=args.max_batch)
+    await server.start(args.host, args.port, args.unix)
+    print(f"Сервер запущен: {args.unix or f'{args.host}:{args.port}'}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+async def bench(args: argparse.Namespace):
+    """Запускает нагрузочный клиент и выводит результат"""
+    stats = await run_load(args.host, args.port, args.unix, args.connections,
+                           args.requests, args.pipeline)
+    print(f"Запросов: {stats['requests']} за {stats['elapsed']:.3f} с")
+    print(f"Скорость: {stats['rps']:,.0f} запросов/с")
+    print(f"Задержка: p50 {stats['p50_ms']:.2f} мс, p99 {stats['p99_ms']:.2f} мс")
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    """Разбирает аргументы командной строки"""
+    parser = argparse.ArgumentParser(description="Сервис решения биквадратных уравнений")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name in ("serve", "bench"):
+        command = commands.add_parser(name)
+        command.add_argument("--host", default="127.0.0.1")
+        command.add_argument("--port", type=int, default=8765)
+        command.add_argument("--unix", metavar="PATH", help="Путь к Unix-сокету")
+
+    commands.choices["serve"].add_argument("--batch-delay", type=float, default=DEFAULT_BATCH_DELAY * 1000,
+                                           help="Пауза накопления пакета в миллисекундах")
+    commands.choices["serve"].add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH)
+    commands.choices["bench"].add_argument("--connections", type=int, default=16)
+    commands.choices["bench"].add_argument("--requests", type=int, default=1000,
+                                           help="Количество запросов на соединение")
+    commands.choices["bench"].add_argument("--pipeline", type=int, default=32,
+                                           help="Запросов в полете на соединение")
+    return parser.parse_args(argv)
+
+
+def main(argv: list = None):
+    """Точка входа сервиса"""
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    try:
+        asyncio.run(serve(args) if args.command == "serve" else bench(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Потоковое решение биквадратных уравнений из файла коэффициентов
+
+Коэффициенты читаются построчно из CSV или NDJSON, собираются в пакеты
+фиксированного размера и решаются EquationSolver.solve_biquadratic_batch.
+В памяти одновременно находится только один пакет, поэтому расход памяти
+не зависит от размера файла.
+
+Формат результата определяется расширением выходного файла: .csv, .ndjson,
+.txt (как при обычном запуске) или .bin (записи bulk_format.RECORD).
+
+Пример запуска:
+    python main.py --input coeffs.csv --output roots.csv
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from array import array
+
+from main import EquationSolver, _import_numpy
+
+# Количество уравнений в одном пакете
+DEFAULT_CHUNK_SIZE = 65536
+
+# Размер буфера записи выходного файла в байтах
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Заголовок выходного CSV
+CSV_HEADER = "count,x1,x2,x3,x4\n"
+
+
+def parse_csv_line(line: str) -> tuple:
+    """Разбирает строку CSV вида 'a,b,c'"""
+    a, b, c = line.split(",")
+    return float(a), float(b), float(c)
+
+
+def parse_ndjson_line(line: str) -> tuple:
+    """Разбирает строку NDJSON: объект {"a": .., "b": .., "c": ..} или список [a, b, c]"""
+    record = json.loads(line)
+    if isinstance(record, dict):
+        return float(record["a"]), float(record["b"]), float(record["c"])
+    a, b, c = record
+    return float(a), float(b), float(c)
+
+
+# Форматы входных файлов: имя -> функция разбора одной строки
+INPUT_FORMATS = {
+    "csv": parse_csv_line,
+    "ndjson": parse_ndjson_line,
+}
+
+
+def detect_format(path: str, formats: dict, default: str) -> str:
+    """Определяет формат файла по расширению"""
+    suffix = path.rsplit(".", 1)[-1].lower() if "." in path else ""
+    if suffix == "jsonl":
+        suffix = "ndjson"
+    return suffix if suffix in formats else default
+
+
+def read_coefficients(lines, parse_line, skip_header: bool = True):
+    """
+    Генератор троек коэффициентов из строк файла
+
+    Первая строка, которую не удалось разобрать, считается заголовком
+    и пропускается. Пустые строки игнорируются.
+
+    Args:
+        lines: Итерируемый объект со строками файла
+        parse_line: Функция разбора одной строки
+        skip_header: Разрешить заголовок в первой строке
+
+    Yields:
+        Кортеж (a, b, c)
+    """
+    for line_number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield parse_line(line)
+        except (ValueError, KeyError, TypeError) as e:
+            if skip_header and line_number == 1:
+                continue
+            raise ValueError(f"Строка {line_number}: не удалось разобрать коэффициенты ({e})") from None
+
+
+def iter_chunks(coefficients, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """
+    Собирает тройки коэффициентов в пакеты
+
+    Yields:
+        Кортеж из трех array('d') с коэффициентами A, B и C
+    """
+    a, b, c = array("d"), array("d"), array("d")
+    for coef_a, coef_b, coef_c in coefficients:
+        a.append(coef_a)
+        b.append(coef_b)
+        c.append(coef_c)
+        if len(a) >= chunk_size:
+            yield a, b, c
+            a, b, c = array("d"), array("d"), array("d")
+    if a:
+        yield a, b, c
+
+
+def solve_chunks(chunks):
+    """
+    Решает пакеты уравнений
+
+    Yields:
+        Кортеж (a, b, c, roots, counts) для каждого пакета
+    """
+    offset = 0
+    for a, b, c in chunks:
+        if 0.0 in a:
+            raise ValueError(
+                f"Коэффициент а=0, это не квадратное уравнение (уравнение {offset + a.index(0.0) + 1})"
+            )
+        roots, counts = EquationSolver.solve_biquadratic_batch(a, b, c)
+        yield a, b, c, roots, counts
+        offset += len(a)
+
+
+def write_csv(results, out, header: bool = True) -> int:
+    """
+    Записывает корни в CSV: количество корней и до четырех корней в строке
+
+    Args:
+        results: Результаты solve_chunks
+        out: Текстовый поток для записи
+        header: Записать строку заголовка
+
+    Returns:
+        Количество записанных уравнений
+    """
+    total = 0
+    if header:
+        out.write(CSV_HEADER)
+    for _, _, _, roots, counts in results:
+        lines = []
+        for count, row in zip(counts.tolist(), roots.tolist()):
+            cells = [str(count)] + [repr(root) for root in row[:count]] + [""] * (4 - count)
+            lines.append(",".join(cells) + "\n")
+        out.write("".join(lines))
+        total += len(lines)
+    return total
+
+
+def write_ndjson(results, out, header: bool = True) -> int:
+    """
+    Записывает корни в NDJSON: по одному объекту {"roots": [...]} в строке
+
+    Returns:
+        Количество записанных уравнений
+    """
+    total = 0
+    for _, _, _, roots, counts in results:
+        lines = [
+            '{"roots": [' + ", ".join(map(repr, row[:count])) + "]}\n"
+            for count, row in zip(counts.tolist(), roots.tolist())
+        ]
+        out.write("".join(lines))
+        total += len(lines)
+    return total
+
+
+def write_text(results, out, header: bool = True) -> int:
+    """
+    Записывает решения в том же виде, что и обычный запуск main.py
+
+    Returns:
+        Количество записанных уравнений
+    """
+    from bulk_format import write_solutions_text
+
+    np = _import_numpy()
+    total = 0
+    for a, b, c, roots, counts in results:
+        a, b, c = np.asarray(a), np.asarray(b), np.asarray(c)
+        discriminants = b * b - 4 * a * c
+        total += write_solutions_text(roots, counts, discriminants, out)
+    return total
+
+
+def write_binary(results, out, header: bool = True) -> int:
+    """
+    Записывает решения двоичными записями bulk_format.RECORD
+
+    Returns:
+        Количество записанных уравнений
+    """
+    from bulk_format import write_solutions_binary
+
+    total = 0
+    for _, _, _, roots, counts in results:
+        total += write_solutions_binary(roots, counts, out)
+    return total
+
+
+# Форматы выходных файлов: имя -> функция записи результатов
+OUTPUT_FORMATS = {
+    "csv": write_csv,
+    "ndjson": write_ndjson,
+    "txt": write_text,
+    "bin": write_binary,
+}
+
+# Форматы, которые пишутся в файл, открытый в двоичном режиме
+BINARY_OUTPUT_FORMATS = {"bin"}
+
+
+def solve_stream(input_path: str, output_path: str,
+                 input_format: str = None, output_format: str = None,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Решает все уравнения из входного файла и записывает корни в выходной
+
+    Args:
+        input_path: Путь к файлу коэффициентов
+        output_path: Путь к файлу результатов
+        input_format: Формат входного файла (по умолчанию по расширению)
+        output_format: Формат выходного файла (по умолчанию по расширению)
+        chunk_size: Количество уравнений в пакете
+
+    Returns:
+        Количество решенных уравнений
+    """
+    input_format = input_format or detect_format(input_path, INPUT_FORMATS, "csv")
+    output_format = output_format or detect_format(output_path, OUTPUT_FORMATS, "csv")
+    parse_line = INPUT_FORMATS[input_format]
+    write_results = OUTPUT_FORMATS[output_format]
+
+    if output_format in BINARY_OUTPUT_FORMATS:
+        dst = open(output_path, "wb", buffering=WRITE_BUFFER_SIZE)
+    else:
+        dst = open(output_path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE)
+
+    with open(input_path, encoding="utf-8") as src, dst:
+        coefficients = read_coefficients(src, parse_line)
+        results = solve_chunks(iter_chunks(coefficients, chunk_size))
+        return write_results(results, dst)
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    """Разбирает аргументы потокового режима"""
+    parser = argparse.ArgumentParser(
+        prog="main.py",
+        description="Потоковое решение биквадратных уравнений из файла",
+    )
+    parser.add_argument("--input", required=True, help="Файл коэффициентов (CSV или NDJSON)")
+    parser.add_argument("--output", required=True, help="Файл для записи корней")
+    parser.add_argument("--input-format", choices=sorted(INPUT_FORMATS))
+    parser.add_argument("--output-format", choices=sorted(OUTPUT_FORMATS))
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                        help="Количество уравнений в пакете")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Количество процессов (больше 1 - параллельный режим)")
+    parser.add_argument("--shard-size", type=int, default=None,
+                        help="Размер шарда входного файла в байтах")
+    return parser.parse_args(argv)
+
+
+def stream_main(argv: list) -> int:
+    """
+    Точка входа потокового режима
+
+    Returns:
+        Код завершения программы
+    """
+    args = parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        if args.workers > 1:
+            from parallel import solve_file_parallel
+            total = solve_file_parallel(args.input, args.output, args.input_format,
+                                        args.output_format, args.chunk_size,
+                                        args.workers, args.shard_size)
+        else:
+            total = solve_stream(args.input, args.output, args.input_format,
+                                 args.output_format, args.chunk_size)
+    except (OSError, ValueError, ImportError) as e:
+        print(str(e))
+        return 1
+    elapsed = time.perf_counter() - start
+
+    rate = total / elapsed if elapsed > 0 else math.inf
+    print(f"Решено уравнений: {total} за {elapsed:.3f} с ({rate:,.0f} ур/с)", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(stream_main(sys.argv[1:]))
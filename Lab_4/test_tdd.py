@@ -5,7 +5,14 @@ TDD тесты для решения биквадратных уравнений
 
 import unittest
 import math
-from main import EquationSolver
+import random
+import importlib.util
+import os
+import tempfile
+from array import array
+from main import EquationSolver, SolutionCache
+
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
 
 
 class TestEquationSolverTDD(unittest.TestCase):
@@ -99,6 +106,499 @@ class TestQuadraticSolverTDD(unittest.TestCase):
         roots = self.solver.solve_quadratic(1, 2, 5)
         self.assertEqual(len(roots), 0)
 
+    def test_quadratic_into_matches_solve_quadratic(self):
+        """Устойчивый решатель дает те же корни в том же порядке"""
+        out = array('d', [0.0] * 4)
+        cases = [(1, -5, 4), (1, 5, 4), (-2, 3, 7), (1, -4, 4), (1, 2, 5), (3, 0, -12), (1, -3, 0)]
+
+        for a, b, c in cases:
+            expected = self.solver.solve_quadratic(a, b, c)
+            count = self.solver.solve_quadratic_into(a, b, c, out, offset=2)
+            self.assertEqual(count, len(expected), msg=f"{(a, b, c)}")
+            for exp, act in zip(expected, out[2:2 + count]):
+                self.assertAlmostEqual(act, exp, places=9)
+
+    def test_quadratic_into_is_stable(self):
+        """При b^2 >> 4ac малый корень вычисляется без потери точности"""
+        out = array('d', [0.0, 0.0])
+        count = self.solver.solve_quadratic_into(1.0, 1e8, 1.0, out)
+
+        self.assertEqual(count, 2)
+        small_root = max(out)
+        self.assertAlmostEqual(small_root / -1e-8, 1.0, places=12)
+
+
+class TestSolutionCacheTDD(unittest.TestCase):
+    """TDD тесты для кэша решений"""
+
+    def setUp(self):
+        self.cache = SolutionCache(maxsize=2)
+
+    def test_cached_roots_match_solver(self):
+        """Кэш возвращает те же корни, что и solve_biquadratic, в виде кортежа"""
+        roots = self.cache.solve(1, -5, 4)
+
+        self.assertIsInstance(roots, tuple)
+        for expected, actual in zip(EquationSolver.solve_biquadratic(1, -5, 4), roots):
+            self.assertAlmostEqual(actual, expected, places=9)
+
+    def test_scaled_equation_hits_cache(self):
+        """Уравнения, отличающиеся множителем, попадают в одну запись"""
+        first = self.cache.solve(1, -5, 4)
+        second = self.cache.solve(-2, 10, -8)
+
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.info()["hits"], 1)
+        self.assertEqual(self.cache.info()["misses"], 1)
+
+    def test_cache_matches_solver_exactly(self):
+        """Корни из кэша совпадают с решателем и при D≈0, и при крайних a"""
+        cache = SolutionCache(maxsize=10000)
+        grid = [(-0.9, 3.0, -2.5), (-2.5, 1.0, -0.1), (1e-300, -1, 0), (1e300, -1e300, 0)]
+        for a in (1e-300, 1e-20, -0.9, 0.1, 0.3, 1.0, -2.5, 3.0, 7.0, 1e20, 1e300):
+            for b in (-3.0, -1.0, -0.1, 0.0, 1.0, 3.0):
+                # c у границы D = 0: b^2 = 4ac с погрешностью в несколько ulp
+                for c in (b * b / (4 * a), -2.5, 0.0, 1.0):
+                    for k in (-2, 0, 2):
+                        grid.append((a, b, c + k * math.ulp(c) if c else c))
+        # Каждое уравнение дважды и с множителями ±2: проверяются и попадания
+        for a, b, c in grid * 2 + [(-2 * a, -2 * b, -2 * c) for a, b, c in grid]:
+            with self.subTest(a=a, b=b, c=c):
+                self.assertEqual(cache.solve(a, b, c), tuple(EquationSolver.solve_biquadratic(a, b, c)))
+        self.assertGreater(cache.info()["hits"], 0)
+
+    def test_lru_eviction(self):
+        """При переполнении вытесняется давно не использованная запись"""
+        self.cache.solve(1, -5, 4)
+        self.cache.solve(1, 0, -9)
+        self.cache.solve(1, -5, 4)   # запись становится свежей
+        self.cache.solve(1, 1, 1)    # вытесняет (1, 0, -9)
+
+        self.assertEqual(len(self.cache), 2)
+        self.cache.solve(1, -5, 4)
+        self.cache.solve(1, 0, -9)
+        self.assertEqual(self.cache.info(), {"hits": 2, "misses": 4, "size": 2, "maxsize": 2})
+
+    def test_zero_coefficient_a(self):
+        """Нулевой коэффициент A не попадает в кэш"""
+        with self.assertRaises(ValueError) as context:
+            self.cache.solve(0, 1, 1)
+
+        self.assertIn("а=0", str(context.exception))
+        self.assertEqual(len(self.cache), 0)
+
+
+class TestBenchmarkTDD(unittest.TestCase):
+    """TDD тесты для набора бенчмарков"""
+
+    def test_workloads_have_expected_roots(self):
+        """Нагрузки дают уравнения нужного вида и воспроизводимы"""
+        import benchmark
+
+        for a, b, c in benchmark.make_workload("four_roots", 100):
+            self.assertEqual(len(EquationSolver.solve_biquadratic(a, b, c)), 4)
+        for a, b, c in benchmark.make_workload("no_roots", 100):
+            self.assertLess(EquationSolver.calculate_discriminant(a, b, c), 0)
+        for a, b, c in benchmark.make_workload("degenerate", 100):
+            self.assertEqual(EquationSolver.calculate_discriminant(a, b, c), 0)
+
+        self.assertEqual(benchmark.make_workload("mixed", 10), benchmark.make_workload("mixed", 10))
+
+    def test_suite_report_and_comparison(self):
+        """Отчет содержит все метрики, а сравнение находит замедление"""
+        import benchmark
+
+        report = benchmark.run_suite(n=20, repeat=1, workloads=["mixed"])
+        metrics = report["results"]["solve_biquadratic"]["mixed"]
+        self.assertEqual(set(metrics), {"ns_per_eq", "alloc_bytes_per_call", "p50_ns", "p99_ns"})
+        self.assertEqual(set(report["results"]), set(benchmark.TARGETS))
+
+        slower = {"results": {"solve_biquadratic": {"mixed": dict(metrics, ns_per_eq=metrics["ns_per_eq"] * 2)}}}
+        rows = benchmark.compare_results(report, slower)
+        self.assertEqual(len(rows), 1)
+        self.assertTrue(rows[0][-1])
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy не установлен")
+class TestBatchSolverTDD(unittest.TestCase):
+    """TDD тесты для пакетного решения биквадратных уравнений"""
+
+    def assertBatchMatchesScalar(self, a, b, c):
+        """Сравнивает пакетное решение с поштучным solve_biquadratic"""
+        roots, counts = EquationSolver.solve_biquadratic_batch(a, b, c)
+        self.assertEqual(roots.shape, (len(a), 4))
+
+        for i, coefs in enumerate(zip(a, b, c)):
+            expected = EquationSolver.solve_biquadratic(*coefs)
+            self.assertEqual(counts[i], len(expected), msg=f"{coefs}")
+            for exp, act in zip(expected, roots[i, :counts[i]]):
+                self.assertAlmostEqual(act, exp, places=9)
+            self.assertTrue(all(math.isnan(x) for x in roots[i, counts[i]:]))
+
+    def test_batch_known_equations(self):
+        """Четыре, два, один корень и отсутствие корней в одном пакете"""
+        a = [1, 1, 1, 1, 1, 2]
+        b = [-5, 0, 0, 1, -4, -2]
+        c = [4, -9, 0, 1, 4, 0]
+        self.assertBatchMatchesScalar(a, b, c)
+
+        roots, counts = EquationSolver.solve_biquadratic_batch(a, b, c)
+        self.assertEqual(counts.tolist(), [4, 2, 1, 0, 2, 3])
+        for expected, actual in zip([-2, -1, 1, 2], roots[0]):
+            self.assertAlmostEqual(actual, expected, places=6)
+
+    def test_batch_random_equations(self):
+        """Случайные уравнения совпадают с поштучным решением"""
+        rng = random.Random(17)
+        n = 500
+        a = [rng.choice([-1, 1]) * rng.uniform(0.1, 10) for _ in range(n)]
+        b = [rng.uniform(-20, 20) for _ in range(n)]
+        c = [rng.uniform(-20, 20) for _ in range(n)]
+        self.assertBatchMatchesScalar(a, b, c)
+
+    def test_batch_accepts_buffer_protocol(self):
+        """Коэффициенты можно передать как array('d')"""
+        roots, counts = EquationSolver.solve_biquadratic_batch(
+            array('d', [1, 1]), array('d', [-5, 1]), array('d', [4, 1])
+        )
+        self.assertEqual(counts.tolist(), [4, 0])
+
+    def test_batch_zero_coefficient_a(self):
+        """Нулевой коэффициент A в пакете вызывает ValueError"""
+        with self.assertRaises(ValueError) as context:
+            EquationSolver.solve_biquadratic_batch([1, 0], [1, 1], [1, 1])
+
+        self.assertIn("а=0", str(context.exception))
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy не установлен")
+class TestBulkFormatTDD(unittest.TestCase):
+    """TDD тесты для пакетного форматирования"""
+
+    def setUp(self):
+        import numpy as np
+
+        rng = random.Random(5)
+        n = 300
+        self.a = np.array([rng.uniform(0.5, 5) for _ in range(n)])
+        self.b = np.array([rng.uniform(-9, 9) for _ in range(n)])
+        self.c = np.array([rng.uniform(-9, 9) for _ in range(n)])
+        # Уравнения с корнем 0 и с D = 0
+        self.b[:3], self.c[:3] = [-4, 0, 0], [0, 0, 4]
+        self.roots, self.counts = EquationSolver.solve_biquadratic_batch(self.a, self.b, self.c)
+        self.D = self.b * self.b - 4 * self.a * self.c
+
+    def test_text_matches_format_solution(self):
+        """Текстовый вывод совпадает с format_solution посимвольно"""
+        import io
+        from bulk_format import write_solutions_text
+
+        out = io.StringIO()
+        total = write_solutions_text(self.roots, self.counts, self.D, out, chunk_size=64)
+
+        expected = "".join(
+            EquationSolver.format_solution(list(row[:count]), D) + "\n"
+            for row, count, D in zip(self.roots.tolist(), self.counts.tolist(), self.D.tolist())
+        )
+        self.assertEqual(total, len(self.counts))
+        self.assertEqual(out.getvalue(), expected)
+
+    def test_binary_round_trip(self):
+        """Двоичные записи читаются обратно в те же корни"""
+        import io
+        from bulk_format import RECORD, read_solutions_binary, write_solutions_binary
+
+        out = io.BytesIO()
+        write_solutions_binary(self.roots, self.counts, out)
+        data = out.getvalue()
+
+        self.assertEqual(len(data), RECORD.size * len(self.counts))
+        decoded = read_solutions_binary(data)
+        for row, count, roots in zip(self.roots.tolist(), self.counts.tolist(), decoded):
+            self.assertEqual(list(roots), row[:count])
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy не установлен")
+class TestStreamSolverTDD(unittest.TestCase):
+    """TDD тесты для потокового режима"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+
+    def write_input(self, name, text):
+        path = os.path.join(self.tmpdir.name, name)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return path
+
+    def test_csv_stream(self):
+        """CSV с заголовком решается пакетами и сохраняет порядок строк"""
+        from stream_solver import solve_stream
+
+        src = self.write_input("coeffs.csv", "a,b,c\n1,-5,4\n1,1,1\n\n1,0,-9\n")
+        dst = os.path.join(self.tmpdir.name, "roots.csv")
+        total = solve_stream(src, dst, chunk_size=2)
+
+        self.assertEqual(total, 3)
+        with open(dst, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], "count,x1,x2,x3,x4")
+        self.assertEqual(lines[1], "4,-2.0,-1.0,1.0,2.0")
+        self.assertEqual(lines[2], "0,,,,")
+        self.assertEqual(lines[3].split(",")[0], "2")
+
+    def test_ndjson_stream(self):
+        """NDJSON принимает объекты и списки коэффициентов"""
+        from stream_solver import solve_stream
+
+        src = self.write_input("coeffs.ndjson", '{"a": 1, "b": 0, "c": 0}\n[1, -5, 4]\n')
+        dst = os.path.join(self.tmpdir.name, "roots.ndjson")
+        self.assertEqual(solve_stream(src, dst), 2)
+
+        with open(dst, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], '{"roots": [0.0]}')
+        self.assertEqual(lines[1], '{"roots": [-2.0, -1.0, 1.0, 2.0]}')
+
+    def test_stream_zero_coefficient_a(self):
+        """Нулевой коэффициент A в файле указывает номер уравнения"""
+        from stream_solver import solve_stream
+
+        src = self.write_input("coeffs.csv", "1,-5,4\n0,1,1\n")
+        dst = os.path.join(self.tmpdir.name, "roots.csv")
+        with self.assertRaises(ValueError) as context:
+            solve_stream(src, dst)
+
+        self.assertIn("уравнение 2", str(context.exception))
+
+    def test_parallel_matches_stream(self):
+        """Параллельный режим дает тот же файл, что и последовательный"""
+        from stream_solver import solve_stream
+        from parallel import solve_file_parallel
+
+        rng = random.Random(3)
+        rows = [f"{rng.uniform(0.5, 5)},{rng.uniform(-9, 9)},{rng.uniform(-9, 9)}"
+                for _ in range(200)]
+        src = self.write_input("coeffs.csv", "a,b,c\n" + "\n".join(rows) + "\n")
+        expected = os.path.join(self.tmpdir.name, "expected.csv")
+        actual = os.path.join(self.tmpdir.name, "actual.csv")
+
+        solve_stream(src, expected)
+        total = solve_file_parallel(src, actual, workers=2, shard_size=500)
+
+        self.assertEqual(total, 200)
+        with open(expected, encoding="utf-8") as f1, open(actual, encoding="utf-8") as f2:
+            self.assertEqual(f1.read(), f2.read())
+
+    def test_parallel_empty_input_matches_stream(self):
+        """Пустой входной файл дает в параллельном режиме тот же заголовок"""
+        from stream_solver import solve_stream
+        from parallel import solve_file_parallel
+
+        for name in ("empty.csv", "header.csv"):
+            src = self.write_input(name, "" if name == "empty.csv" else "a,b,c\n")
+            for output in ("roots.csv", "roots.ndjson", "roots.bin"):
+                with self.subTest(input=name, output=output):
+                    expected = os.path.join(self.tmpdir.name, "expected-" + output)
+                    actual = os.path.join(self.tmpdir.name, "actual-" + output)
+                    self.assertEqual(solve_stream(src, expected), 0)
+                    self.assertEqual(solve_file_parallel(src, actual, workers=2), 0)
+                    with open(expected, "rb") as f1, open(actual, "rb") as f2:
+                        self.assertEqual(f1.read(), f2.read())
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy не установлен")
+class TestPolynomialEngineTDD(unittest.TestCase):
+    """TDD тесты для движка полиномиальных уравнений"""
+
+    def assertRoots(self, coeffs, expected_roots, kernel):
+        """Проверяет выбранное ядро и корни одного уравнения"""
+        import numpy as np
+        from polynomial import select_kernel, solve_polynomial_batch
+
+        self.assertEqual(select_kernel(np.array([coeffs], dtype=float)).name, kernel)
+        roots, counts = solve_polynomial_batch([coeffs])
+        self.assertEqual(counts[0], len(expected_roots))
+        for expected, actual in zip(expected_roots, roots[0]):
+            self.assertAlmostEqual(actual, expected, places=7)
+
+    def test_quadratic(self):
+        """x^2 - 5x + 4 = 0 -> 1, 4"""
+        self.assertRoots([1, -5, 4], [1, 4], "quadratic")
+
+    def test_cubic_three_roots(self):
+        """(x - 1)(x - 2)(x - 3) = 0 решается тригонометрической формулой"""
+        self.assertRoots([1, -6, 11, -6], [1, 2, 3], "cubic")
+
+    def test_cubic_one_root(self):
+        """x^3 - 1 = 0 решается формулой Кардано"""
+        self.assertRoots([1, 0, 0, -1], [1], "cubic")
+
+    def test_cubic_double_root(self):
+        """x^3 - 3x + 2 = (x - 1)^2 (x + 2)"""
+        self.assertRoots([1, 0, -3, 2], [-2, 1], "cubic")
+
+    def test_sextic_in_x_squared(self):
+        """(x^2 - 1)(x^2 - 4)(x^2 - 9) = 0 сводится к кубическому по t = x^2"""
+        self.assertRoots([1, 0, -14, 0, 49, 0, -36], [-3, -2, -1, 1, 2, 3], "even-substitution")
+
+    def test_quintic_companion_fallback(self):
+        """Многочлен пятой степени решается через сопровождающую матрицу"""
+        self.assertRoots([1, -15, 85, -225, 274, -120], [1, 2, 3, 4, 5], "companion-eigenvalues")
+
+    def test_biquadratic_matches_equation_solver(self):
+        """Биквадратные уравнения совпадают с EquationSolver"""
+        from polynomial import solve_polynomial_batch
+
+        rng = random.Random(9)
+        triples = [(rng.uniform(0.5, 5), rng.uniform(-9, 9), rng.uniform(-9, 9)) for _ in range(200)]
+        roots, counts = solve_polynomial_batch([[a, 0, b, 0, c] for a, b, c in triples])
+
+        for (a, b, c), row, count in zip(triples, roots, counts):
+            expected = EquationSolver.solve_biquadratic(a, b, c)
+            self.assertEqual(count, len(expected))
+            for exp, act in zip(expected, row):
+                self.assertAlmostEqual(act, exp, places=9)
+
+    def test_multiple_roots_once_in_every_kernel(self):
+        """Кратный корень возвращается один раз любым ядром"""
+        import numpy as np
+        from polynomial import (solve_companion, solve_cubic, solve_even_substitution,
+                                solve_quadratic)
+
+        self.assertRoots([1, -4, 4], [2], "quadratic")
+        self.assertRoots([1, -3, 3, -1], [1], "cubic")
+        self.assertRoots([1, -2, 1, 0], [0, 1], "cubic")
+        self.assertRoots(np.poly([1, 1, 2]).tolist(), [1, 2], "cubic")
+        self.assertRoots([1, 0, -2, 0, 1], [-1, 1], "even-substitution")
+        self.assertRoots(np.poly([1, 1, 2, 3, 4]).tolist(), [1, 2, 3, 4], "companion-eigenvalues")
+        self.assertRoots(np.poly([3, 3, 3, -1, -1]).tolist(), [-1, 3], "companion-eigenvalues")
+
+        # Все ядра, применимые к уравнению, дают одинаковые корни
+        cases = [
+            ([1, -4, 4], (solve_quadratic, solve_companion)),
+            ([1, 0, -3, 2], (solve_cubic, solve_companion)),
+            ([1, -3, 3, -1], (solve_cubic, solve_companion)),
+            ([1, -2, 1, 0], (solve_cubic, solve_companion)),
+            (np.poly([1, 1, 2]).tolist(), (solve_cubic, solve_companion)),
+            ([1, 0, -2, 0, 1], (solve_even_substitution, solve_companion)),
+            ([1, 0, 0, 0, 0], (solve_even_substitution, solve_companion)),
+        ]
+        for coeffs, kernels in cases:
+            with self.subTest(coeffs=coeffs), np.errstate(divide="ignore", invalid="ignore"):
+                expected, *others = [np.sort(kernel(np.array([coeffs], dtype=float))[0])
+                                     for kernel in kernels]
+                expected = expected[~np.isnan(expected)]
+                for roots in others:
+                    np.testing.assert_allclose(roots[~np.isnan(roots)], expected, atol=1e-7)
+
+    def test_cubic_double_roots_with_rounding(self):
+        """Двойной корень (x - r)^2 (x - s) дает два корня, хотя delta != 0 из-за округления"""
+        import numpy as np
+        from polynomial import solve_polynomial_batch
+
+        pairs = [(r * k, s * k) for k in (1, 0.1, 7.3, 1e3) for r in range(-5, 6) for s in range(-5, 6) if r != s]
+        roots, counts = solve_polynomial_batch([np.poly([r, r, s]) for r, s in pairs])
+        for (r, s), row, count in zip(pairs, roots, counts):
+            with self.subTest(r=r, s=s):
+                self.assertEqual(count, 2)
+                np.testing.assert_allclose(row[:2], sorted((r, s)), rtol=1e-7, atol=1e-9 * abs(r - s))
+
+    def test_zero_leading_coefficient(self):
+        """Нулевой старший коэффициент вызывает ValueError"""
+        from polynomial import solve_polynomial_batch
+
+        with self.assertRaises(ValueError):
+            solve_polynomial_batch([[0, 1, 1]])
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy не установлен")
+class TestSolverServerTDD(unittest.IsolatedAsyncioTestCase):
+    """TDD тесты для асинхронного сервиса"""
+
+    async def asyncSetUp(self):
+        from server import SolverServer
+
+        self.server = SolverServer(batch_delay=0.001)
+        tcp_server = await self.server.start("127.0.0.1", 0)
+        self.port = tcp_server.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        await self.server.close()
+
+    async def test_pipelined_requests_keep_order(self):
+        """Ответы приходят в порядке запросов, ошибки не ломают соединение"""
+        import asyncio
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(b"1 -5 4\n0 1 1\n1,0,-9\nabc\n1 1 1\n")
+        await writer.drain()
+        lines = [(await reader.readline()).decode("utf-8").strip() for _ in range(5)]
+        writer.close()
+        await writer.wait_closed()
+
+        self.assertEqual(lines[0], "OK 4 -2.0 -1.0 1.0 2.0")
+        self.assertTrue(lines[1].startswith("ERR") and "а=0" in lines[1])
+        self.assertTrue(lines[2].startswith("OK 2 "))
+        self.assertTrue(lines[3].startswith("ERR"))
+        self.assertEqual(lines[4], "OK 0")
+
+    async def test_long_line_closes_connection(self):
+        """На строку длиннее line_limit приходит ошибка, соединение закрывается"""
+        import asyncio
+        from server import DEFAULT_LINE_LIMIT
+
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(b"1 -5 4\n" + b"1" * (DEFAULT_LINE_LIMIT + 10) + b"\n1 1 1\n")
+        await writer.drain()
+        lines = [(await reader.readline()).decode("utf-8").strip() for _ in range(2)]
+        rest = await reader.read()
+        writer.close()
+        await writer.wait_closed()
+
+        self.assertEqual(lines[0], "OK 4 -2.0 -1.0 1.0 2.0")
+        self.assertTrue(lines[1].startswith("ERR") and str(DEFAULT_LINE_LIMIT) in lines[1])
+        self.assertEqual(rest, b"")
+
+    async def test_disconnect_with_pipelined_requests_releases_handler(self):
+        """Отключение клиента с запросами сверх max_in_flight не оставляет зависший обработчик"""
+        import asyncio
+        from server import SolverServer
+
+        server = SolverServer(batch_delay=0.001, max_in_flight=4)
+        tcp_server = await server.start("127.0.0.1", 0)
+        port = tcp_server.sockets[0].getsockname()[1]
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"1 -5 4\n" * 20000)
+            await asyncio.wait_for(writer.drain(), 5)
+            writer.close()
+            await writer.wait_closed()
+
+            def handlers():
+                return [task for task in asyncio.all_tasks()
+                        if task.get_coro().__qualname__ == "SolverServer._handle"]
+
+            for _ in range(200):
+                if not handlers():
+                    break
+                await asyncio.sleep(0.01)
+            self.assertEqual(handlers(), [])
+        finally:
+            await asyncio.wait_for(server.close(), 5)
+
+    async def test_load_generator_batches_requests(self):
+        """Нагрузочный клиент получает все ответы, запросы решаются пакетами"""
+        from server import run_load
+
+        stats = await run_load("127.0.0.1", self.port, connections=4, requests=50, pipeline=8)
+
+        self.assertEqual(stats["requests"], 200)
+        self.assertGreater(stats["rps"], 0)
+        self.assertLessEqual(stats["p50_ms"], stats["p99_ms"])
+        self.assertLess(self.server.batches, self.server.requests)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)